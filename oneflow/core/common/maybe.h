@@ -57,7 +57,7 @@ class Maybe<T, typename std::enable_if<!(std::is_same<T, void>::value || std::is
   Type GetDataAndSerializedErrorProto(std::string* error_str, const Type& default_for_error) const {
     static_assert(std::is_same<T, Type>::value, "error type for argument 1");
     if (IsOk()) {
-      google::protobuf::TextFormat::PrintToString(ErrorProto(), error_str);
+      error_str->clear();
       return *Data_YouAreNotAllowedToCallThisFuncOutsideThisFile();
     } else {
       google::protobuf::TextFormat::PrintToString(*error(), error_str);
@@ -93,7 +93,7 @@ class Maybe<T, typename std::enable_if<std::is_same<T, void>::value>::type> fina
 
   void GetDataAndSerializedErrorProto(std::string* error_str) const {
     if (IsOk()) {
-      google::protobuf::TextFormat::PrintToString(ErrorProto(), error_str);
+      error_str->clear();
     } else {
       google::protobuf::TextFormat::PrintToString(*error(), error_str);
     }
@@ -131,7 +131,7 @@ class Maybe<T, typename std::enable_if<std::is_scalar<T>::value>::type> final {
 
   T GetDataAndSerializedErrorProto(std::string* error_str, const T& default_for_error) const {
     if (IsOk()) {
-      google::protobuf::TextFormat::PrintToString(ErrorProto(), error_str);
+      error_str->clear();
       return Data_YouAreNotAllowedToCallThisFuncOutsideThisFile();
     } else {
       google::protobuf::TextFormat::PrintToString(*error(), error_str);
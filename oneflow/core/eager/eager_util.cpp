@@ -52,6 +52,8 @@ void StorageAdd(const EagerSymbol& symbol) {
   }
 }
 
+}  // namespace
+
 Maybe<void> RunLogicalInstruction(const vm::InstructionListProto& instruction_list_proto,
                                   const EagerSymbolList& eager_symbol_list) {
   for (const auto& eager_symbol : eager_symbol_list.eager_symbol()) { StorageAdd(eager_symbol); }
@@ -64,8 +66,6 @@ Maybe<void> RunPhysicalInstruction(const vm::InstructionListProto& instruction_l
   return vm::Run(instruction_list_proto);
 }
 
-}  // namespace
-
 Maybe<void> RunPhysicalInstruction(const std::string& instruction_list_proto_str,
                                    const std::string& eager_symbol_list_str) {
   vm::InstructionListProto instruction_list_proto;
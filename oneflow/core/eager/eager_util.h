@@ -17,12 +17,19 @@ limitations under the License.
 #define ONEFLOW_CORE_EAGER_EAGER_UTIL_H_
 
 #include "oneflow/core/common/maybe.h"
+#include "oneflow/core/eager/eager_symbol.pb.h"
+#include "oneflow/core/vm/instruction.pb.h"
 
 namespace oneflow {
 namespace eager {
 
 Maybe<void> RunPhysicalInstruction(const std::string& instruction_list_proto_str,
                                    const std::string& eager_symbol_list_str);
+
+Maybe<void> RunPhysicalInstruction(const vm::InstructionListProto& instruction_list_proto,
+                                   const EagerSymbolList& eager_symbol_list);
+Maybe<void> RunLogicalInstruction(const vm::InstructionListProto& instruction_list_proto,
+                                  const EagerSymbolList& eager_symbol_list);
 Maybe<void> RunLogicalInstruction(const std::string& instruction_list_proto_str,
                                   const std::string& eager_symbol_list_str);
 
@@ -35,11 +35,15 @@ COMMAND(
     Global<vm::SymbolStorage<OperatorConf>>::SetAllocated(new vm::SymbolStorage<OperatorConf>()));
 using OperatorConfInstr = vm::InitSymbolInstructionType<OperatorConf>;
 COMMAND(vm::RegisterInstructionType<OperatorConfInstr>("InitOperatorConfSymbol"));
+using ClearOperatorConfInstr = vm::ClearSymbolInstructionType<OperatorConf>;
+COMMAND(vm::RegisterInstructionType<ClearOperatorConfInstr>("ClearOperatorConfSymbol"));
 
 COMMAND(Global<vm::SymbolStorage<OpNodeSignatureDesc>>::SetAllocated(
     new vm::SymbolStorage<OpNodeSignatureDesc>()));
 using OpNodeSignatureInstr = vm::InitSymbolInstructionType<OpNodeSignatureDesc>;
 COMMAND(vm::RegisterInstructionType<OpNodeSignatureInstr>("InitOpNodeSignatureDescSymbol"));
+using ClearOpNodeSignatureInstr = vm::ClearSymbolInstructionType<OpNodeSignatureDesc>;
+COMMAND(vm::RegisterInstructionType<ClearOpNodeSignatureInstr>("ClearOpNodeSignatureDescSymbol"));
 
 }  // namespace eager
 }  // namespace oneflow
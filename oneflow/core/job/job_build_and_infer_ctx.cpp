@@ -798,6 +798,14 @@ Maybe<void> JobBuildAndInferCtx::CheckLbnValidAndExist(const std::string& lbn) c
 
 const Job& JobBuildAndInferCtx::job() const { return *job_; }
 
+Maybe<void> JobBuildAndInferCtx::CompleteFromCache(const Job& completed_job) {
+  CHECK_NOTNULL_OR_RETURN(Global<JobDesc>::Get());
+  CHECK_EQ_OR_RETURN(completed_job.job_conf().job_name(), job_->job_conf().job_name());
+  Global<JobDesc>::Delete();
+  *job_ = completed_job;
+  return Maybe<void>::Ok();
+}
+
 std::string LazyJobBuildAndInferCtx::GetMirroredOpName(const std::string& op_name,
                                                        int64_t parallel_id) const {
   return op_name + "_" + std::to_string(parallel_id);
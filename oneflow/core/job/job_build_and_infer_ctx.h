@@ -67,6 +67,8 @@ class JobBuildAndInferCtx {
   std::string GetJobStructureGraphJson(const std::string& job_name) const;
 
   virtual Maybe<void> Complete() = 0;
+  // takes the job completed by an earlier Complete() of the same traced job
+  Maybe<void> CompleteFromCache(const Job& completed_job);
 
  protected:
   virtual Maybe<void> CheckAllInputsWithSameParallelNum(const Operator& op,
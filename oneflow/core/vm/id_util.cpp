@@ -28,18 +28,37 @@ static const int64_t kErrorCodeLimit = 4096;
 
 static_assert(kMachineNumberLimit >= kErrorCodeLimit, "");
 
-int64_t ObjectIdCounter() {
+// reserves `size` consecutive counters and returns the first one
+int64_t ObjectIdCounter(int64_t size) {
+  CHECK_GT(size, 0);
   static int64_t counter = 0;
-  return (counter += kMachineNumberLimit);
+  int64_t first = counter + kMachineNumberLimit;
+  counter += size * kMachineNumberLimit;
+  return first;
 }
 
+int64_t ObjectIdCounter() { return ObjectIdCounter(1); }
+
 int64_t NewLogicalObjectIdFromCounter() { return ObjectIdCounter() + kMachineNumberLimit - 1; }
 
+int64_t NewLogicalObjectIdRangeFromCounter(int64_t size) {
+  return ObjectIdCounter(size) + kMachineNumberLimit - 1;
+}
+
 int64_t NewPhysicalObjectIdFromCounter(int32_t machine_id) {
   CHECK_LT(machine_id, kMachineNumberLimit - 1);
   return ObjectIdCounter() + machine_id;
 }
 
+int64_t NewPhysicalObjectIdRangeFromCounter(int32_t machine_id, int64_t size) {
+  CHECK_LT(machine_id, kMachineNumberLimit - 1);
+  return ObjectIdCounter(size) + machine_id;
+}
+
+int64_t LastIdOfRange(int64_t first, int64_t size) {
+  return first + (size - 1) * kMachineNumberLimit;
+}
+
 }  // namespace
 
 int64_t IdUtil::IsErrorId(int64_t id) { return id >= -kErrorCodeLimit && id <= kErrorCodeLimit; }
@@ -54,6 +73,16 @@ int64_t IdUtil::NewLogicalValueSymbolId() {
   return NewLogicalObjectIdFromCounter() + kObjectIdMaximumValue;
 }
 
+int64_t IdUtil::NewLogicalValueObjectIdRange(int64_t size) {
+  int64_t first = NewLogicalObjectIdRangeFromCounter(size);
+  CHECK_LT(LastIdOfRange(first, size), kObjectIdMaximumValue);
+  return first;
+}
+
+int64_t IdUtil::NewLogicalValueSymbolIdRange(int64_t size) {
+  return NewLogicalObjectIdRangeFromCounter(size) + kObjectIdMaximumValue;
+}
+
 int64_t IdUtil::IsLogicalValueId(int64_t id) {
   CHECK(IsValueId(id));
   return ((id + 1) % kObjectIdMaximumValue) == 0;
@@ -69,6 +98,18 @@ int64_t IdUtil::NewPhysicalValueSymbolId(int32_t machine_id) {
   return NewPhysicalObjectIdFromCounter(machine_id) + kObjectIdMaximumValue;
 }
 
+int64_t IdUtil::NewPhysicalValueObjectIdRange(int32_t machine_id, int64_t size) {
+  int64_t first = NewPhysicalObjectIdRangeFromCounter(machine_id, size);
+  CHECK_LT(LastIdOfRange(first, size), kObjectIdMaximumValue);
+  return first;
+}
+
+int64_t IdUtil::NewPhysicalValueSymbolIdRange(int32_t machine_id, int64_t size) {
+  return NewPhysicalObjectIdRangeFromCounter(machine_id, size) + kObjectIdMaximumValue;
+}
+
+int64_t IdUtil::IdRangeStride() { return kMachineNumberLimit; }
+
 bool IdUtil::IsObjectId(int64_t object_id) { return object_id < kObjectIdMaximumValue; }
 
 bool IdUtil::IsSymbolId(int64_t symbol_id) { return symbol_id > kObjectIdMaximumValue; }
@@ -38,11 +38,30 @@ struct IdUtil final {
     return NewPhysicalValueSymbolId(machine_id);
   }
 
+  // id ranges: the i-th id of a range of `size` ids is `first + i * IdRangeStride()`
+  static int64_t NewLogicalObjectIdRange(int64_t size) {
+    return NewLogicalValueObjectIdRange(size);
+  }
+  static int64_t NewLogicalSymbolIdRange(int64_t size) {
+    return NewLogicalValueSymbolIdRange(size);
+  }
+  static int64_t NewPhysicalObjectIdRange(int32_t machine_id, int64_t size) {
+    return NewPhysicalValueObjectIdRange(machine_id, size);
+  }
+  static int64_t NewPhysicalSymbolIdRange(int32_t machine_id, int64_t size) {
+    return NewPhysicalValueSymbolIdRange(machine_id, size);
+  }
+  static int64_t IdRangeStride();
+
   static int64_t IsLogicalValueId(int64_t id);
   static int64_t NewLogicalValueObjectId();
   static int64_t NewLogicalValueSymbolId();
   static int64_t NewPhysicalValueObjectId(int32_t machine_id);
   static int64_t NewPhysicalValueSymbolId(int32_t machine_id);
+  static int64_t NewLogicalValueObjectIdRange(int64_t size);
+  static int64_t NewLogicalValueSymbolIdRange(int64_t size);
+  static int64_t NewPhysicalValueObjectIdRange(int32_t machine_id, int64_t size);
+  static int64_t NewPhysicalValueSymbolIdRange(int32_t machine_id, int64_t size);
 
   // type object id or value object id
   static bool IsObjectId(int64_t object_id);
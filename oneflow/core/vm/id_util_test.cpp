@@ -0,0 +1,50 @@
+/*
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+#include "oneflow/core/common/util.h"
+#include "oneflow/core/vm/id_util.h"
+
+namespace oneflow {
+namespace vm {
+
+namespace test {
+
+TEST(IdUtil, logical_object_id_range) {
+  int64_t size = 16;
+  int64_t first = IdUtil::NewLogicalObjectIdRange(size);
+  int64_t next = IdUtil::NewLogicalObjectId();
+  for (int64_t i = 0; i < size; ++i) {
+    int64_t id = first + i * IdUtil::IdRangeStride();
+    ASSERT_TRUE(IdUtil::IsObjectId(id));
+    ASSERT_EQ(id % IdUtil::IdRangeStride(), IdUtil::IdRangeStride() - 1);
+    ASSERT_LT(id, next);
+  }
+}
+
+TEST(IdUtil, physical_symbol_id_range) {
+  int64_t size = 16;
+  int64_t first = IdUtil::NewPhysicalSymbolIdRange(0, size);
+  int64_t next = IdUtil::NewPhysicalSymbolId(0);
+  for (int64_t i = 0; i < size; ++i) {
+    int64_t id = first + i * IdUtil::IdRangeStride();
+    ASSERT_TRUE(IdUtil::IsSymbolId(id));
+    ASSERT_LT(id, next);
+  }
+}
+
+}  // namespace test
+
+}  // namespace vm
+}  // namespace oneflow
@@ -56,6 +56,27 @@ class InitSymbolInstructionType final : public InstructionType {
   }
 };
 
+// drops the storage entry of symbols being deleted, after they are initialized
+template<typename T>
+class ClearSymbolInstructionType final : public InstructionType {
+ public:
+  ClearSymbolInstructionType() = default;
+  ~ClearSymbolInstructionType() override = default;
+
+  using stream_type = HostStreamType;
+
+  void Infer(Instruction* instruction) const override {
+    FlatMsgView<SymbolInstrOperand> args(instruction->instr_msg().operand());
+    FOR_RANGE(int, i, 0, args->serialized_logical_object_id_size()) {
+      const auto& operand = args->serialized_logical_object_id(i);
+      Global<SymbolStorage<T>>::Get()->Clear(operand.logical_object_id());
+    }
+  }
+  void Compute(Instruction* instruction) const override {
+    // do nothing
+  }
+};
+
 }  // namespace vm
 }  // namespace oneflow
 
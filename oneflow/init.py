@@ -24,8 +24,6 @@ del session_util
 
 import oneflow.python.framework.register_python_callback
 
-import oneflow.python.__export_symbols__
-
 import atexit
 import oneflow.python.framework.c_api_util
 atexit.register(oneflow.python.framework.c_api_util.DestroyEnv)
@@ -0,0 +1,109 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import time
+
+import oneflow as flow
+import oneflow.python.framework.compiler as compiler
+import oneflow.python.framework.session_context as session_ctx
+import oneflow.typing as oft
+from pretrain import PreTrain
+
+parser = argparse.ArgumentParser(description="flags for bert job build benchmark")
+parser.add_argument("--batch_size", type=int, default=24)
+parser.add_argument("--seq_length", type=int, default=128)
+parser.add_argument("--max_predictions_per_seq", type=int, default=20)
+parser.add_argument("--num_hidden_layers", type=int, default=12)
+parser.add_argument("--num_attention_heads", type=int, default=12)
+parser.add_argument("--vocab_size", type=int, default=30522)
+parser.add_argument("--type_vocab_size", type=int, default=2)
+parser.add_argument("--max_position_embeddings", type=int, default=512)
+args = parser.parse_args()
+
+
+def _MakePretrainJob():
+    seq_length = args.seq_length
+    max_predictions = args.max_predictions_per_seq
+    batch_size = args.batch_size
+    hidden_size = 64 * args.num_attention_heads
+
+    def Placeholder(dim, dtype=flow.int32):
+        return oft.Numpy.Placeholder((batch_size, dim), dtype=dtype)
+
+    @flow.global_function(type="train")
+    def PretrainJob(
+        input_ids: Placeholder(seq_length),
+        input_mask: Placeholder(seq_length),
+        token_type_ids: Placeholder(seq_length),
+        masked_lm_positions: Placeholder(max_predictions),
+        masked_lm_ids: Placeholder(max_predictions),
+        masked_lm_weights: Placeholder(max_predictions, dtype=flow.float),
+        next_sentence_labels: Placeholder(1),
+    ):
+        total_loss, _, _ = PreTrain(
+            input_ids,
+            input_mask,
+            token_type_ids,
+            masked_lm_positions,
+            masked_lm_ids,
+            masked_lm_weights,
+            next_sentence_labels,
+            args.vocab_size,
+            seq_length=seq_length,
+            hidden_size=hidden_size,
+            num_hidden_layers=args.num_hidden_layers,
+            num_attention_heads=args.num_attention_heads,
+            intermediate_size=hidden_size * 4,
+            max_position_embeddings=args.max_position_embeddings,
+            type_vocab_size=args.type_vocab_size,
+            max_predictions_per_seq=max_predictions,
+        )
+        flow.optimizer.SGD(
+            flow.optimizer.PiecewiseConstantScheduler([], [1e-4]), momentum=0
+        ).minimize(total_loss)
+        return total_loss
+
+    return PretrainJob
+
+
+def main():
+    flow.config.gpu_device_num(1)
+    _MakePretrainJob()
+
+    compile_time = []
+    origin_compile = compiler.Compile
+
+    def TimedCompile(*argv, **kwargs):
+        start = time.time()
+        origin_compile(*argv, **kwargs)
+        compile_time.append(time.time() - start)
+
+    compiler.Compile = TimedCompile
+    start = time.time()
+    session_ctx.GetDefaultSession().TryInit()
+    total = time.time() - start
+    compiler.Compile = origin_compile
+    print(
+        "job build: {:.3f}s, session init total: {:.3f}s".format(
+            sum(compile_time), total
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import time
+
+import numpy as np
+import oneflow as flow
+import oneflow.typing as oft
+
+parser = argparse.ArgumentParser(description="flags for eager op benchmark")
+parser.add_argument("--device_tag", type=str, default="cpu", required=False)
+parser.add_argument("--shape", type=str, default="16,16", required=False)
+parser.add_argument(
+    "--op_num", type=int, default=100, required=False, help="ops per iteration"
+)
+parser.add_argument("--iter_num", type=int, default=20, required=False)
+parser.add_argument("--skip_iter_num", type=int, default=2, required=False)
+args = parser.parse_args()
+
+
+def main():
+    flow.env.init()
+    flow.enable_eager_execution(True)
+    flow.config.gpu_device_num(1)
+    shape = tuple(int(x) for x in args.shape.split(","))
+
+    func_config = flow.FunctionConfig()
+    func_config.default_data_type(flow.float)
+
+    @flow.global_function(function_config=func_config)
+    def EagerOps(x: oft.Numpy.Placeholder(shape)):
+        with flow.scope.placement(args.device_tag, "0:0"):
+            for _ in range(args.op_num):
+                x = flow.math.relu(x)
+        return x
+
+    data = np.random.rand(*shape).astype(np.float32)
+    elapsed = []
+    for i in range(args.skip_iter_num + args.iter_num):
+        start = time.time()
+        EagerOps(data).get()
+        if i >= args.skip_iter_num:
+            elapsed.append(time.time() - start)
+    total = sum(elapsed)
+    print(
+        "ops: {}, iters: {}, time: {:.3f}s, ops/sec: {:.1f}".format(
+            args.op_num, args.iter_num, total, args.op_num * args.iter_num / total
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,8 @@ limitations under the License.
 """
 from __future__ import absolute_import
 
+import oneflow.python.lib.core.async_util as async_util
+
 
 def FindOrCreateBlobCache(blob_object):
     object_id = blob_object.object_id
@@ -36,9 +38,12 @@ class BlobCache(object):
         self.blob_object_ = blob_object
         self.header_cache_ = None
         self.body_cache_ = None
+        self.body_future_ = None
         self.delegate_blob_object_ = {}
         self.numpy_mirrored_list_ = None
+        self.numpy_mirrored_list_future_ = None
         self.numpy_ = None
+        self.numpy_future_ = None
 
     @property
     def blob_object(self):
@@ -51,9 +56,19 @@ class BlobCache(object):
 
     def GetBodyCache(self, fetch):
         if self.body_cache_ is None:
-            self.body_cache_ = fetch(self.blob_object_)
+            if self.body_future_ is not None:
+                self.body_cache_ = self.body_future_.result()
+            else:
+                self.body_cache_ = fetch(self.blob_object_)
         return self.body_cache_
 
+    def GetBodyFuture(self, async_fetch):
+        if self.body_cache_ is not None:
+            return async_util.DoneFuture(self.body_cache_)
+        if self.body_future_ is None:
+            self.body_future_ = async_fetch(self.blob_object_)
+        return self.body_future_
+
     def GetCachedDelegateBlobObject(self, op_arg_parallel_attr, fetch):
         if op_arg_parallel_attr not in self.delegate_blob_object_:
             delegate_blob_object = fetch(self.blob_object, op_arg_parallel_attr)
@@ -62,14 +77,34 @@ class BlobCache(object):
 
     def GetCachedNumpyMirroredList(self, fetch):
         if self.numpy_mirrored_list_ is None:
-            self.numpy_mirrored_list_ = fetch(self.blob_object_)
+            if self.numpy_mirrored_list_future_ is not None:
+                self.numpy_mirrored_list_ = self.numpy_mirrored_list_future_.result()
+            else:
+                self.numpy_mirrored_list_ = fetch(self.blob_object_)
         return self.numpy_mirrored_list_
 
+    def GetCachedNumpyMirroredListFuture(self, async_fetch):
+        if self.numpy_mirrored_list_ is not None:
+            return async_util.DoneFuture(self.numpy_mirrored_list_)
+        if self.numpy_mirrored_list_future_ is None:
+            self.numpy_mirrored_list_future_ = async_fetch(self.blob_object_)
+        return self.numpy_mirrored_list_future_
+
     def GetCachedNumpy(self, fetch):
         if self.numpy_ is None:
-            self.numpy_ = fetch(self.blob_object_)
+            if self.numpy_future_ is not None:
+                self.numpy_ = self.numpy_future_.result()
+            else:
+                self.numpy_ = fetch(self.blob_object_)
         return self.numpy_
 
+    def GetCachedNumpyFuture(self, async_fetch):
+        if self.numpy_ is not None:
+            return async_util.DoneFuture(self.numpy_)
+        if self.numpy_future_ is None:
+            self.numpy_future_ = async_fetch(self.blob_object_)
+        return self.numpy_future_
+
     def __del__(self):
         for key in list(self.delegate_blob_object_.keys()):
             del self.delegate_blob_object_[key]
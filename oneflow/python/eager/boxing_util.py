@@ -37,9 +37,34 @@ import oneflow
 
 
 def BoxingTo(builder, produced_blob_object, consumer_op_arg_parallel_attr):
+    plan_key = _BoxingPlanKey(produced_blob_object, consumer_op_arg_parallel_attr)
+    if plan_key in boxing_plan_key2boxing_method:
+        boxing_plan_cache_stats["hit"] += 1
+        boxing_method = boxing_plan_key2boxing_method[plan_key]
+        return boxing_method(
+            builder, produced_blob_object, consumer_op_arg_parallel_attr
+        )
+    boxing_plan_cache_stats["miss"] += 1
+    boxing_method = _SelectBoxingMethod(
+        produced_blob_object, consumer_op_arg_parallel_attr
+    )
+    ret = boxing_method(builder, produced_blob_object, consumer_op_arg_parallel_attr)
+    boxing_plan_key2boxing_method[plan_key] = boxing_method
+    return ret
+
+
+def BoxingPlanCacheStats():
+    return dict(
+        hit=boxing_plan_cache_stats["hit"],
+        miss=boxing_plan_cache_stats["miss"],
+        size=len(boxing_plan_key2boxing_method),
+    )
+
+
+def _SelectBoxingMethod(produced_blob_object, consumer_op_arg_parallel_attr):
     hob_context = BoxingHobContext(produced_blob_object, consumer_op_arg_parallel_attr)
     if enable_if.get_condition_hob(NoBoxing)(hob_context):
-        return produced_blob_object
+        return NoBoxing
 
     producer_opt_mirrored_parallel = (
         produced_blob_object.op_arg_parallel_attr.opt_mirrored_parallel
@@ -66,12 +91,25 @@ def BoxingTo(builder, produced_blob_object, consumer_op_arg_parallel_attr):
         )
 
     global conditional_function_table
-    function = enable_if.unique(
-        conditional_function_table,
-        context=BoxingHobContext(produced_blob_object, consumer_op_arg_parallel_attr),
-        default=default,
+    return enable_if.unique(
+        conditional_function_table, context=hob_context, default=default,
+    )
+
+
+def _BoxingPlanKey(produced_blob_object, consumer_op_arg_parallel_attr):
+    # boxing hobs only look at parallel descs, sbp and mirrored flags
+    return (
+        _OpArgParallelAttrKey(produced_blob_object.op_arg_parallel_attr),
+        _OpArgParallelAttrKey(consumer_op_arg_parallel_attr),
+    )
+
+
+def _OpArgParallelAttrKey(op_arg_parallel_attr):
+    return (
+        op_arg_parallel_attr.parallel_desc_symbol,
+        op_arg_parallel_attr.sbp_parallel.SerializeToString(),
+        op_arg_parallel_attr.opt_mirrored_parallel.SerializeToString(),
     )
-    return function(builder, produced_blob_object, consumer_op_arg_parallel_attr)
 
 
 def boxing_condition(hob_expr, verbose=False):
@@ -89,16 +127,24 @@ def FirstMatchedBoxing(*boxing_methods):
     for boxing_method in boxing_methods[1:]:
         hob_expr = hob_expr | enable_if.get_condition_hob(boxing_method)
 
+    plan_key2boxing_method = {}
+
     @enable_if.condition(hob_expr)
     def FirstMatched(builder, produced_blob_object, consumer_op_arg_parallel_attr):
-        ctx = BoxingHobContext(produced_blob_object, consumer_op_arg_parallel_attr)
-        for boxing_method in boxing_methods:
-            hob_expr = enable_if.get_condition_hob(boxing_method)
-            if not hob_expr(ctx):
-                continue
-            return boxing_method(
-                builder, produced_blob_object, consumer_op_arg_parallel_attr
-            )
+        plan_key = _BoxingPlanKey(produced_blob_object, consumer_op_arg_parallel_attr)
+        if plan_key not in plan_key2boxing_method:
+            ctx = BoxingHobContext(produced_blob_object, consumer_op_arg_parallel_attr)
+            for boxing_method in boxing_methods:
+                hob_expr = enable_if.get_condition_hob(boxing_method)
+                if hob_expr(ctx):
+                    plan_key2boxing_method[plan_key] = boxing_method
+                    break
+            else:
+                return None
+        boxing_method = plan_key2boxing_method[plan_key]
+        return boxing_method(
+            builder, produced_blob_object, consumer_op_arg_parallel_attr
+        )
 
     boxing_methods_names = [GetBoxingDebugString(m) for m in boxing_methods]
     FirstMatched.__debug_str__ = "(%s)" % (" | ".join(boxing_methods_names))
@@ -122,11 +168,17 @@ def ComposeBoxing(
         middle_verbose_str=middle_verbose_str,
     )
 
+    plan_key2middle_op_arg_parallel_attr = {}
+
     @enable_if.condition(composed_hob)
     def Composed(builder, produced_blob_object, consumer_op_arg_parallel_attr):
-        tmp_op_arg_parallel_attr = get_middle_op_arg_parallel_attr(
-            builder, produced_blob_object, consumer_op_arg_parallel_attr
-        )
+        plan_key = _BoxingPlanKey(produced_blob_object, consumer_op_arg_parallel_attr)
+        middle_attrs = plan_key2middle_op_arg_parallel_attr
+        if plan_key not in middle_attrs:
+            middle_attrs[plan_key] = get_middle_op_arg_parallel_attr(
+                builder, produced_blob_object, consumer_op_arg_parallel_attr
+            )
+        tmp_op_arg_parallel_attr = middle_attrs[plan_key]
         tmp = lhs_boxing(builder, produced_blob_object, tmp_op_arg_parallel_attr)
         return rhs_boxing(builder, tmp, consumer_op_arg_parallel_attr)
 
@@ -878,3 +930,6 @@ conditional_function_table = [
         OptionalBoxing(CopyH2D),
     ),
 ]
+
+boxing_plan_key2boxing_method = {}
+boxing_plan_cache_stats = dict(hit=0, miss=0)
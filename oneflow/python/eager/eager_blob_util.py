@@ -66,6 +66,10 @@ class EagerPhysicalBlob(blob_trait.BlobOperatorTrait, blob_trait.BlobHeaderTrait
         assert self.is_tensor_list
         return _GetPhysicalBlobBodyCache(self.blob_object_)
 
+    def async_body(self):
+        # body of numpy() or numpy_list(), without waiting for the blob header
+        return _GetPhysicalBlobBodyFuture(self.blob_object_)
+
     def __str__(self):
         return "EagerPhysicalBlob(shape=%s, dtype=%s, is_tensor_list=%s)" % (
             self.shape,
@@ -78,6 +82,14 @@ class EagerPhysicalBlob(blob_trait.BlobOperatorTrait, blob_trait.BlobHeaderTrait
 
 
 def FetchTensorBlobAsNumpyList(parallel_size, blob_object):
+    return async_util.Await(parallel_size, _MakeAsyncFetchBlobBody(blob_object))
+
+
+def AsyncFetchTensorBlobAsNumpyList(parallel_size, blob_object):
+    return async_util.AsyncAwait(parallel_size, _MakeAsyncFetchBlobBody(blob_object))
+
+
+def _MakeAsyncFetchBlobBody(blob_object):
     def AsyncFetchBlobBody(Yield):
         fetcher = _MakeFetcherEagerBlobBodyAsNumpyFromOfBlob(Yield)
 
@@ -89,7 +101,7 @@ def FetchTensorBlobAsNumpyList(parallel_size, blob_object):
 
         vm_util.PhysicalRun(BuildFetchBlobBodyInstruction)
 
-    return async_util.Await(parallel_size, AsyncFetchBlobBody)
+    return AsyncFetchBlobBody
 
 
 def _GetPhysicalBlobHeaderCache(blob_object):
@@ -102,6 +114,11 @@ def _GetPhysicalBlobBodyCache(blob_object):
     return blob_cache.GetBodyCache(_FetchPhysicalBlobBody)
 
 
+def _GetPhysicalBlobBodyFuture(blob_object):
+    blob_cache = blob_cache_util.FindOrCreateBlobCache(blob_object)
+    return blob_cache.GetBodyFuture(_AsyncFetchPhysicalBlobBody)
+
+
 def _FetchBlobHeader(blob_object):
     def AsyncFetchBlobHeader(Yield):
         fetcher = _MakeFetcherEagerPhysicalBlobHeaderFromOfBlob(Yield)
@@ -121,26 +138,41 @@ def _FetchPhysicalBlobBody(blob_object):
     return FetchTensorBlobAsNumpyList(1, blob_object)[0]
 
 
+def _AsyncFetchPhysicalBlobBody(blob_object):
+    future = AsyncFetchTensorBlobAsNumpyList(1, blob_object)
+    return async_util.Then(future, lambda ndarray_list: ndarray_list[0])
+
+
 def _MakeFetcherEagerPhysicalBlobHeaderFromOfBlob(Yield):
     def Callback(ofblob):
-        Yield(
-            EagerPhysicalBlobHeader(
+        try:
+            header = EagerPhysicalBlobHeader(
                 ofblob.static_shape,
                 ofblob.shape_list,
                 ofblob.dtype,
                 ofblob.is_tensor_list,
             )
-        )
+        except BaseException as e:
+            # raised in the awaiting thread instead of the vm callback thread
+            Yield(exception=e)
+            return
+        Yield(header)
 
     return Callback
 
 
 def _MakeFetcherEagerBlobBodyAsNumpyFromOfBlob(Yield):
     def FetchFromOfBlob(ofblob):
-        if ofblob.is_tensor_list:
-            Yield(ofblob.CopyToFlatNdarrayList())
-        else:
-            Yield(ofblob.CopyToNdarray())
+        try:
+            if ofblob.is_tensor_list:
+                body = ofblob.CopyToFlatNdarrayList()
+            else:
+                body = ofblob.CopyToNdarray()
+        except BaseException as e:
+            # raised in the awaiting thread instead of the vm callback thread
+            Yield(exception=e)
+            return
+        Yield(body)
 
     return FetchFromOfBlob
 
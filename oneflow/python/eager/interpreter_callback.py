@@ -15,6 +15,8 @@ limitations under the License.
 """
 from __future__ import absolute_import
 
+from contextlib import contextmanager
+
 import oneflow.python.eager.gradient_util as gradient_util
 import oneflow.python.eager.op_executor as op_executor
 import oneflow.core.operator.op_attribute_pb2 as op_attribute_pb
@@ -29,9 +31,25 @@ import oneflow.python.eager.vm_util as vm_util
 def MakeScopeSymbol(job_conf_str, parallel_conf_str, is_mirrored):
     job_conf = text_format.Parse(job_conf_str, job_conf_pb.JobConfigProto())
     parallel_conf = text_format.Parse(parallel_conf_str, placement_pb.ParallelConf())
-    return compiler.MakeInitialScope(
+    symbol_id = compiler.MakeInitialScope(
         job_conf, parallel_conf.device_tag, list(parallel_conf.device_name), is_mirrored
     ).symbol_id
+    if _scope_symbol_records is not None:
+        _scope_symbol_records.append(
+            (job_conf_str, parallel_conf_str, is_mirrored, symbol_id)
+        )
+    return symbol_id
+
+
+@contextmanager
+def RecordScopeSymbols():
+    global _scope_symbol_records
+    assert _scope_symbol_records is None
+    _scope_symbol_records = []
+    try:
+        yield _scope_symbol_records
+    finally:
+        _scope_symbol_records = None
 
 
 def MakeParallelDescSymbol(parallel_conf_str):
@@ -92,3 +110,6 @@ def _MakeReleaser4MirroredCastBlobObject(op_attribute, blob_register):
             blob_register.ClearObject4BlobName(lbn)
 
     return ReleaseMirroredBlobObject
+
+
+_scope_symbol_records = None
@@ -22,6 +22,8 @@ import oneflow.python.eager.vm_util as vm_util
 import oneflow.python.eager.boxing_util as boxing_util
 import oneflow.python.eager.symbol_storage as symbol_storage
 import oneflow.python.framework.c_api_util as c_api_util
+import oneflow.python.framework.input_blob_def as input_blob_def_util
+import oneflow.python.framework.push_util as push_util
 import oneflow.python.framework.remote_blob as remote_blob_util
 import oneflow.python.framework.op_arg_util as op_arg_util
 import oneflow.python.experimental.name_scope as name_scope
@@ -203,6 +205,10 @@ def _MakeEagerLogicalBlob(op_attribute, obn, blob_register):
 
 
 def EagerInitVariableBlob(sess, var_op_conf, var_blob):
+    snapshot_value = sess.snapshot_mgr.get_snapshot_value(var_op_conf.name)
+    if snapshot_value is not None:
+        _FeedSnapshotValue(var_blob, snapshot_value)
+        return
     snapshot_path = sess.snapshot_mgr.get_snapshot_path(var_op_conf.name)
     with oneflow.scope.placement("cpu", "0:0"):
         if snapshot_path is None:
@@ -213,6 +219,15 @@ def EagerInitVariableBlob(sess, var_op_conf, var_blob):
         _Assign(var_blob.blob_object, blob_object)
 
 
+def _FeedSnapshotValue(var_blob, snapshot_value):
+    ndarray = np.asarray(snapshot_value)
+    blob_def = input_blob_def_util.FixedTensorDef(
+        ndarray.shape,
+        dtype=dtype_util.convert_numpy_dtype_to_oneflow_dtype(ndarray.dtype),
+    )
+    push_util.FeedValueToEagerBlob(var_blob.blob_object, blob_def, ndarray)
+
+
 def EagerSaveVariableBlob(snapshot_path):
     var_blobs = session_ctx.GetDefaultSession().var_name2var_blob.values()
     with oneflow.scope.placement("cpu", "0:0"):
@@ -13,6 +13,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import absolute_import
+
+import collections
+import hashlib
 
 
 def HasSymbol4Id(symbol_id):
@@ -35,6 +39,20 @@ def SetSymbol4Id(symbol_id, symbol):
 id2symbol = {}
 
 
+def RefSymbol(symbol_id):
+    symbol_id2ref_cnt[symbol_id] += 1
+
+
+def UnrefSymbol(symbol_id):
+    assert symbol_id2ref_cnt[symbol_id] > 0
+    symbol_id2ref_cnt[symbol_id] -= 1
+    if symbol_id2ref_cnt[symbol_id] == 0:
+        del symbol_id2ref_cnt[symbol_id]
+
+
+symbol_id2ref_cnt = collections.Counter()
+
+
 def HasSymbol4String(string):
     global string2symbol
     return string in string2symbol
@@ -55,41 +73,29 @@ string2symbol = {}
 
 
 def HasSymbol4SerializedOpConf(serialized_op_conf):
-    global serialized_op_conf2symbol
-    return serialized_op_conf in serialized_op_conf2symbol
+    return op_conf_symbol_store.Has(serialized_op_conf)
 
 
 def GetSymbol4SerializedOpConf(serialized_op_conf):
-    global serialized_op_conf2symbol
-    return serialized_op_conf2symbol[serialized_op_conf]
-
+    return op_conf_symbol_store.Get(serialized_op_conf)
 
-def SetSymbol4SerializedOpConf(serialized_op_conf, symbol):
-    assert not HasSymbol4SerializedOpConf(serialized_op_conf)
-    global serialized_op_conf2symbol
-    serialized_op_conf2symbol[serialized_op_conf] = symbol
 
-
-serialized_op_conf2symbol = {}
+def SetSymbol4SerializedOpConf(serialized_op_conf, symbol, release=None):
+    op_conf_symbol_store.Set(serialized_op_conf, symbol, release)
 
 
 def HasSymbol4SerializedOpNodeSignature(serialized_op_node_signature):
-    global serialized_op_node_signature2symbol
-    return serialized_op_node_signature in serialized_op_node_signature2symbol
+    return op_node_signature_symbol_store.Has(serialized_op_node_signature)
 
 
 def GetSymbol4SerializedOpNodeSignature(serialized_op_node_signature):
-    global serialized_op_node_signature2symbol
-    return serialized_op_node_signature2symbol[serialized_op_node_signature]
-
+    return op_node_signature_symbol_store.Get(serialized_op_node_signature)
 
-def SetSymbol4SerializedOpNodeSignature(serialized_op_node_signature, symbol):
-    assert not HasSymbol4SerializedOpNodeSignature(serialized_op_node_signature)
-    global serialized_op_node_signature2symbol
-    serialized_op_node_signature2symbol[serialized_op_node_signature] = symbol
 
-
-serialized_op_node_signature2symbol = {}
+def SetSymbol4SerializedOpNodeSignature(
+    serialized_op_node_signature, symbol, release=None
+):
+    op_node_signature_symbol_store.Set(serialized_op_node_signature, symbol, release)
 
 
 def HasSymbol4JobConf(job_conf):
@@ -112,38 +118,143 @@ job_conf_id2symbol = {}
 
 
 def HasSymbol4SerializedParallelConf(serialized_parallel_conf):
-    global serialized_parallel_conf2symbol
-    return serialized_parallel_conf in serialized_parallel_conf2symbol
+    global parallel_conf_digest2symbol
+    return _Digest(serialized_parallel_conf) in parallel_conf_digest2symbol
 
 
 def GetSymbol4SerializedParallelConf(serialized_parallel_conf):
-    global serialized_parallel_conf2symbol
-    return serialized_parallel_conf2symbol[serialized_parallel_conf]
+    global parallel_conf_digest2symbol
+    return parallel_conf_digest2symbol[_Digest(serialized_parallel_conf)]
 
 
 def SetSymbol4SerializedParallelConf(serialized_parallel_conf, symbol):
     assert not HasSymbol4SerializedParallelConf(serialized_parallel_conf)
-    global serialized_parallel_conf2symbol
-    serialized_parallel_conf2symbol[serialized_parallel_conf] = symbol
+    global parallel_conf_digest2symbol
+    parallel_conf_digest2symbol[_Digest(serialized_parallel_conf)] = symbol
 
 
-serialized_parallel_conf2symbol = {}
+parallel_conf_digest2symbol = {}
 
 
 def HasSymbol4SerializedScopeProto(serialized_scope_proto):
-    global serialized_scope_proto2symbol
-    return serialized_scope_proto in serialized_scope_proto2symbol
+    global scope_proto_digest2symbol
+    return _Digest(serialized_scope_proto) in scope_proto_digest2symbol
 
 
 def GetSymbol4SerializedScopeProto(serialized_scope_proto):
-    global serialized_scope_proto2symbol
-    return serialized_scope_proto2symbol[serialized_scope_proto]
+    global scope_proto_digest2symbol
+    return scope_proto_digest2symbol[_Digest(serialized_scope_proto)]
 
 
 def SetSymbol4SerializedScopeProto(serialized_scope_proto, symbol):
     assert not HasSymbol4SerializedScopeProto(serialized_scope_proto)
-    global serialized_scope_proto2symbol
-    serialized_scope_proto2symbol[serialized_scope_proto] = symbol
+    global scope_proto_digest2symbol
+    scope_proto_digest2symbol[_Digest(serialized_scope_proto)] = symbol
+
+
+scope_proto_digest2symbol = {}
+
+
+def SetEvictableSymbolCapacity(capacity):
+    assert type(capacity) is int
+    assert capacity > 0
+    op_conf_symbol_store.SetCapacity(capacity)
+    op_node_signature_symbol_store.SetCapacity(capacity)
+
+
+def AddEvictionHook(hook):
+    _eviction_hooks.append(hook)
+
+
+def RemoveEvictionHook(hook):
+    _eviction_hooks.remove(hook)
+
+
+_eviction_hooks = []
+
+
+def GetSymbolStorageStats():
+    return dict(
+        symbol_cnt=len(id2symbol),
+        referenced_symbol_cnt=len(symbol_id2ref_cnt),
+        op_conf=op_conf_symbol_store.Stats(),
+        op_node_signature=op_node_signature_symbol_store.Stats(),
+    )
+
+
+class _EvictableSymbolStore(object):
+    r"""Symbols keyed by the digest of their serialized data.
+
+    Once more than `capacity` symbols are stored, the least recently used ones
+    not referenced by RefSymbol are evicted and their `release` is called to
+    delete them from the vm. Symbols without `release` are never evicted.
+    """
+
+    def __init__(self, capacity):
+        self.capacity_ = capacity
+        self.digest2entry_ = collections.OrderedDict()
+        self.nbytes_ = 0
+        self.evicted_cnt_ = 0
+
+    def SetCapacity(self, capacity):
+        self.capacity_ = capacity
+        self._Evict()
+
+    def Has(self, serialized):
+        return _Digest(serialized) in self.digest2entry_
+
+    def Get(self, serialized):
+        digest = _Digest(serialized)
+        self.digest2entry_.move_to_end(digest)
+        return self.digest2entry_[digest].symbol
+
+    def Set(self, serialized, symbol, release):
+        digest = _Digest(serialized)
+        assert digest not in self.digest2entry_
+        self.digest2entry_[digest] = _SymbolEntry(symbol, len(serialized), release)
+        self.nbytes_ += len(serialized)
+        self._Evict()
+
+    def Stats(self):
+        return dict(
+            symbol_cnt=len(self.digest2entry_),
+            nbytes=self.nbytes_,
+            evicted_cnt=self.evicted_cnt_,
+            capacity=self.capacity_,
+        )
+
+    def _Evict(self):
+        if len(self.digest2entry_) <= self.capacity_:
+            return
+        for digest in list(self.digest2entry_.keys()):
+            entry = self.digest2entry_[digest]
+            if entry.release is None or entry.symbol.symbol_id in symbol_id2ref_cnt:
+                continue
+            del self.digest2entry_[digest]
+            del id2symbol[entry.symbol.symbol_id]
+            self.nbytes_ -= entry.nbytes
+            self.evicted_cnt_ += 1
+            entry.release(entry.symbol)
+            for hook in _eviction_hooks:
+                hook(entry.symbol.symbol_id)
+            if len(self.digest2entry_) <= self.capacity_:
+                return
+
+
+_SymbolEntry = collections.namedtuple("_SymbolEntry", ["symbol", "nbytes", "release"])
+
+
+def _Digest(serialized):
+    # Has and Get are usually called in a row with the same bytes object
+    global _last_serialized, _last_digest
+    if serialized is not _last_serialized:
+        _last_digest = hashlib.sha256(serialized).digest()
+        _last_serialized = serialized
+    return _last_digest
+
 
+_last_serialized = None
+_last_digest = None
 
-serialized_scope_proto2symbol = {}
+op_conf_symbol_store = _EvictableSymbolStore(8192)
+op_node_signature_symbol_store = _EvictableSymbolStore(8192)
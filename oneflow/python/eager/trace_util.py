@@ -0,0 +1,340 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import collections
+
+import numpy as np
+
+import oneflow.core.register.logical_blob_id_pb2 as logical_blob_id_util
+import oneflow.core.vm.instruction_pb2 as instr_util
+import oneflow.python.eager.symbol_storage as symbol_storage
+import oneflow.python.eager.vm_util as vm_util
+import oneflow.python.framework.id_util as id_util
+import oneflow.python.framework.input_blob_def as input_blob_def
+import oneflow.python.vm.id_util as vm_id_util
+
+# An eager trace records the instructions built by one call of a global
+# function. Replaying it skips interpreting the job function:
+#   - symbols created while tracing stay alive in the vm and are referred as is;
+#   - objects created while tracing are created again under new ids;
+#   - input blob objects are rebound to the ones of the current call.
+# A call is replayable only if every object it creates is either released
+# before it returns or returned, and no python callback is registered by it.
+
+_MAX_TRACE_FAILURE_CNT = 3
+
+
+class EagerTraceCache(object):
+    def __init__(self):
+        self.signature2trace_ = {}
+        self.signature2failure_cnt_ = collections.Counter()
+        self.replay_cnt_ = 0
+
+    @property
+    def replay_cnt(self):
+        return self.replay_cnt_
+
+    def Run(self, args, make_inputs, call):
+        if any(isinstance(x, input_blob_def.Shards) for x in _Flatten(args)):
+            # shards are produced when fed, there is nothing to key a trace on
+            return call(make_inputs())
+        signature = _Signature(args)
+        trace = self.signature2trace_.get(signature)
+        if trace is not None:
+            self.replay_cnt_ += 1
+            return trace.Replay(make_inputs())
+        if self.signature2failure_cnt_[signature] >= _MAX_TRACE_FAILURE_CNT:
+            return call(make_inputs())
+        trace, ret = _Trace(make_inputs, call)
+        if trace is None:
+            self.signature2failure_cnt_[signature] += 1
+        else:
+            self.signature2trace_[signature] = trace
+        return ret
+
+
+class EagerTrace(object):
+    def __init__(
+        self, runs, input_ids, object_id2is_logical, outputs, referred_symbol_ids
+    ):
+        self.runs_ = runs
+        self.input_ids_ = input_ids
+        self.object_id2is_logical_ = object_id2is_logical
+        self.outputs_ = outputs
+        rebound_ids = set(input_ids) | set(object_id2is_logical.keys())
+        self.run2patches_ = [
+            _MakePatches(instruction_list, rebound_ids) for _, instruction_list in runs
+        ]
+        # pinned by the tracer, so the symbols replayed instructions refer to
+        # are never evicted
+        self.referred_symbol_ids_ = referred_symbol_ids
+
+    def __del__(self):
+        for symbol_id in self.referred_symbol_ids_:
+            symbol_storage.UnrefSymbol(symbol_id)
+
+    def Replay(self, inputs):
+        input_blob_objects = [x.blob_object for x in _Flatten(inputs)]
+        assert len(input_blob_objects) == len(self.input_ids_), "%s v.s. %s" % (
+            len(input_blob_objects),
+            len(self.input_ids_),
+        )
+        old2new = {}
+        old2input_blob_object = {}
+        for old_id, blob_object in zip(self.input_ids_, input_blob_objects):
+            old2new[old_id] = blob_object.object_id
+            old2input_blob_object[old_id] = blob_object
+        for old_id, is_logical in self.object_id2is_logical_.items():
+            old2new[old_id] = _NewIdGenerator(is_logical).NewObjectId()
+        for (is_logical, instruction_list), patches in zip(
+            self.runs_, self.run2patches_
+        ):
+            replayed = instr_util.InstructionListProto()
+            replayed.CopyFrom(instruction_list)
+            for instr_idx, operand_idx, field, old_id in patches:
+                operand = replayed.instruction[instr_idx].operand[operand_idx]
+                if field == "int64_operand":
+                    operand.int64_operand = old2new[old_id]
+                else:
+                    getattr(operand, field).logical_object_id = old2new[old_id]
+            run = vm_util.LogicalRun if is_logical else vm_util.PhysicalRun
+            run(lambda builder: builder.ReplayInstructions(replayed))
+
+        def MakeOutputBlob(output):
+            return output.MakeBlob(
+                old2new, old2input_blob_object, self.object_id2is_logical_
+            )
+
+        return _MapStructure(MakeOutputBlob, self.outputs_)
+
+
+class _Tracer(object):
+    def __init__(self):
+        self.object_id2is_logical_ = collections.OrderedDict()
+        self.runs_ = []
+        self.callback_registered_ = False
+        self.referred_symbol_ids_ = set()
+        self.evicted_symbol_ids_ = set()
+
+    def OnNewObjectId(self, id_generator, object_id):
+        self.object_id2is_logical_[object_id] = _IsLogical(id_generator)
+
+    def OnRun(self, id_generator, instruction_list):
+        recorded = instr_util.InstructionListProto()
+        recorded.CopyFrom(instruction_list)
+        self.runs_.append((_IsLogical(id_generator), recorded))
+        # pin symbols as soon as they are referred, later runs of the call may
+        # evict them otherwise
+        for symbol_id in _ReferredSymbolIds(recorded) - self.referred_symbol_ids_:
+            symbol_storage.RefSymbol(symbol_id)
+            self.referred_symbol_ids_.add(symbol_id)
+
+    def OnSymbolEvicted(self, symbol_id):
+        self.evicted_symbol_ids_.add(symbol_id)
+
+    def OnCallbackRegistered(self):
+        self.callback_registered_ = True
+
+    def UnrefSymbols(self):
+        for symbol_id in self.referred_symbol_ids_:
+            symbol_storage.UnrefSymbol(symbol_id)
+        self.referred_symbol_ids_ = set()
+
+    def MakeTrace(self, input_ids, ret):
+        if self.callback_registered_:
+            return None
+        if len(self.referred_symbol_ids_ & self.evicted_symbol_ids_) > 0:
+            # evicted in the run referring them, before they were pinned
+            return None
+        created = self.object_id2is_logical_
+        released = set()
+        runs = []
+        for is_logical, instruction_list in self.runs_:
+            replayed = instr_util.InstructionListProto()
+            for instruction in instruction_list.instruction:
+                if _IsSymbolInstruction(instruction):
+                    continue
+                if _IsReleaseInstruction(instruction):
+                    object_id = instruction.operand[0].mut_operand.logical_object_id
+                    if object_id not in created:
+                        # released objects created before tracing
+                        continue
+                    released.add(object_id)
+                replayed.instruction.add().CopyFrom(instruction)
+            if len(replayed.instruction) == 0:
+                continue
+            if len(runs) > 0 and runs[-1][0] == is_logical:
+                runs[-1][1].MergeFrom(replayed)
+            else:
+                runs.append((is_logical, replayed))
+        rebound_ids = set(input_ids) | set(created.keys())
+        outputs = _MapStructure(lambda x: _OutputBlobDesc(x, rebound_ids), ret)
+        output_ids = set(x.object_id for x in _Flatten(outputs))
+        if len(output_ids & released) > 0:
+            return None
+        if len(set(created.keys()) - released - output_ids) > 0:
+            # e.g. variables or cached objects created by the first calls
+            return None
+        referred_symbol_ids = self.referred_symbol_ids_
+        self.referred_symbol_ids_ = set()
+        return EagerTrace(runs, input_ids, created, outputs, referred_symbol_ids)
+
+
+class _OutputBlobDesc(object):
+    def __init__(self, blob, rebound_ids):
+        self.blob_type_ = type(blob)
+        blob_object = blob.blob_object
+        self.object_id_ = blob_object.object_id
+        self.op_arg_parallel_attr_ = blob_object.op_arg_parallel_attr
+        self.op_arg_blob_attr_ = blob_object.op_arg_blob_attr
+        # only blob objects outliving every call, e.g. variables, are kept
+        self.blob_object_ = None
+        if self.object_id_ not in rebound_ids:
+            self.blob_object_ = blob_object
+
+    @property
+    def object_id(self):
+        return self.object_id_
+
+    def MakeBlob(self, old2new, old2input_blob_object, object_id2is_logical):
+        if self.object_id_ in old2input_blob_object:
+            blob_object = old2input_blob_object[self.object_id_]
+        elif self.object_id_ in object_id2is_logical:
+            blob_object = vm_util.MakeReplayedBlobObject(
+                old2new[self.object_id_],
+                self.op_arg_parallel_attr_,
+                self.op_arg_blob_attr_,
+                object_id2is_logical[self.object_id_],
+            )
+        else:
+            blob_object = self.blob_object_
+        lbi = logical_blob_id_util.LogicalBlobId()
+        lbi.op_name = id_util.UniqueStr("Return_")
+        lbi.blob_name = "out"
+        return self.blob_type_(lbi, blob_object=blob_object)
+
+
+def _Trace(make_inputs, call):
+    inputs = make_inputs()
+    input_ids = [x.blob_object.object_id for x in _Flatten(inputs)]
+    tracer = _Tracer()
+    # keep releases of earlier calls out of the trace
+    vm_util.FlushPendingObjectReleases()
+    symbol_storage.AddEvictionHook(tracer.OnSymbolEvicted)
+    try:
+        with vm_util.TraceScope(tracer):
+            ret = call(inputs)
+            del inputs
+            vm_util.FlushPendingObjectReleases()
+        return tracer.MakeTrace(input_ids, ret), ret
+    finally:
+        symbol_storage.RemoveEvictionHook(tracer.OnSymbolEvicted)
+        # symbols not handed over to a trace
+        tracer.UnrefSymbols()
+
+
+def _MakePatches(instruction_list, rebound_ids):
+    patches = []
+    for instr_idx, instruction in enumerate(instruction_list.instruction):
+        int64_operand_is_object_id = (
+            instruction.instr_type_name in _OBJECT_ID_INT64_INSTRUCTION_NAMES
+        )
+        for operand_idx, operand in enumerate(instruction.operand):
+            field = operand.WhichOneof("type")
+            if field in _OBJECT_OPERAND_FIELDS:
+                object_id = getattr(operand, field).logical_object_id
+            elif field == "int64_operand" and int64_operand_is_object_id:
+                object_id = operand.int64_operand
+            else:
+                continue
+            if object_id in rebound_ids:
+                patches.append((instr_idx, operand_idx, field, object_id))
+    return patches
+
+
+def _IsSymbolInstruction(instruction):
+    name = instruction.instr_type_name
+    if name in _SYMBOL_INSTRUCTION_NAMES:
+        return True
+    if not name.endswith("Symbol"):
+        return False
+    return name.startswith("Init") or name.startswith("Clear")
+
+
+def _ReferredSymbolIds(instruction_list):
+    symbol_ids = set()
+    for instruction in instruction_list.instruction:
+        if instruction.parallel_desc_symbol_id != 0:
+            symbol_ids.add(instruction.parallel_desc_symbol_id)
+        for operand in instruction.operand:
+            if operand.WhichOneof("type") == "symbol_operand":
+                symbol_ids.add(operand.symbol_operand.logical_object_id)
+    return symbol_ids
+
+
+def _IsReleaseInstruction(instruction):
+    return instruction.instr_type_name in _RELEASE_INSTRUCTION_NAMES
+
+
+def _IsLogical(id_generator):
+    return isinstance(id_generator, vm_id_util.LogicalIdGenerator)
+
+
+def _NewIdGenerator(is_logical):
+    if is_logical:
+        return vm_id_util.LogicalIdGenerator()
+    return vm_id_util.PhysicalIdGenerator()
+
+
+def _Signature(arg):
+    if isinstance(arg, np.ndarray):
+        return (arg.shape, arg.dtype.str)
+    if isinstance(arg, (list, tuple)):
+        return (type(arg).__name__, tuple(_Signature(x) for x in arg))
+    if isinstance(arg, dict):
+        return ("dict", tuple((k, _Signature(arg[k])) for k in sorted(arg.keys())))
+    raise NotImplementedError(type(arg))
+
+
+def _Flatten(x):
+    if x is None:
+        return []
+    if isinstance(x, (list, tuple)):
+        return [y for elem in x for y in _Flatten(elem)]
+    if isinstance(x, dict):
+        return [y for k in sorted(x.keys()) for y in _Flatten(x[k])]
+    return [x]
+
+
+def _MapStructure(f, x):
+    if x is None:
+        return None
+    if isinstance(x, (list, tuple)):
+        return type(x)(_MapStructure(f, elem) for elem in x)
+    if isinstance(x, dict):
+        return {k: _MapStructure(f, v) for k, v in x.items()}
+    return f(x)
+
+
+_SYMBOL_INSTRUCTION_NAMES = {"NewSymbol", "NewParallelDescSymbol"}
+_RELEASE_INSTRUCTION_NAMES = {"TryClearObject", "DeleteObject"}
+_OBJECT_ID_INT64_INSTRUCTION_NAMES = {
+    "NewObject",
+    "BroadcastObjectReference",
+    "ReplaceMirrored",
+}
+_OBJECT_OPERAND_FIELDS = {"const_operand", "mut_operand", "mut2_operand"}
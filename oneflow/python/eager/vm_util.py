@@ -16,6 +16,7 @@ limitations under the License.
 from __future__ import absolute_import
 
 import re
+import threading
 from contextlib import contextmanager
 
 import oneflow.core.eager.eager_symbol_pb2 as eager_symbol_util
@@ -46,6 +47,8 @@ def PhysicalRun(build):
         vm_id_util.PhysicalIdGenerator(),
         c_api_util.RunPhysicalInstruction,
         _ReleasePhysicalObject,
+        _ReleasePhysicalSymbol,
+        _physical_release_queue,
     )
 
 
@@ -55,32 +58,197 @@ def LogicalRun(build):
         vm_id_util.LogicalIdGenerator(),
         c_api_util.RunLogicalInstruction,
         _ReleaseLogicalObject,
+        _ReleaseLogicalSymbol,
+        _logical_release_queue,
     )
 
 
-def _Run(build, id_generator, run_api, release_object):
+def FlushPendingObjectReleases():
+    if len(_logical_release_queue) > 0:
+        LogicalRun(lambda builder: None)
+    if len(_physical_release_queue) > 0:
+        PhysicalRun(lambda builder: None)
+    if _bulk is not None:
+        _bulk.Flush()
+
+
+@contextmanager
+def BulkScope(flush_threshold=1024):
+    # runs inside the scope append to one instruction list, which is sent to
+    # the vm when a callback is registered, the list grows beyond
+    # flush_threshold, a run of the other kind starts or the scope exits.
+    # A nested scope shares the list and applies its own flush_threshold.
+    global _bulk
+    if _bulk is not None:
+        bulk = _bulk
+        outer_flush_threshold = bulk.flush_threshold
+        bulk.flush_threshold = flush_threshold
+        try:
+            yield
+        finally:
+            bulk.flush_threshold = outer_flush_threshold
+        return
+    _bulk = _InstructionBulk(flush_threshold)
+    try:
+        yield
+    finally:
+        bulk = _bulk
+        _bulk = None
+        bulk.Flush()
+
+
+def BulkStats():
+    # None outside of bulk scopes
+    if _bulk is None:
+        return None
+    return dict(
+        flush_threshold=_bulk.flush_threshold,
+        flush_cnt=_bulk.flush_cnt,
+        pending_instruction_cnt=len(_bulk.instruction_list.instruction),
+    )
+
+
+def PendingObjectReleaseCount():
+    return len(_logical_release_queue) + len(_physical_release_queue)
+
+
+def MakeReplayedBlobObject(
+    object_id, op_arg_parallel_attr, op_arg_blob_attr, is_logical
+):
+    return object_util.BlobObject(
+        object_id=object_id,
+        op_arg_parallel_attr=op_arg_parallel_attr,
+        op_arg_blob_attr=op_arg_blob_attr,
+        release=_ReleaseLogicalObject if is_logical else _ReleasePhysicalObject,
+    )
+
+
+@contextmanager
+def TraceScope(tracer):
+    # tracer gets NewObjectId(id_generator), OnRun(id_generator, instruction_list)
+    # and OnCallbackRegistered() for every run inside the scope
+    global _tracer
+    assert _tracer is None
+    _tracer = tracer
+    try:
+        yield
+    finally:
+        _tracer = None
+
+
+def _Run(build, id_generator, run_api, release_object, release_symbol, release_queue):
     instruction_list = session_ctx.GetDefaultSession().instruction_list
     eager_symbol_list = session_ctx.GetDefaultSession().eager_symbol_list
-    build(
-        InstructionsBuilder(
-            id_generator, release_object, instruction_list, eager_symbol_list
-        )
+    tracer = _tracer
+    if tracer is not None:
+        id_generator = _TracingIdGenerator(id_generator, tracer)
+    bulk = _bulk
+    if bulk is not None:
+        if tracer is not None or bulk.run_api is not run_api:
+            # traces record instructions per run
+            bulk.Flush()
+        if tracer is not None:
+            bulk = None
+        else:
+            bulk.run_api = run_api
+            instruction_list = bulk.instruction_list
+    builder = InstructionsBuilder(
+        id_generator,
+        release_object,
+        instruction_list,
+        eager_symbol_list,
+        release_symbol=release_symbol,
     )
+    global _run_depth
+    _run_depth += 1
+    try:
+        build(builder)
+    finally:
+        _run_depth -= 1
+    if _run_depth == 0:
+        for released in release_queue.PopAll():
+            released.Release(builder)
+    if tracer is not None:
+        tracer.OnRun(id_generator.id_generator, instruction_list)
+    if bulk is not None:
+        bulk.Append(eager_symbol_list)
+        return
     run_api(instruction_list, eager_symbol_list)
     instruction_list.ClearField("instruction")
     eager_symbol_list.ClearField("eager_symbol")
 
 
+class _InstructionBulk(object):
+    def __init__(self, flush_threshold):
+        self.flush_threshold = flush_threshold
+        self.flush_cnt_ = 0
+        self.instruction_list_ = instr_util.InstructionListProto()
+        self.run_api = None
+        self.callback_registered = False
+
+    @property
+    def instruction_list(self):
+        return self.instruction_list_
+
+    @property
+    def flush_cnt(self):
+        return self.flush_cnt_
+
+    def Append(self, eager_symbol_list):
+        if len(eager_symbol_list.eager_symbol) > 0:
+            # symbols are stored once sent, and operator inference may look them
+            # up before the instructions referring them are flushed
+            self.run_api(_empty_instruction_list, eager_symbol_list)
+            eager_symbol_list.ClearField("eager_symbol")
+        if (
+            self.callback_registered
+            or len(self.instruction_list_.instruction) >= self.flush_threshold
+        ):
+            self.Flush()
+
+    def Flush(self):
+        self.callback_registered = False
+        if len(self.instruction_list_.instruction) == 0:
+            return
+        self.run_api(self.instruction_list_, _empty_eager_symbol_list)
+        self.instruction_list_.ClearField("instruction")
+        self.flush_cnt_ += 1
+
+
+class _TracingIdGenerator(vm_id_util.IdGenerator):
+    def __init__(self, id_generator, tracer):
+        self.id_generator_ = id_generator
+        self.tracer_ = tracer
+
+    @property
+    def id_generator(self):
+        return self.id_generator_
+
+    def NewSymbolId(self):
+        return self.id_generator_.NewSymbolId()
+
+    def NewObjectId(self):
+        object_id = self.id_generator_.NewObjectId()
+        self.tracer_.OnNewObjectId(self.id_generator_, object_id)
+        return object_id
+
+
 def _DefaultBlobObject4Ibn(ibn):
     raise NotImplementedError
 
 
 class InstructionsBuilder(object):
     def __init__(
-        self, id_generator, release_object, instruction_list, eager_symbol_list
+        self,
+        id_generator,
+        release_object,
+        instruction_list,
+        eager_symbol_list,
+        release_symbol=None,
     ):
         self.id_generator_ = id_generator
         self.release_object_ = release_object
+        self.release_symbol_ = release_symbol
         assert isinstance(instruction_list, instr_util.InstructionListProto)
         assert isinstance(eager_symbol_list, eager_symbol_util.EagerSymbolList)
         self.instruction_list_ = instruction_list
@@ -202,8 +370,21 @@ class InstructionsBuilder(object):
         self._TryClearObject(obj)
         self._DeleteObject(obj)
 
+    def DeleteSymbol(self, symbol_id, clear_instr_type_name):
+        instruction = instr_util.InstructionProto()
+        instruction.instr_type_name = clear_instr_type_name
+        instruction.operand.append(_InitSymbolOperand(symbol_id))
+        self.instruction_list_.instruction.append(instruction)
+        instruction = instr_util.InstructionProto()
+        instruction.instr_type_name = "DeleteObject"
+        instruction.operand.append(_DelObjectOperand(symbol_id))
+        self.instruction_list_.instruction.append(instruction)
+
+    def ReplayInstructions(self, instruction_list):
+        self.instruction_list_.instruction.extend(instruction_list.instruction)
+
     def InsertRemoveForeignCallbackInstruction(self, object_id, callback):
-        unique_callback_id = python_callback.GetIdForRegisteredCallback(callback)
+        unique_callback_id = _GetIdForRegisteredCallback(callback)
         instruction = instr_util.InstructionProto()
         instruction.instr_type_name = "RemoveForeignCallback"
         instruction.operand.append(_DelObjectOperand(object_id))
@@ -452,7 +633,7 @@ class InstructionsBuilder(object):
         assert op_conf.HasField("scope_symbol_id"), op_conf
         scope_symbol = symbol_storage.GetSymbol4Id(op_conf.scope_symbol_id)
         job_desc_sym = scope_symbol.job_desc_symbol
-        op_conf_sym = self._GetOpConfSymbol(op_conf)
+        op_conf_sym = self._GetOpConfSymbol(_NormalizeUserOpConf(op_conf))
         op_node_signature_sym = self._GetOpNodeSignatureSymbol(op_attribute)
         opkernel_obj = self.GetSharedOpKernelObject4ParallelConfSymbol(
             op_parallel_desc_sym
@@ -543,13 +724,17 @@ class InstructionsBuilder(object):
         self.instruction_list_.instruction.append(instruction)
 
     def _GetOpConfSymbol(self, op_conf):
-        serialized_op_conf = op_conf.SerializeToString()
+        serialized_op_conf = op_conf.SerializeToString(deterministic=True)
         if symbol_storage.HasSymbol4SerializedOpConf(serialized_op_conf):
             return symbol_storage.GetSymbol4SerializedOpConf(serialized_op_conf)
         symbol_id = self._NewSymbolId4OpConf(op_conf)
         symbol = symbol_util.Symbol(symbol_id, op_conf)
         symbol_storage.SetSymbol4Id(symbol_id, symbol)
-        symbol_storage.SetSymbol4SerializedOpConf(serialized_op_conf, symbol)
+        symbol_storage.SetSymbol4SerializedOpConf(
+            serialized_op_conf,
+            symbol,
+            release=self._MakeSymbolReleaser("ClearOperatorConfSymbol"),
+        )
         return symbol
 
     def _GetOpNodeSignatureSymbol(self, op_attribute):
@@ -578,10 +763,18 @@ class InstructionsBuilder(object):
         symbol = symbol_util.Symbol(symbol_id, new_op_node_signature)
         symbol_storage.SetSymbol4Id(symbol_id, symbol)
         symbol_storage.SetSymbol4SerializedOpNodeSignature(
-            serialized_op_node_signature, symbol
+            serialized_op_node_signature,
+            symbol,
+            release=self._MakeSymbolReleaser("ClearOpNodeSignatureDescSymbol"),
         )
         return symbol
 
+    def _MakeSymbolReleaser(self, clear_instr_type_name):
+        if self.release_symbol_ is None:
+            return None
+        release_symbol = self.release_symbol_
+        return lambda symbol: release_symbol(symbol, clear_instr_type_name)
+
     def _GetConstOperandBlobObjects(self, op_attribute, blob_object4ibn=None):
         assert callable(blob_object4ibn)
         const_operand_blob_objects = []
@@ -897,7 +1090,7 @@ class InstructionsBuilder(object):
         self.eager_symbol_list_.eager_symbol.append(eager_symbol)
 
     def _FetchBlob(self, instruction_name, blob_object, fetcher):
-        unique_callback_id = python_callback.GetIdForRegisteredCallback(fetcher)
+        unique_callback_id = _GetIdForRegisteredCallback(fetcher)
         instruction = instr_util.InstructionProto()
         device_tag = blob_object.parallel_desc_symbol.device_tag
         instruction.instr_type_name = "%s.%s" % (device_tag, instruction_name)
@@ -907,7 +1100,7 @@ class InstructionsBuilder(object):
         self.instruction_list_.instruction.append(instruction)
 
     def FeedBlob(self, blob_object, feeder):
-        unique_callback_id = python_callback.GetIdForRegisteredCallback(feeder)
+        unique_callback_id = _GetIdForRegisteredCallback(feeder)
         instruction = instr_util.InstructionProto()
         device_tag = blob_object.parallel_desc_symbol.device_tag
         instruction.instr_type_name = "%s.%s" % (device_tag, "FeedBlob")
@@ -941,6 +1134,15 @@ class InstructionsBuilder(object):
         self.instruction_list_.instruction.append(instruction)
 
 
+def _GetIdForRegisteredCallback(callback):
+    if _tracer is not None:
+        _tracer.OnCallbackRegistered()
+    if _bulk is not None:
+        # the callback may be waited for right after the run
+        _bulk.callback_registered = True
+    return python_callback.GetIdForRegisteredCallback(callback)
+
+
 def _SymbolOperand(val):
     operand = instr_util.InstructionOperandProto()
     _SetSoleMirroredOperand(operand.symbol_operand, val)
@@ -1015,6 +1217,28 @@ def _FindOrCreateDelegateBlobObject(builder, x_blob_object, op_arg_parallel_attr
     return blob_cache.GetCachedDelegateBlobObject(op_arg_parallel_attr, Fetch)
 
 
+def _NormalizeUserOpConf(op_conf):
+    # Eager op names are unique per call, so op confs of structurally identical
+    # user ops differ only in names and lbns. Stateless kernels identify blobs
+    # by bn in op, hence renaming keeps them working and lets such ops share
+    # one op conf symbol. Only the output lbns have to stay in `name/obn` form.
+    if not op_conf.HasField("user_conf"):
+        return op_conf
+    normalized = op_conf_util.OperatorConf()
+    normalized.CopyFrom(op_conf)
+    normalized.name = _NORMALIZED_OP_NAME
+    user_conf = normalized.user_conf
+    for arg_name in user_conf.input:
+        lbns = user_conf.input[arg_name].s
+        for i in range(len(lbns)):
+            lbns[i] = "%s_input/%s_%d" % (_NORMALIZED_OP_NAME, arg_name, i)
+    for arg_name in user_conf.output:
+        lbns = user_conf.output[arg_name].s
+        for i in range(len(lbns)):
+            lbns[i] = "%s/%s_%d" % (_NORMALIZED_OP_NAME, arg_name, i)
+    return normalized
+
+
 def _GetOpConfBlobNameAttr(pb_message, field):
     if hasattr(pb_message, field):
         return getattr(pb_message, field)
@@ -1029,9 +1253,75 @@ def _GetOpConfBlobNameAttr(pb_message, field):
     return repeated_field[index]
 
 
+class _ReleasedObject(object):
+    # what DeleteObject needs, without keeping the released object alive
+    def __init__(self, obj):
+        self.object_id = obj.object_id
+        self.parallel_desc_symbol = obj.parallel_desc_symbol
+
+    def Release(self, builder):
+        builder.DeleteObject(self)
+
+
+class _ReleasedSymbol(object):
+    def __init__(self, symbol, clear_instr_type_name):
+        self.symbol_id_ = symbol.symbol_id
+        self.clear_instr_type_name_ = clear_instr_type_name
+
+    def Release(self, builder):
+        builder.DeleteSymbol(self.symbol_id_, self.clear_instr_type_name_)
+
+
+class _ObjectReleaseQueue(object):
+    def __init__(self, flush_threshold=256):
+        self.flush_threshold = flush_threshold
+        self.lock_ = threading.Lock()
+        self.released_objects_ = []
+
+    def __len__(self):
+        return len(self.released_objects_)
+
+    def Push(self, released):
+        with self.lock_:
+            self.released_objects_.append(released)
+            return len(self.released_objects_) >= self.flush_threshold
+
+    def PopAll(self):
+        with self.lock_:
+            released_objects = self.released_objects_
+            self.released_objects_ = []
+        return released_objects
+
+
 def _ReleaseLogicalObject(obj):
-    LogicalRun(lambda builder: builder.DeleteObject(obj))
+    # released objects ride along with the next LogicalRun
+    if _logical_release_queue.Push(_ReleasedObject(obj)) and _run_depth == 0:
+        LogicalRun(lambda builder: None)
 
 
 def _ReleasePhysicalObject(obj):
-    PhysicalRun(lambda builder: builder.DeleteObject(obj))
+    # released objects ride along with the next PhysicalRun
+    if _physical_release_queue.Push(_ReleasedObject(obj)) and _run_depth == 0:
+        PhysicalRun(lambda builder: None)
+
+
+def _ReleaseLogicalSymbol(symbol, clear_instr_type_name):
+    released = _ReleasedSymbol(symbol, clear_instr_type_name)
+    if _logical_release_queue.Push(released) and _run_depth == 0:
+        LogicalRun(lambda builder: None)
+
+
+def _ReleasePhysicalSymbol(symbol, clear_instr_type_name):
+    released = _ReleasedSymbol(symbol, clear_instr_type_name)
+    if _physical_release_queue.Push(released) and _run_depth == 0:
+        PhysicalRun(lambda builder: None)
+
+
+_logical_release_queue = _ObjectReleaseQueue()
+_physical_release_queue = _ObjectReleaseQueue()
+_run_depth = 0
+_tracer = None
+_bulk = None
+_empty_instruction_list = instr_util.InstructionListProto()
+_empty_eager_symbol_list = eager_symbol_util.EagerSymbolList()
+_NORMALIZED_OP_NAME = "eager_user_op"
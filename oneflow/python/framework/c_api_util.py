@@ -15,10 +15,12 @@ limitations under the License.
 """
 from __future__ import absolute_import
 
+import numpy as np
 from google.protobuf import text_format
 
 import oneflow.core.common.data_type_pb2 as dtype_util
 import oneflow.core.common.error_pb2 as error_util
+import oneflow.core.framework.user_op_def_pb2 as user_op_def_pb
 import oneflow.core.job.env_pb2 as env_pb2
 import oneflow.core.job.job_set_pb2 as job_set_pb
 import oneflow.core.job.placement_pb2 as placement_pb
@@ -35,47 +37,35 @@ from oneflow.python.framework.job_build_and_infer_error import JobBuildAndInferE
 
 def RegisterWatcherOnlyOnce(watcher):
     error_str = oneflow_internal.RegisterWatcherOnlyOnce(watcher)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def RegisterForeignCallbackOnlyOnce(callback):
     error_str = oneflow_internal.RegisterForeignCallbackOnlyOnce(callback)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def IsOpTypeCaseCpuSupportOnly(op_type_case):
     ret, error_str = oneflow_internal.IsOpTypeCaseCpuSupportOnly(op_type_case)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
 def IsOpTypeNameCpuSupportOnly(op_type_name):
     ret, error_str = oneflow_internal.IsOpTypeNameCpuSupportOnly(op_type_name)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
 def CurrentResource():
     resource, error_str = oneflow_internal.CurrentResource()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(resource, resource_util.Resource())
 
 
 def EnvResource():
     resource, error_str = oneflow_internal.EnvResource()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(resource, resource_util.Resource())
 
 
@@ -95,16 +85,12 @@ def InitEnv(env_proto):
     assert type(env_proto) is env_pb2.EnvProto
     env_proto_str = text_format.MessageToString(env_proto)
     error_str = oneflow_internal.InitEnv(env_proto_str)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def DestroyEnv():
     error_str = oneflow_internal.DestroyEnv()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def IsSessionInited():
@@ -115,60 +101,44 @@ def InitGlobalSession(config_proto):
     assert type(config_proto) is job_set_pb.ConfigProto
     config_proto_str = text_format.MessageToString(config_proto)
     error_str = oneflow_internal.InitGlobalSession(config_proto_str)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def DestroyGlobalSession():
     error_str = oneflow_internal.DestroyGlobalSession()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def StartGlobalSession():
     error_str = oneflow_internal.StartGlobalSession()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def StopGlobalSession():
     error_str = oneflow_internal.StopGlobalSession()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def GetInterUserJobInfo():
     inter_user_job_info, error_str = oneflow_internal.GetSerializedInterUserJobInfo()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(inter_user_job_info, InterUserJobInfo())
 
 
 def LaunchJob(job_instance):
     error_str = oneflow_internal.LaunchJob(job_instance)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def JobBuildAndInferCtx_Open(job_name):
     job_name = str(job_name)
     error_str = oneflow_internal.JobBuildAndInferCtx_Open(job_name)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def JobBuildAndInferCtx_GetCurrentJobName():
     job_name, error_str = oneflow_internal.JobBuildAndInferCtx_GetCurrentJobName()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return job_name
 
 
@@ -179,9 +149,7 @@ def JobBuildAndInferCtx_Close():
 def CurJobBuildAndInferCtx_SetJobConf(job_config_proto):
     serialized_job_conf = str(text_format.MessageToString(job_config_proto))
     error_str = oneflow_internal.CurJobBuildAndInferCtx_SetJobConf(serialized_job_conf)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def CurJobBuildAndInferCtx_SetTrainConf(train_config_proto):
@@ -189,16 +157,25 @@ def CurJobBuildAndInferCtx_SetTrainConf(train_config_proto):
     error_str = oneflow_internal.CurJobBuildAndInferCtx_SetTrainConf(
         serialized_train_conf
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def CurJobBuildAndInferCtx_Complete():
     error_str = oneflow_internal.CurJobBuildAndInferCtx_Complete()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
+
+
+def CurJobBuildAndInferCtx_CompleteFromCache(serialized_job):
+    error_str = oneflow_internal.CurJobBuildAndInferCtx_CompleteFromCache(
+        serialized_job
+    )
+    _RaiseIfError(error_str)
+
+
+def CurJobBuildAndInferCtx_GetSerializedJob():
+    job, error_str = oneflow_internal.CurJobBuildAndInferCtx_GetSerializedJob()
+    _RaiseIfError(error_str)
+    return job
 
 
 def InferOpConf(op_conf_proto, upstream_signature):
@@ -207,9 +184,7 @@ def InferOpConf(op_conf_proto, upstream_signature):
     op_attribute_str, error_str = oneflow_internal.InferOpConf(
         serialized_op_conf, serialized_upstream_sig,
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(op_attribute_str, op_attribute_pb.OpAttribute())
 
 
@@ -224,28 +199,28 @@ def IsInterfaceOpConf(op_conf):
 def GetOpParallelSymbolId(op_conf_proto):
     serialized_op_conf = str(text_format.MessageToString(op_conf_proto))
     symbol_id, error_str = oneflow_internal.GetOpParallelSymbolId(serialized_op_conf)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return symbol_id
 
 
 def GetUserOpAttrType(op_type_name, attr_name):
     attr_type, error_str = oneflow_internal.GetUserOpAttrType(op_type_name, attr_name)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return attr_type
 
 
+def GetUserOpDef(op_type_name):
+    op_def, error_str = oneflow_internal.GetSerializedUserOpDef(op_type_name)
+    _RaiseIfError(error_str)
+    return text_format.Parse(op_def, user_op_def_pb.UserOpDef())
+
+
 def CheckAndCompleteUserOpConf(op_conf_proto):
     serialized_op_conf = str(text_format.MessageToString(op_conf_proto))
     new_op_conf, error_str = oneflow_internal.CheckAndCompleteUserOpConf(
         serialized_op_conf
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(new_op_conf, op_conf_util.OperatorConf())
 
 
@@ -253,9 +228,7 @@ def CurJobBuildAndInferCtx_AddAndInferConsistentOp(op_conf_proto):
     serialized_op_conf = str(text_format.MessageToString(op_conf_proto))
     add_and_infer = oneflow_internal.CurJobBuildAndInferCtx_AddAndInferConsistentOp
     op_attribute_str, error_str = add_and_infer(serialized_op_conf)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(op_attribute_str, op_attribute_pb.OpAttribute())
 
 
@@ -263,18 +236,14 @@ def CurJobBuildAndInferCtx_AddAndInferMirroredOp(op_conf_proto):
     serialized_op_conf = str(text_format.MessageToString(op_conf_proto))
     add_and_infer = oneflow_internal.CurJobBuildAndInferCtx_AddAndInferMirroredOp
     op_attribute_str, error_str = add_and_infer(serialized_op_conf)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(op_attribute_str, op_attribute_pb.OpAttribute())
 
 
 def CurJobBuildAndInferCtx_AddLossLogicalBlobName(lbn):
     lbn = str(lbn)
     error_str = oneflow_internal.CurJobBuildAndInferCtx_AddLossLogicalBlobName(lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def CurJobBuildAndInferCtx_AddLbiAndDiffWatcherUuidPair(lbi_and_uuid):
@@ -282,23 +251,17 @@ def CurJobBuildAndInferCtx_AddLbiAndDiffWatcherUuidPair(lbi_and_uuid):
     error_str = oneflow_internal.CurJobBuildAndInferCtx_AddLbiAndDiffWatcherUuidPair(
         serialized
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def CurJobBuildAndInferCtx_CheckJob():
     error_str = oneflow_internal.CurJobBuildAndInferCtx_CheckJob()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
 
 
 def CurJobBuildAndInferCtx_HasJobConf():
     has_job_conf, error_str = oneflow_internal.CurJobBuildAndInferCtx_HasJobConf()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return has_job_conf
 
 
@@ -306,9 +269,7 @@ def JobBuildAndInferCtx_IsMirroredBlob(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_IsMirroredBlob(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -318,9 +279,7 @@ def JobBuildAndInferCtx_MirroredBlobGetNumSubLbi(job_name, lbn):
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetNumSubLbi(
         job_name, lbn
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -333,9 +292,7 @@ def JobBuildAndInferCtx_MirroredBlobGetSubLbi(job_name, lbn, index):
     ) = oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetSerializedSubLbi(
         job_name, lbn, index
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(ret, logical_blob_id_util.LogicalBlobId())
 
 
@@ -346,9 +303,7 @@ def JobBuildAndInferCtx_MirroredBlobGetStaticShape(job_name, lbn):
         oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetSerializedIdListAsStaticShape
     )
     axis_str, error_str = get_shape(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     int_list = text_format.Parse(axis_str, record_util.Int64List())
     return tuple(map(int, int_list.value))
 
@@ -356,12 +311,10 @@ def JobBuildAndInferCtx_MirroredBlobGetStaticShape(job_name, lbn):
 def JobBuildAndInferCtx_MirroredBlobGetDataType(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
-    dtype, erro_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetDataType(
+    dtype, error_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetDataType(
         job_name, lbn
     )
-    error = text_format.Parse(erro_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return int(dtype)
 
 
@@ -371,9 +324,7 @@ def JobBuildAndInferCtx_MirroredBlobIsDynamic(job_name, lbn):
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobIsDynamic(
         job_name, lbn
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -383,9 +334,7 @@ def JobBuildAndInferCtx_MirroredBlobDisableBoxing(job_name, lbn):
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobDisableBoxing(
         job_name, lbn
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -395,9 +344,7 @@ def JobBuildAndInferCtx_MirroredBlobIsTensorList(job_name, lbn):
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_MirroredBlobIsTensorList(
         job_name, lbn
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -409,9 +356,7 @@ def JobBuildAndInferCtx_MirroredBlobGetBatchAxis(job_name, lbn):
         error_str,
     ) = oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetBatchAxis(job_name, lbn)
     batch_axis = text_format.Parse(batch_axis_str, dtype_util.OptInt64())
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     if batch_axis.HasField("value"):
         return batch_axis.value
     return None
@@ -427,9 +372,7 @@ def JobBuildAndInferCtx_MirroredBlobGetSplitAxisFromProducerView(job_name, lbn):
         job_name, lbn
     )
     split_axis = text_format.Parse(split_axis_str, dtype_util.OptInt64())
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     if split_axis.HasField("value"):
         return split_axis.value
     return None
@@ -442,9 +385,7 @@ def JobBuildAndInferCtx_MirroredBlobGetParallelConfFromProducerView(job_name, lb
         oneflow_internal.JobBuildAndInferCtx_MirroredBlobGetSerializedParallelConfFromProducerView
     )
     parallel_conf_str, error_str = GetParallelConf(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(parallel_conf_str, placement_pb.ParallelConf())
 
 
@@ -457,9 +398,7 @@ def JobBuildAndInferCtx_GetStaticShape(job_name, lbn):
     ) = oneflow_internal.JobBuildAndInferCtx_GetSerializedIdListAsStaticShape(
         job_name, lbn
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     int_list = text_format.Parse(axis_str, record_util.Int64List())
     return tuple(map(int, int_list.value))
 
@@ -467,10 +406,8 @@ def JobBuildAndInferCtx_GetStaticShape(job_name, lbn):
 def JobBuildAndInferCtx_GetDataType(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
-    dtype, erro_str = oneflow_internal.JobBuildAndInferCtx_GetDataType(job_name, lbn)
-    error = text_format.Parse(erro_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    dtype, error_str = oneflow_internal.JobBuildAndInferCtx_GetDataType(job_name, lbn)
+    _RaiseIfError(error_str)
     return int(dtype)
 
 
@@ -478,9 +415,7 @@ def JobBuildAndInferCtx_IsDynamic(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_IsDynamic(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -488,9 +423,7 @@ def JobBuildAndInferCtx_DisableBoxing(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_DisableBoxing(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -498,9 +431,7 @@ def JobBuildAndInferCtx_IsTensorList(job_name, lbn):
     job_name = str(job_name)
     lbn = str(lbn)
     ret, error_str = oneflow_internal.JobBuildAndInferCtx_IsTensorList(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return ret
 
 
@@ -511,9 +442,7 @@ def JobBuildAndInferCtx_GetBatchAxis(job_name, lbn):
         job_name, lbn
     )
     batch_axis = text_format.Parse(batch_axis_str, dtype_util.OptInt64())
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     if batch_axis.HasField("value"):
         return batch_axis.value
     return None
@@ -527,9 +456,7 @@ def JobBuildAndInferCtx_GetSplitAxisFromProducerView(job_name, lbn):
         error_str,
     ) = oneflow_internal.JobBuildAndInferCtx_GetSplitAxisFromProducerView(job_name, lbn)
     split_axis = text_format.Parse(split_axis_str, dtype_util.OptInt64())
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     if split_axis.HasField("value"):
         return split_axis.value
     return None
@@ -542,9 +469,7 @@ def JobBuildAndInferCtx_GetParallelConfFromProducerView(job_name, lbn):
         oneflow_internal.JobBuildAndInferCtx_GetSerializedParallelConfFromProducerView
     )
     parallel_conf, error_str = GetParallelConf(job_name, lbn)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(parallel_conf, placement_pb.ParallelConf())
 
 
@@ -556,89 +481,109 @@ def GetMachine2DeviceIdListOFRecordFromParallelConf(parallel_conf):
     ) = oneflow_internal.GetMachine2DeviceIdListOFRecordFromParallelConf(
         serialized_parallel_conf
     )
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(ofrecord, record_util.OFRecord())
 
 
 def GetFunctionConfigDef():
     func_config_def, error_str = oneflow_internal.GetFunctionConfigDef()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(func_config_def, ConfigDef())
 
 
 def RunLogicalInstruction(vm_instruction_list, eager_symbol_list):
-    instructions = str(text_format.MessageToString(vm_instruction_list))
-    symbols = str(text_format.MessageToString(eager_symbol_list))
-    error_str = oneflow_internal.RunLogicalInstruction(instructions, symbols)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    instructions = _SerializeToBuffer(vm_instruction_list)
+    symbols = _SerializeToBuffer(eager_symbol_list)
+    error_str = oneflow_internal.RunLogicalInstructionFromBuffer(instructions, symbols)
+    _RaiseIfError(error_str)
 
 
 def RunPhysicalInstruction(vm_instruction_list, eager_symbol_list):
-    instructions = str(text_format.MessageToString(vm_instruction_list))
-    symbols = str(text_format.MessageToString(eager_symbol_list))
-    error_str = oneflow_internal.RunPhysicalInstruction(instructions, symbols)
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    instructions = _SerializeToBuffer(vm_instruction_list)
+    symbols = _SerializeToBuffer(eager_symbol_list)
+    error_str = oneflow_internal.RunPhysicalInstructionFromBuffer(instructions, symbols)
+    _RaiseIfError(error_str)
+
+
+def _SerializeToBuffer(proto):
+    # wraps the wire-format bytes without copying; the C++ side parses them in place
+    return np.frombuffer(proto.SerializeToString(), dtype=np.uint8)
 
 
 def CurrentMachineId():
     machine_id, error_str = oneflow_internal.CurrentMachineId()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return machine_id
 
 
 def NewLogicalObjectId():
     object_id, error_str = oneflow_internal.NewLogicalObjectId()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return object_id
 
 
 def NewLogicalSymbolId():
     object_id, error_str = oneflow_internal.NewLogicalSymbolId()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return object_id
 
 
 def NewPhysicalObjectId():
     object_id, error_str = oneflow_internal.NewPhysicalObjectId()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return object_id
 
 
 def NewPhysicalSymbolId():
     object_id, error_str = oneflow_internal.NewPhysicalSymbolId()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return object_id
 
 
+def NewLogicalObjectIdRange(size):
+    first_id, error_str = oneflow_internal.NewLogicalObjectIdRange(size)
+    _RaiseIfError(error_str)
+    return first_id
+
+
+def NewLogicalSymbolIdRange(size):
+    first_id, error_str = oneflow_internal.NewLogicalSymbolIdRange(size)
+    _RaiseIfError(error_str)
+    return first_id
+
+
+def NewPhysicalObjectIdRange(size):
+    first_id, error_str = oneflow_internal.NewPhysicalObjectIdRange(size)
+    _RaiseIfError(error_str)
+    return first_id
+
+
+def NewPhysicalSymbolIdRange(size):
+    first_id, error_str = oneflow_internal.NewPhysicalSymbolIdRange(size)
+    _RaiseIfError(error_str)
+    return first_id
+
+
+def IdRangeStride():
+    return oneflow_internal.IdRangeStride()
+
+
 def GetJobSet():
     job_set, error_str = oneflow_internal.GetSerializedJobSet()
-    error = text_format.Parse(error_str, error_util.ErrorProto())
-    if error.HasField("error_type"):
-        raise JobBuildAndInferError(error)
+    _RaiseIfError(error_str)
     return text_format.Parse(job_set, job_set_pb.JobSet())
 
 
 def GetStructureGraph():
     structure_graph, error_str = oneflow_internal.GetSerializedStructureGraph()
+    _RaiseIfError(error_str)
+    return structure_graph
+
+
+def _RaiseIfError(error_str):
+    # an empty error string means ok, the ErrorProto is only built on failure
+    if len(error_str) == 0:
+        return
     error = text_format.Parse(error_str, error_util.ErrorProto())
     if error.HasField("error_type"):
         raise JobBuildAndInferError(error)
-    return structure_graph
@@ -18,8 +18,10 @@ import os
 
 import numpy as np
 import oneflow.python.framework.hob as hob
+import oneflow.python.experimental.interface_op_read_and_write as interface_op_util
 import oneflow.python.framework.job_instance as job_instance
 import oneflow.python.framework.session_context as session_ctx
+import oneflow.python.framework.sharded_snapshot as sharded_snapshot
 import oneflow.python.lib.core.enable_if as enable_if
 import oneflow.python.eager.op_executor as op_executor
 
@@ -37,14 +39,22 @@ class CheckPoint(object):
         pass
 
     @session_ctx.try_init_default_session
-    def save(self, path: str) -> None:
+    def save(self, path: str, sharded: bool = False, num_shards: int = 8) -> None:
         r"""save a checkpoint to `path`.
 
         Args:
             path: A `string` of path to save checkpoint. 
+            sharded: Save variables into `num_shards` shard files plus an index instead of one directory per variable.
+            num_shards: Max number of shard files written in parallel.
         """
         assert type(path) is str
-        enable_if.unique([lazy_checkpoint_save, eager_checkpoint_save])(path)
+        if sharded:
+            api = enable_if.unique(
+                [lazy_sharded_checkpoint_save, eager_sharded_checkpoint_save]
+            )
+            api(path, num_shards)
+        else:
+            enable_if.unique([lazy_checkpoint_save, eager_checkpoint_save])(path)
 
     @session_ctx.try_init_default_session
     def init(self) -> None:
@@ -56,11 +66,20 @@ class CheckPoint(object):
     def load(self, path: str) -> None:
         r"""load a checkpoint from `path` and initialize models.
 
+        Sharded checkpoints are detected by their index file and mapped into memory,
+        so variables are read on demand.
+
         Args:
             path: A `string` of path to load checkpoint.
         """
         assert type(path) is str
-        enable_if.unique([lazy_checkpoint_load, eager_checkpoint_load])(path)
+        if sharded_snapshot.IsShardedSnapshot(path):
+            api = enable_if.unique(
+                [lazy_sharded_checkpoint_load, eager_checkpoint_load]
+            )
+        else:
+            api = enable_if.unique([lazy_checkpoint_load, eager_checkpoint_load])
+        api(path)
 
 
 @enable_if.condition(hob.in_normal_mode & ~hob.eager_execution_enabled)
@@ -78,11 +97,39 @@ def lazy_checkpoint_load(path):
     session_ctx.GetDefaultSession().LaunchJob(_MakeModelLoadJobFunc(path))
 
 
+@enable_if.condition(hob.in_normal_mode & ~hob.eager_execution_enabled)
+def lazy_sharded_checkpoint_save(path, num_shards):
+    sess = session_ctx.GetDefaultSession()
+    name2ndarray = {
+        name: interface_op_util.GetInterfaceBlobValue(name)
+        for name in sess.VariableOpNames4Interface()
+    }
+    sharded_snapshot.SaveShardedSnapshot(path, name2ndarray, num_shards=num_shards)
+
+
+@enable_if.condition(hob.in_normal_mode & ~hob.eager_execution_enabled)
+def lazy_sharded_checkpoint_load(path):
+    # variables missing from the snapshot keep their initial values
+    lazy_checkpoint_init()
+    sess = session_ctx.GetDefaultSession()
+    reader = sharded_snapshot.ShardedSnapshotReader(path)
+    for name in sess.VariableOpNames4Interface():
+        if name in reader:
+            interface_op_util.FeedValueToInterfaceBlob(name, reader.get(name))
+
+
 @enable_if.condition(hob.in_normal_mode & hob.eager_execution_enabled)
 def eager_checkpoint_save(path):
     op_executor.EagerSaveVariableBlob(path)
 
 
+@enable_if.condition(hob.in_normal_mode & hob.eager_execution_enabled)
+def eager_sharded_checkpoint_save(path, num_shards):
+    var_name2var_blob = session_ctx.GetDefaultSession().var_name2var_blob
+    name2ndarray = {name: blob.numpy() for name, blob in var_name2var_blob.items()}
+    sharded_snapshot.SaveShardedSnapshot(path, name2ndarray, num_shards=num_shards)
+
+
 @enable_if.condition(hob.in_normal_mode & hob.eager_execution_enabled)
 def eager_checkpoint_init():
     # eager variables are initialized in oneflow.get_variable()
@@ -146,15 +193,19 @@ class SimpleCheckPointManager(object):
     Args:
         root_path: root path of snapshot
         prefix: prefix of snapshot
+        sharded: save snapshots in the sharded format
     """
 
-    def __init__(self, root_path: str, prefix: str = "snapshot_") -> None:
+    def __init__(
+        self, root_path: str, prefix: str = "snapshot_", sharded: bool = False
+    ) -> None:
         if not os.path.exists(root_path):
             os.makedirs(root_path)
         else:
             assert os.path.isdir(root_path)
         self._root_path = root_path
         self._prefix = prefix
+        self._sharded = sharded
         self._checkpoint = CheckPoint()
 
     def list_checkpoints(self) -> List[str]:
@@ -182,7 +233,9 @@ class SimpleCheckPointManager(object):
             self.save()
 
     def save(self) -> None:
-        self._checkpoint.save(self._GetSnapshotPath(self._NextSnapshotName()))
+        self._checkpoint.save(
+            self._GetSnapshotPath(self._NextSnapshotName()), sharded=self._sharded
+        )
 
     def _NextSnapshotName(self) -> str:
         return self._prefix + datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
@@ -194,12 +247,20 @@ class SimpleCheckPointManager(object):
 class SnapshotManager(object):
     def __init__(self):
         self.name2path_ = dict()
+        self.sharded_snapshot_reader_ = None
 
     def load(self, root_dir, refresh=True):
         assert os.path.isdir(root_dir)
 
         if refresh:
             self.name2path_ = dict()
+            self.sharded_snapshot_reader_ = None
+
+        if sharded_snapshot.IsShardedSnapshot(root_dir):
+            reader = sharded_snapshot.ShardedSnapshotReader(root_dir)
+            assert all(name not in self.name2path_ for name in reader.names())
+            self.sharded_snapshot_reader_ = reader
+            return
 
         for file in os.listdir(root_dir):
             file_path = os.path.join(root_dir, file)
@@ -223,3 +284,9 @@ class SnapshotManager(object):
             return self.name2path_[name]
         except KeyError:
             return None
+
+    def get_snapshot_value(self, name):
+        reader = self.sharded_snapshot_reader_
+        if reader is None or name not in reader:
+            return None
+        return reader.get(name)
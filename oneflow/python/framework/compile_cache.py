@@ -0,0 +1,142 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from google.protobuf import text_format
+
+import oneflow.oneflow_internal as oneflow_internal
+import oneflow.python.eager.interpreter_callback as interpreter_callback
+import oneflow.python.framework.c_api_util as c_api_util
+from oneflow.python.version import __version__
+
+# A compile cache directory holds one `<fingerprint>.json` per completed job:
+#
+#   {"version": 1, "job": completed job, "scope_symbols": [...]}
+#
+# The fingerprint of a traced job hashes the OneFlow version, the build of the
+# oneflow_internal extension, the session config, the traced job (its job conf
+# and op confs) and the fingerprints of the jobs traced before it. On a hit the
+# job passes run by Complete() are skipped. The scope symbols they made are
+# made again in the same order, and the entry is used only if they get the same
+# symbol ids.
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 1
+
+
+class CompileCache(object):
+    def __init__(self, cache_dir, config_proto):
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        assert os.path.isdir(cache_dir)
+        self.cache_dir_ = cache_dir
+        self.fingerprint_ = _Hash(
+            str(_VERSION),
+            __version__,
+            _BuildFingerprint(),
+            text_format.MessageToString(config_proto),
+        )
+        self.hit_cnt_ = 0
+        self.miss_cnt_ = 0
+
+    @property
+    def hit_cnt(self):
+        return self.hit_cnt_
+
+    @property
+    def miss_cnt(self):
+        return self.miss_cnt_
+
+    def Complete(self, job_name):
+        r"""Complete the current job, with the cached one if possible."""
+        self.fingerprint_ = _Hash(
+            self.fingerprint_, c_api_util.CurJobBuildAndInferCtx_GetSerializedJob()
+        )
+        path = os.path.join(self.cache_dir_, self.fingerprint_ + ".json")
+        entry = _TryLoadEntry(path)
+        if entry is not None and _RemakeScopeSymbols(entry["scope_symbols"]):
+            c_api_util.CurJobBuildAndInferCtx_CompleteFromCache(entry["job"])
+            self.hit_cnt_ += 1
+            logger.info("compile cache hit: job %s, %s", job_name, path)
+            return
+        self.miss_cnt_ += 1
+        logger.info("compile cache miss: job %s, %s", job_name, path)
+        with interpreter_callback.RecordScopeSymbols() as scope_symbols:
+            c_api_util.CurJobBuildAndInferCtx_Complete()
+        entry = dict(
+            version=_VERSION,
+            job=c_api_util.CurJobBuildAndInferCtx_GetSerializedJob(),
+            scope_symbols=scope_symbols,
+        )
+        _SaveEntry(path, entry)
+
+
+def _BuildFingerprint():
+    # job passes are compiled into the extension, and dev builds share a version
+    path = os.path.realpath(oneflow_internal.__file__)
+    stat = os.stat(path)
+    return "%s:%s:%s" % (path, stat.st_size, stat.st_mtime_ns)
+
+
+def _Hash(*strs):
+    sha = hashlib.sha256()
+    for s in strs:
+        sha.update(s.encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def _TryLoadEntry(path):
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except ValueError:
+        logger.warning("compile cache: ignore corrupted %s", path)
+        return None
+    if entry.get("version") != _VERSION:
+        return None
+    return entry
+
+
+def _SaveEntry(path, entry):
+    # concurrent processes may save the same entry; the last rename wins
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _RemakeScopeSymbols(scope_symbols):
+    for job_conf_str, parallel_conf_str, is_mirrored, symbol_id in scope_symbols:
+        remade_symbol_id = interpreter_callback.MakeScopeSymbol(
+            job_conf_str, parallel_conf_str, is_mirrored
+        )
+        if remade_symbol_id != symbol_id:
+            return False
+    return True
@@ -24,6 +24,7 @@ import oneflow.python.framework.distribute_context as distribute_ctx
 import oneflow.python.framework.placement_context as placement_context
 import oneflow.python.framework.session_context as session_ctx
 import oneflow.python.framework.hob as hob
+import oneflow.python.framework.lazy_blob_desc_cache as lazy_blob_desc_cache
 import oneflow.python.lib.core.enable_if as enable_if
 import oneflow.python.experimental.name_scope as name_scope
 import oneflow
@@ -65,6 +66,7 @@ def CurJobAddConsistentOp(op_conf, scope_symbol=None):
         device_tag = scope_symbol.device_parallel_desc_symbol.device_tag
         op_conf.device_tag = device_tag
     op_attr = c_api_util.CurJobBuildAndInferCtx_AddAndInferConsistentOp(op_conf)
+    lazy_blob_desc_cache.UpdateByOpAttribute(op_attr)
     if c_api_util.IsInterfaceOpConf(op_conf):
         sess = session_ctx.GetDefaultSession()
         sess.AddInfo4InterfaceOpName(op_conf.name, op_attr)
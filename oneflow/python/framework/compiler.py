@@ -23,6 +23,7 @@ import oneflow.python.framework.parallel_conf_util as parallel_conf_util
 import oneflow.python.framework.distribute as distribute_util
 import oneflow.python.framework.input_blob_def as input_blob_util
 import oneflow.python.framework.hob as hob
+import oneflow.python.framework.lazy_blob_desc_cache as lazy_blob_desc_cache
 import oneflow.python.lib.core.enable_if as enable_if
 import oneflow.python.framework.placement_util as placement_util
 import oneflow.python.framework.remote_blob as remote_blob_util
@@ -42,12 +43,15 @@ import inspect
 def Compile(session, function_desc, config_proto):
     with InterpretScope(session, function_desc, config_proto):
         _CompileJob(function_desc)
-        c_api_util.CurJobBuildAndInferCtx_Complete()
+        if session.compile_cache is None:
+            c_api_util.CurJobBuildAndInferCtx_Complete()
+        else:
+            session.compile_cache.Complete(function_desc.job_func.__name__)
 
 
 def EagerRun(session, function_desc, config_proto, args):
     with InterpretScope(session, function_desc, config_proto):
-        ret = _InterpretGlobalFunction(function_desc, args)
+        ret = _InterpretGlobalFunction(session, function_desc, args)
         c_api_util.CurJobBuildAndInferCtx_Complete()
     return ret
 
@@ -109,7 +113,7 @@ def _CompileJob(function_desc):
     )
 
 
-def _InterpretGlobalFunction(function_desc, args):
+def _InterpretGlobalFunction(session, function_desc, args):
     func = function_desc.job_func
     parameters = func.__oneflow_function_signature__.parameters
     if len(parameters) == 0:
@@ -124,21 +128,36 @@ def _InterpretGlobalFunction(function_desc, args):
         raise NotImplementedError(
             "All parameters of global function should be annotated"
         )
-    inputs = push_util.MakeEagerInputBlobs(func.__oneflow_input_blob_defs__, args)
-    ret = func(*inputs)
-    return_annotation = func.__oneflow_function_signature__.return_annotation
-    oft_util.CheckReturnByAnnotation(func.__name__, ret, return_annotation)
-    return _RecursiveMakeRetRemoteBlobs(
-        ret, allow_cpu_return_op=function_desc.function_attribute.allow_cpu_return_op
-    )
+
+    def MakeInputs():
+        return push_util.MakeEagerInputBlobs(func.__oneflow_input_blob_defs__, args)
+
+    def Call(inputs):
+        ret = func(*inputs)
+        return_annotation = func.__oneflow_function_signature__.return_annotation
+        oft_util.CheckReturnByAnnotation(func.__name__, ret, return_annotation)
+        return _RecursiveMakeRetRemoteBlobs(
+            ret,
+            allow_cpu_return_op=function_desc.function_attribute.allow_cpu_return_op,
+        )
+
+    if function_desc.function_attribute.eager_trace:
+        trace_cache = session.EagerTraceCache4JobName(func.__name__)
+        return trace_cache.Run(args, MakeInputs, Call)
+    if function_desc.function_attribute.eager_bulk:
+        with vm_util.BulkScope():
+            return Call(MakeInputs())
+    return Call(MakeInputs())
 
 
 @contextmanager
 def _JobBuildAndInferCtx(job_name):
     c_api_util.JobBuildAndInferCtx_Open(job_name)
+    lazy_blob_desc_cache.OpenJob(job_name)
     try:
         yield
     finally:
+        lazy_blob_desc_cache.CloseJob()
         c_api_util.JobBuildAndInferCtx_Close()
 
 
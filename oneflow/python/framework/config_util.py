@@ -15,7 +15,9 @@ limitations under the License.
 """
 from __future__ import absolute_import, print_function
 
+import oneflow.python.eager.symbol_storage as symbol_storage
 import oneflow.python.framework.hob as hob
+import oneflow.python.framework.host_buffer_pool as host_buffer_pool
 import oneflow.python.framework.session_context as session_ctx
 import oneflow.python.lib.core.enable_if as enable_if
 from oneflow.python.oneflow_export import oneflow_export
@@ -287,6 +289,63 @@ def enable_debug_mode(val):
     sess = session_ctx.GetDefaultSession()
     assert type(val) is bool
     sess.config_proto.resource.enable_debug_mode = val
+    enable_if.set_debug_mode(val)
+
+
+@oneflow_export("config.host_buffer_pool_size_mb")
+def api_host_buffer_pool_size_mb(val: int) -> None:
+    r"""Set the capacity of the pool of host ndarrays reused by push and pull jobs.
+
+    Args:
+        val (int): capacity in MB. 0 disables pooling
+    """
+    return enable_if.unique([host_buffer_pool_size_mb, do_nothing])(val)
+
+
+@enable_if.condition(hob.in_normal_mode & ~hob.session_initialized)
+def host_buffer_pool_size_mb(val):
+    assert type(val) is int
+    pool = host_buffer_pool.GetDefaultHostBufferPool()
+    pool.SetCapacity(val * 1024 * 1024)
+
+
+@oneflow_export("config.eager_symbol_capacity")
+def api_eager_symbol_capacity(val: int) -> None:
+    r"""Set how many op conf symbols, and op node signature symbols, eager execution keeps.
+
+    The least recently used unreferenced symbols beyond the capacity are deleted.
+
+    Args:
+        val (int): capacity of each kind of symbols
+    """
+    return enable_if.unique([eager_symbol_capacity, do_nothing])(val)
+
+
+@enable_if.condition(hob.in_normal_mode)
+def eager_symbol_capacity(val):
+    assert type(val) is int
+    symbol_storage.SetEvictableSymbolCapacity(val)
+
+
+@oneflow_export("config.compile_cache_dir")
+def api_compile_cache_dir(val: str) -> None:
+    r"""Cache completed jobs in a directory to skip job passes of later sessions.
+
+    A job is found in the cache if the OneFlow version, the session config and
+    the ops of every global function traced so far are unchanged. Hits and
+    misses are logged by the `logging` module.
+
+    Args:
+        val (str): path to the cache directory
+    """
+    return enable_if.unique([compile_cache_dir, do_nothing])(val)
+
+
+@enable_if.condition(hob.in_normal_mode & ~hob.session_initialized)
+def compile_cache_dir(val):
+    assert type(val) is str
+    sess = session_ctx.GetDefaultSession()
+    sess.compile_cache_dir = val
 
 
 @oneflow_export("config.save_downloaded_file_to_local_fs")
@@ -29,6 +29,11 @@ class FunctionAttribute(object):
         self.default_placement_scope = None
         self.default_distribute_strategy = None
         self.allow_cpu_return_op = True
+        self.borrow_input_buffers = False
+        self.eager_trace = False
+        self.eager_bulk = False
+        self.max_inflight = None
+        self.fetch_every_n = None
 
 
 class FunctionDesc(object):
@@ -20,7 +20,7 @@ import functools
 import re
 import inspect
 import traceback
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import oneflow.python.framework.session_context as session_ctx
 import oneflow.python.framework.hob as hob
@@ -87,6 +87,24 @@ def api_oneflow_function(
 ) -> Callable[[Callable], Callable]:
     r"""Creates a callable OneFlow global function from a Python function.
 
+    In lazy mode, the returned callable accepts an optional keyword argument `out`,
+    a structure of ndarrays matching the returned blobs, which the results are
+    pulled into instead of newly allocated host buffers. It also accepts an
+    optional keyword argument `fetch`, an index or key, or indices or keys, of
+    the returned list, tuple or dict to fetch, or a bool for all of them. Blobs
+    not fetched are never copied to host and are returned as None. The returned
+    future has the push lease of the call as `push_lease`, see
+    `FunctionConfig.borrow_input_buffers`.
+
+    The lazy callable also has a method `run_n(n, inputs, reduce="last")`, which
+    launches n calls back to back, taking the arguments of each call from the
+    iterable `inputs` (a tuple of arguments or a single argument per call, taken
+    right before the call is launched), and aggregates their results: "stack"
+    and "mean" stack or average ndarrays of the calls along a new first axis;
+    "last" returns the result of the last call, the only one fetched. It returns
+    after the inputs of all calls are pushed, and raises the first error of
+    producing them.
+
     For instance::
 
         @oneflow.global_function(flow.FunctionConfig())
@@ -157,6 +175,10 @@ def lazy_oneflow_function(function_config=FunctionConfig()):
         def Func(*args, **kwargs):
             return _RunLazyJob(sess, job_func, *args, **kwargs)
 
+        def RunN(n, inputs, reduce="last"):
+            return _RunLazyJobN(sess, job_func, n, inputs, reduce)
+
+        Func.run_n = RunN
         sess.AddJob(_CloneFunctionDesc(function_config.function_desc, job_func))
         for x in dir(job_func):
             if x.startswith("__oneflow_"):
@@ -218,6 +240,40 @@ def _RunLazyJob(session, job_func, *args, **kwargs):
     return session.TryInit().LazyRun(job_func, *args, **kwargs)
 
 
+def _RunLazyJobN(session, job_func, n, inputs, reduce):
+    return session.TryInit().LazyRunN(job_func, n, inputs, reduce=reduce)
+
+
+@oneflow_export("inflight_stats")
+def api_inflight_stats(job_func: Callable) -> Optional[Dict[str, Any]]:
+    r"""Get the statistics of unfinished calls of a lazy global function.
+
+    For instance::
+
+        func_config = flow.FunctionConfig()
+        func_config.max_inflight(2)
+
+        @flow.global_function(function_config=func_config)
+        def train(images: tp.Numpy.Placeholder((32, 1, 28, 28))):
+            # your model
+
+        for images in loader:
+            train(images)
+        print(flow.inflight_stats(train))
+
+    Args:
+        job_func (Callable): a lazy global function
+
+    Returns:
+        Optional[Dict[str, Any]]: `inflight_cnt`, `peak_inflight_cnt`, `launched_cnt`, `finished_cnt`, `blocked_cnt` and `wait_seconds` of the calls, or None if `max_inflight` is not set
+    """
+    sess = session_ctx.GetDefaultSession()
+    inflight_window = sess.InflightWindow4JobName(job_func.__name__)
+    if inflight_window is None:
+        return None
+    return inflight_window.Stats()
+
+
 @oneflow_function_config("default_data_type")
 def set_default_data_type(func_desc, value):
     r"""Set default data type for job
@@ -824,6 +880,99 @@ def allow_cpu_return_op(func_desc, value):
     func_desc.function_attribute.allow_cpu_return_op = value
 
 
+@oneflow_function_config("borrow_input_buffers")
+def borrow_input_buffers(func_desc, value):
+    r"""Whether push the input ndarrays of a lazy job without copying them first or not.
+
+    The caller must keep the ndarrays unchanged until the push lease of the call
+    is done. A call returns its push lease as `push_lease` of the returned future,
+    or as the result if the function has no outputs. Results of annotated
+    functions are returned or passed to callbacks after the push lease is done.
+
+    For instance::
+
+        func_config = flow.FunctionConfig()
+        func_config.borrow_input_buffers(True)
+
+        @flow.global_function(function_config=func_config)
+        def predict(images: tp.Numpy.Placeholder((256, 3, 224, 224))):
+            # your model
+
+        future = predict(images)
+        future.push_lease.wait()
+        # images can be mutated from now on
+
+    Args:
+        func_desc ([type]): [description]
+        value ([type]): [description]
+    """
+    func_desc.function_attribute.borrow_input_buffers = value
+
+
+@oneflow_function_config("eager_trace")
+def eager_trace(func_desc, value):
+    r"""Whether replay the recorded instructions of an eager global function or not.
+
+    The instructions of a call are recorded per input shapes and dtypes, and
+    later calls with the same input shapes and dtypes replay them without
+    interpreting the job function again. So the job function must build the
+    same ops on every call and must not depend on python side effects.
+
+    Args:
+        func_desc ([type]): [description]
+        value ([type]): [description]
+    """
+    func_desc.function_attribute.eager_trace = value
+
+
+@oneflow_function_config("eager_bulk")
+def eager_bulk(func_desc, value):
+    r"""Whether send the instructions of an eager global function to the vm in bulk or not.
+
+    Instructions of ops are buffered and sent together when a blob is fetched,
+    the buffer is large enough or the function returns. It has no effect if
+    eager_trace is enabled.
+
+    Args:
+        func_desc ([type]): [description]
+        value ([type]): [description]
+    """
+    func_desc.function_attribute.eager_bulk = value
+
+
+@oneflow_function_config("max_inflight")
+def max_inflight(func_desc, value):
+    r"""Set how many calls of a lazy global function may run at the same time.
+
+    A call blocks until fewer than `value` earlier calls are unfinished, so
+    that preparing inputs of the next calls overlaps running the earlier ones
+    without launching unboundedly many of them. Results are returned in call
+    order. See `oneflow.inflight_stats` for the queue depth.
+
+    Args:
+        func_desc ([type]): [description]
+        value ([type]): [description]
+    """
+    assert type(value) is int and value > 0
+    func_desc.function_attribute.max_inflight = value
+
+
+@oneflow_function_config("fetch_every_n")
+def fetch_every_n(func_desc, value):
+    r"""Fetch the returned blobs of a lazy global function every `value` calls.
+
+    The results of the 0th, `value`th, 2 * `value`th ... calls are fetched, and
+    the other calls return None for every blob without copying them to host.
+    The `fetch` argument of a call overrides it.
+
+    Args:
+        func_desc ([type]): [description]
+        value ([type]): [description]
+    """
+    assert type(value) is int and value > 0
+    func_desc.function_attribute.fetch_every_n = value
+
+
 @oneflow_function_config("default_distribute_strategy")
 @oneflow_deprecate()
 def deprecated_set_default_distribute_strategy(*args, **kwargs):
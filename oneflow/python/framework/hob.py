@@ -13,30 +13,30 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import oneflow.python.framework.c_api_util as c_api_util
 import oneflow.python.framework.runtime_mode as rt_mode
 import oneflow.python.framework.session_context as session_ctx
 import oneflow.python.framework.c_api_util as c_api_util
 import oneflow
+import oneflow.python.lib.core.enable_if as enable_if
 from oneflow.python.lib.core.high_order_bool import bool_functor
 
 
-@bool_functor("Current mode is %s" % rt_mode.NORMAL_MODE)
+@bool_functor("Current mode is %s" % rt_mode.NORMAL_MODE, cacheable=True)
 def in_normal_mode(ctx):
     return rt_mode.CurrentMode() == rt_mode.NORMAL_MODE
 
 
-@bool_functor("Current mode is %s" % rt_mode.GLOBAL_MODE)
+@bool_functor("Current mode is %s" % rt_mode.GLOBAL_MODE, cacheable=True)
 def in_global_mode(ctx):
     return rt_mode.CurrentMode() == rt_mode.GLOBAL_MODE
 
 
-@bool_functor("Current mode is %s" % rt_mode.DEVICE_MODE)
+@bool_functor("Current mode is %s" % rt_mode.DEVICE_MODE, cacheable=True)
 def in_device_mode(ctx):
     return rt_mode.CurrentMode() == rt_mode.DEVICE_MODE
 
 
-@bool_functor("Environment initialized")
+@bool_functor("Environment initialized", cacheable=True)
 def env_initialized(ctx):
     assert in_normal_mode(ctx)
     return c_api_util.IsEnvInited()
@@ -48,12 +48,12 @@ def any_global_function_defined(ctx):
     return session_ctx.GetDefaultSession().AnyGlobalFunctionDefined()
 
 
-@bool_functor("Eager execution enabled")
+@bool_functor("Eager execution enabled", cacheable=True)
 def eager_execution_enabled(ctx):
     return c_api_util.EagerExecutionEnabled()
 
 
-@bool_functor("Session initialized")
+@bool_functor("Session initialized", cacheable=True)
 def session_initialized(ctx):
     assert in_normal_mode(ctx)
     return session_ctx.GetDefaultSession().is_running
@@ -92,3 +92,19 @@ def consistent_view_enabled(ctx):
 @bool_functor("Mirrored view enabled")
 def mirrored_view_enabled(ctx):
     return oneflow.scope.mirrored_view_enabled()
+
+
+def _DispatchContextKey():
+    # all the cacheable hobs above are determined by this key
+    session_status = session_ctx.DefaultSessionStatus()
+    if session_status is None:
+        return None
+    return (
+        rt_mode.CurrentMode(),
+        c_api_util.EagerExecutionEnabled(),
+        c_api_util.IsEnvInited(),
+        session_status,
+    )
+
+
+enable_if.set_dispatch_context_key_getter(_DispatchContextKey)
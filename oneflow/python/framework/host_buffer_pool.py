@@ -0,0 +1,120 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import collections
+import sys
+import threading
+
+import numpy as np
+
+
+class HostBufferPool(object):
+    r"""A pool of host ndarrays keyed by (shape, dtype).
+
+    A pooled ndarray is reused once nothing but the pool refers to it, so
+    results handed to users are recycled as soon as they are dropped. Keys are
+    evicted in LRU order when the pool would grow beyond `capacity` bytes.
+    """
+
+    def __init__(self, capacity=256 * 1024 * 1024):
+        self.capacity_ = capacity
+        self.lock_ = threading.Lock()
+        self.key2buffers_ = collections.OrderedDict()
+        self.size_ = 0
+        self.hit_cnt_ = 0
+        self.miss_cnt_ = 0
+
+    @property
+    def capacity(self):
+        return self.capacity_
+
+    def SetCapacity(self, capacity):
+        assert type(capacity) is int
+        assert capacity >= 0
+        with self.lock_:
+            self.capacity_ = capacity
+            self._Evict(0)
+
+    def Get(self, shape, dtype):
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        key = (shape, dtype.str)
+        with self.lock_:
+            buffers = self.key2buffers_.get(key)
+            if buffers is not None:
+                self.key2buffers_.move_to_end(key)
+                for i in range(len(buffers)):
+                    if _IsIdle(buffers, i):
+                        self.hit_cnt_ += 1
+                        ndarray = buffers[i]
+                        return ndarray
+            self.miss_cnt_ += 1
+            ndarray = np.empty(shape, dtype=dtype)
+            if not self._Evict(ndarray.nbytes):
+                return ndarray
+            if buffers is None:
+                buffers = []
+                self.key2buffers_[key] = buffers
+            buffers.append(ndarray)
+            self.size_ += ndarray.nbytes
+            return ndarray
+
+    def Clear(self):
+        with self.lock_:
+            self.key2buffers_.clear()
+            self.size_ = 0
+
+    def Stats(self):
+        with self.lock_:
+            return dict(
+                hit=self.hit_cnt_,
+                miss=self.miss_cnt_,
+                size=self.size_,
+                capacity=self.capacity_,
+                buffer_cnt=sum(len(x) for x in self.key2buffers_.values()),
+            )
+
+    def _Evict(self, nbytes):
+        # returns whether nbytes more can be pooled after evicting idle buffers
+        if self.size_ + nbytes <= self.capacity_:
+            return True
+        for key in list(self.key2buffers_.keys()):
+            buffers = self.key2buffers_[key]
+            i = 0
+            while i < len(buffers):
+                if _IsIdle(buffers, i):
+                    self.size_ -= buffers[i].nbytes
+                    del buffers[i]
+                else:
+                    i += 1
+            if len(buffers) == 0:
+                del self.key2buffers_[key]
+            if self.size_ + nbytes <= self.capacity_:
+                return True
+        return False
+
+
+def _IsIdle(buffers, i):
+    # referred only by `buffers` and the argument of sys.getrefcount
+    return sys.getrefcount(buffers[i]) == 2
+
+
+def GetDefaultHostBufferPool():
+    return _default_host_buffer_pool
+
+
+_default_host_buffer_pool = HostBufferPool()
@@ -0,0 +1,69 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import threading
+import time
+
+
+class InflightWindow(object):
+    r"""Bounds the number of launched but unfinished steps of a lazy job.
+
+    `Acquire` is called by the caller before launching a step and blocks while
+    `max_inflight` steps are in flight. `Release` is called when a step finishes.
+    """
+
+    def __init__(self, max_inflight):
+        assert max_inflight > 0
+        self.max_inflight_ = max_inflight
+        self.cond_var_ = threading.Condition()
+        self.inflight_cnt_ = 0
+        self.peak_inflight_cnt_ = 0
+        self.launched_cnt_ = 0
+        self.finished_cnt_ = 0
+        self.blocked_cnt_ = 0
+        self.wait_seconds_ = 0.0
+
+    def Acquire(self):
+        with self.cond_var_:
+            if self.inflight_cnt_ >= self.max_inflight_:
+                self.blocked_cnt_ += 1
+                start = time.perf_counter()
+                while self.inflight_cnt_ >= self.max_inflight_:
+                    self.cond_var_.wait()
+                self.wait_seconds_ += time.perf_counter() - start
+            self.inflight_cnt_ += 1
+            self.launched_cnt_ += 1
+            self.peak_inflight_cnt_ = max(self.peak_inflight_cnt_, self.inflight_cnt_)
+
+    def Release(self):
+        with self.cond_var_:
+            assert self.inflight_cnt_ > 0
+            self.inflight_cnt_ -= 1
+            self.finished_cnt_ += 1
+            self.cond_var_.notify()
+
+    def Stats(self):
+        with self.cond_var_:
+            return dict(
+                max_inflight=self.max_inflight_,
+                inflight_cnt=self.inflight_cnt_,
+                peak_inflight_cnt=self.peak_inflight_cnt_,
+                launched_cnt=self.launched_cnt_,
+                finished_cnt=self.finished_cnt_,
+                blocked_cnt=self.blocked_cnt_,
+                wait_seconds=self.wait_seconds_,
+            )
@@ -17,7 +17,8 @@ from __future__ import absolute_import
 
 import sys
 from functools import reduce
-from typing import Any, Optional, Sequence, Union
+import threading
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
 
 import numpy as np
 
@@ -32,6 +33,7 @@ import oneflow.python.framework.id_util as id_util
 import oneflow.python.framework.placement_context as placement_ctx
 import oneflow.python.framework.remote_blob as remote_blob_util
 import oneflow.python.framework.dtype as dtype_util
+import oneflow.python.framework.host_buffer_pool as host_buffer_pool
 from oneflow.python.oneflow_export import oneflow_export
 from functools import reduce
 import traceback
@@ -95,14 +97,14 @@ class ArgBlobDef(blob_desc.BlobDesc):
     def EagerAddAndInferOp(self, op_conf):
         raise NotImplementedError
 
-    def CheckAndAsyncPush(self, session, arg_ndarray):
+    def CheckAndAsyncPush(self, session, arg_ndarray, push_lease):
         self._CheckNdarray(arg_ndarray)
-        self._AsyncPush(session, arg_ndarray)
+        self._AsyncPush(session, arg_ndarray, push_lease)
 
     def _CheckNdarray(self, ndarray):
         raise NotImplementedError
 
-    def _AsyncPush(self, session, arg_ndarray):
+    def _AsyncPush(self, session, arg_ndarray, push_lease):
         raise NotImplementedError
 
     def SetBatchAxisAndSplitAxis(self, interface_blob_conf):
@@ -175,11 +177,21 @@ class FixedTensorDef(ArgBlobDef):
             interface_blob_conf.split_axis.value = self.batch_axis
 
     def _CheckNdarray(self, ndarray: np.ndarray) -> None:
+        if isinstance(ndarray, Shards):
+            raise NotImplementedError(
+                "oneflow.data.Shards of a Numpy.Placeholder is only supported in eager mode"
+            )
         assert isinstance(ndarray, np.ndarray)
         assert ndarray.shape == self.shape
 
-    def _AsyncPush(self, session: object, arg_ndarray: np.ndarray) -> None:
-        session.AsyncPush(self.op_name, _MakePushNdarrayCallback(arg_ndarray))
+    def _AsyncPush(
+        self, session: object, arg_ndarray: np.ndarray, push_lease: object
+    ) -> None:
+        session.AsyncPush(
+            self.op_name,
+            _MakePushNdarrayCallback(arg_ndarray, borrowed=push_lease.borrowed),
+            push_lease.Acquire(),
+        )
 
 
 class MirroredTensorDef(ArgBlobDef):
@@ -223,6 +235,9 @@ class MirroredTensorDef(ArgBlobDef):
         interface_blob_conf.split_axis.ClearField("value")
 
     def _CheckNdarray(self, ndarray_list: Sequence[np.ndarray]) -> None:
+        if isinstance(ndarray_list, Shards):
+            # shards are checked when pushed
+            return
         assert isinstance(ndarray_list, (list, tuple))
         assert len(self.sub_consistent_blob_list_) == len(ndarray_list)
 
@@ -236,12 +251,37 @@ class MirroredTensorDef(ArgBlobDef):
             assert len(ndarray.shape) == len(self.shape)
             assert GetElemCnt(ndarray.shape) <= GetElemCnt(self.shape)
 
-    def _AsyncPush(self, session: object, ndarray_list: Sequence[np.ndarray]) -> None:
-        for i in range(len(ndarray_list)):
+    def _CheckShard(self, ndarray: np.ndarray) -> None:
+        assert type(ndarray) is np.ndarray, type(ndarray)
+        assert ndarray.ndim == len(self.shape), "%s v.s. %s" % (
+            ndarray.shape,
+            self.shape,
+        )
+        dtype = dtype_util.convert_oneflow_dtype_to_numpy_dtype(self.dtype)
+        assert ndarray.dtype == dtype, "%s v.s. %s" % (ndarray.dtype, dtype)
+        assert ndarray.size <= _ElemCnt(self.shape), "%s v.s. %s" % (
+            ndarray.shape,
+            self.shape,
+        )
+
+    def _AsyncPush(
+        self, session: object, ndarray_list: Sequence[np.ndarray], push_lease: object,
+    ) -> None:
+        for i in range(len(self.sub_consistent_blob_list_)):
             sub_blob = self.sub_consistent_blob_list_[i]
-            session.AsyncPush(
-                sub_blob.op_name, _MakePushNdarrayCallback(ndarray_list[i])
-            )
+            if isinstance(ndarray_list, Shards):
+                push_cb = _MakePushShardCallback(
+                    ndarray_list,
+                    i,
+                    self._CheckShard,
+                    _MakePushNdarrayCallback,
+                    push_lease,
+                )
+            else:
+                push_cb = _MakePushNdarrayCallback(
+                    ndarray_list[i], borrowed=push_lease.borrowed
+                )
+            session.AsyncPush(sub_blob.op_name, push_cb, push_lease.Acquire())
 
 
 class MirroredTensorListDef(ArgBlobDef):
@@ -285,6 +325,9 @@ class MirroredTensorListDef(ArgBlobDef):
         interface_blob_conf.split_axis.ClearField("value")
 
     def _CheckNdarray(self, ndarray_lists: Sequence[np.ndarray]) -> None:
+        if isinstance(ndarray_lists, Shards):
+            # shards are checked when pushed
+            return
         assert isinstance(ndarray_lists, (list, tuple))
         assert len(self.sub_consistent_blob_list_) == len(ndarray_lists)
 
@@ -302,12 +345,37 @@ class MirroredTensorListDef(ArgBlobDef):
                 elem_cnt += GetElemCnt(ndarray.shape)
             assert elem_cnt <= GetElemCnt(self.shape)
 
-    def _AsyncPush(self, session: object, ndarray_lists: Sequence[np.ndarray]) -> None:
-        for i in range(len(ndarray_lists)):
-            sub_blob = self.sub_consistent_blob_list_[i]
-            session.AsyncPush(
-                sub_blob.op_name, _MakePushNdarrayListCallback(ndarray_lists[i])
+    def _CheckShard(self, ndarray_list: Sequence[np.ndarray]) -> None:
+        assert type(ndarray_list) is list, type(ndarray_list)
+        dtype = dtype_util.convert_oneflow_dtype_to_numpy_dtype(self.dtype)
+        for ndarray in ndarray_list:
+            assert type(ndarray) is np.ndarray, type(ndarray)
+            assert ndarray.ndim == len(self.shape), "%s v.s. %s" % (
+                ndarray.shape,
+                self.shape,
             )
+            assert ndarray.dtype == dtype, "%s v.s. %s" % (ndarray.dtype, dtype)
+        elem_cnt = sum(ndarray.size for ndarray in ndarray_list)
+        assert elem_cnt <= _ElemCnt(self.shape), "%s v.s. %s" % (elem_cnt, self.shape,)
+
+    def _AsyncPush(
+        self, session: object, ndarray_lists: Sequence[np.ndarray], push_lease: object,
+    ) -> None:
+        for i in range(len(self.sub_consistent_blob_list_)):
+            sub_blob = self.sub_consistent_blob_list_[i]
+            if isinstance(ndarray_lists, Shards):
+                push_cb = _MakePushShardCallback(
+                    ndarray_lists,
+                    i,
+                    self._CheckShard,
+                    _MakePushNdarrayListCallback,
+                    push_lease,
+                )
+            else:
+                push_cb = _MakePushNdarrayListCallback(
+                    ndarray_lists[i], borrowed=push_lease.borrowed
+                )
+            session.AsyncPush(sub_blob.op_name, push_cb, push_lease.Acquire())
 
 
 def _AddAndInferMirroredOp(mirrored_lbn, op_conf, sub_consistent_blob_list):
@@ -323,8 +391,66 @@ def _AddAndInferMirroredOp(mirrored_lbn, op_conf, sub_consistent_blob_list):
         sub_consistent_blob_list.append(remote_blob_util.ConsistentBlob(sub_lbi))
 
 
-def _MakePushNdarrayCallback(ndarray):
-    copied = np.copy(ndarray)
+@oneflow_export("data.Shards")
+class Shards(object):
+    r"""An input of a global function given as one shard per rank.
+
+    Shards are produced lazily, when the rank they belong to is fed, so the
+    whole input never has to exist in one ndarray and shards of different
+    ranks may be prepared in parallel. For an input of
+    `oneflow.typing.ListNumpy.Placeholder` a shard is the ndarray of the rank,
+    and for `oneflow.typing.ListListNumpy.Placeholder` the ndarray list of the
+    rank. Eager global functions also accept shards of
+    `oneflow.typing.Numpy.Placeholder`: the slice of the rank along the split
+    axis, or the whole ndarray if the input is broadcast.
+
+    In lazy mode, a shard which fails to be produced or checked leaves its input
+    unfed, and the call still runs on what the input held before, e.g. a train
+    step is still applied. The error is raised by the future of the call, by its
+    push lease, or else by the next call or `oneflow.sync_default_session()`.
+
+    For instance::
+
+        @flow.global_function(function_config=func_config)
+        def predict(images: tp.ListNumpy.Placeholder((32, 3, 224, 224))):
+            # your network
+
+        predict(flow.data.Shards(lambda rank: LoadImages(rank)))
+
+    Args:
+        producer (Union[Callable[[int], Any], Iterable[Any]]): `producer(rank)` returns the shard of a rank, or an iterable yields shards in rank order
+    """
+
+    def __init__(self, producer: Union[Callable[[int], Any], Iterable[Any]]) -> None:
+        self.lock_ = threading.Lock()
+        if callable(producer):
+            self.producer_ = producer
+            self.shard_iter_ = None
+        else:
+            self.producer_ = None
+            self.shard_iter_ = iter(producer)
+        self.next_rank_ = 0
+        self.rank2shard_ = {}
+
+    def Get(self, rank):
+        if self.producer_ is not None:
+            return self.producer_(rank)
+        with self.lock_:
+            while rank >= self.next_rank_:
+                try:
+                    shard = next(self.shard_iter_)
+                except StopIteration:
+                    raise ValueError("no shard for rank %s" % rank)
+                self.rank2shard_[self.next_rank_] = shard
+                self.next_rank_ += 1
+            assert rank in self.rank2shard_, "shard of rank %s has been fed" % rank
+            return self.rank2shard_.pop(rank)
+
+
+def _MakePushNdarrayCallback(ndarray, borrowed=False):
+    # a borrowed ndarray is owned by the caller until the push job finishes,
+    # so the only copy left is the one into the ofblob
+    copied = _BorrowNdarray(ndarray) if borrowed else _CopyToPooledNdarray(ndarray)
 
     def Copy(ofblob):
         capacity = reduce(lambda x, y: x * y, ofblob.static_shape, 1)
@@ -335,11 +461,48 @@ def _MakePushNdarrayCallback(ndarray):
     return Copy
 
 
-def _MakePushNdarrayListCallback(ndarray_list):
-    copied = [np.copy(ndarray) for ndarray in ndarray_list]
+def _MakePushNdarrayListCallback(ndarray_list, borrowed=False):
+    if borrowed:
+        copied = [_BorrowNdarray(ndarray) for ndarray in ndarray_list]
+    else:
+        copied = [_CopyToPooledNdarray(ndarray) for ndarray in ndarray_list]
     return lambda ofblob: ofblob.CopyFromNdarrayList(copied)
 
 
+def _MakePushShardCallback(shards, rank, check_shard, make_push_callback, push_lease):
+    # the shard is produced when pushed, and nobody else refers to it. Push
+    # callbacks run on runtime threads, so errors are reported through the push
+    # lease and raised on the caller's side instead. The ofblob is left as it
+    # is, and the job still runs on it.
+    def Push(ofblob):
+        try:
+            shard = shards.Get(rank)
+            check_shard(shard)
+            push = make_push_callback(shard, borrowed=True)
+        except BaseException as e:
+            push_lease.SetException(e)
+            return
+        push(ofblob)
+
+    return Push
+
+
+def _ElemCnt(shape):
+    return reduce(lambda x, y: x * y, shape, 1)
+
+
+def _BorrowNdarray(ndarray):
+    # no-op for C-contiguous ndarrays
+    return np.ascontiguousarray(ndarray)
+
+
+def _CopyToPooledNdarray(ndarray):
+    pool = host_buffer_pool.GetDefaultHostBufferPool()
+    copied = pool.Get(ndarray.shape, ndarray.dtype)
+    np.copyto(copied, ndarray)
+    return copied
+
+
 @oneflow_export("FixedTensorDef")
 class DeprecatedFixedTensorDef(FixedTensorDef):
     def __init__(self, *args, **kwargs):
@@ -0,0 +1,82 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+# Static metadata of lazy blobs never changes once the producer op is inferred.
+# Entries are dicts with keys among "shape", "dtype", "batch_axis", "split_axis",
+# "is_dynamic" and "is_tensor_list". Blobs hold on to their entries, so closing a
+# job only stops new blobs from seeing stale entries of a reopened job name.
+
+_job_name2key2blob_desc = {}
+_building_job_name = None
+
+
+def OpenJob(job_name):
+    global _building_job_name
+    _building_job_name = job_name
+
+
+def CloseJob():
+    global _building_job_name
+    _job_name2key2blob_desc.pop(_building_job_name, None)
+    _building_job_name = None
+
+
+def GetBlobDesc(job_name, lbn, is_mirrored=False):
+    if job_name != _building_job_name:
+        return {}
+    key2blob_desc = _job_name2key2blob_desc.get(job_name)
+    if key2blob_desc is None:
+        key2blob_desc = {}
+        _job_name2key2blob_desc[job_name] = key2blob_desc
+    key = (lbn, is_mirrored)
+    blob_desc = key2blob_desc.get(key)
+    if blob_desc is None:
+        blob_desc = {}
+        key2blob_desc[key] = blob_desc
+    return blob_desc
+
+
+def UpdateByOpAttribute(op_attribute):
+    job_name = _building_job_name
+    if job_name is None:
+        return
+    lbi_map = op_attribute.arg_signature.bn_in_op2lbi
+    blob_desc_map = op_attribute.logical_blob_desc_signature.bn_in_op2blob_desc
+    batch_axis_map = op_attribute.batch_axis_signature.bn_in_op2batch_axis
+    sbp_map = op_attribute.sbp_signature.bn_in_op2sbp_parallel
+    for obn in op_attribute.output_bns:
+        if obn not in lbi_map:
+            continue
+        lbi = lbi_map[obn]
+        blob_desc = GetBlobDesc(job_name, lbi.op_name + "/" + lbi.blob_name)
+        if obn in blob_desc_map:
+            blob_desc_proto = blob_desc_map[obn]
+            blob_desc["shape"] = tuple(map(int, blob_desc_proto.body.shape.dim))
+            blob_desc["dtype"] = int(blob_desc_proto.body.data_type)
+            blob_desc["is_dynamic"] = blob_desc_proto.is_dynamic
+            blob_desc["is_tensor_list"] = blob_desc_proto.is_tensor_list
+        if obn in batch_axis_map:
+            batch_axis = batch_axis_map[obn]
+            blob_desc["batch_axis"] = (
+                batch_axis.value if batch_axis.HasField("value") else None
+            )
+        if obn in sbp_map:
+            sbp_parallel = sbp_map[obn]
+            if sbp_parallel.HasField("split_parallel"):
+                blob_desc["split_axis"] = sbp_parallel.split_parallel.axis
+            else:
+                blob_desc["split_axis"] = None
@@ -17,23 +17,19 @@ from __future__ import absolute_import
 
 import numpy as np
 import oneflow.python.framework.remote_blob as remote_blob_util
+import oneflow.python.lib.core.async_util as async_util
 import traceback
 
 
 class LocalMirroredTensor(object):
-    def __init__(self, ndarray_list, is_dynamic, concat_axis=None):
+    def __init__(self, ndarray_list, is_dynamic, concat_axis=None, concatenated=None):
         self.ndarray_list_ = ndarray_list
         self.is_dynamic_ = is_dynamic
         self.concat_axis_ = concat_axis
-        self.ndarray_ = None
-        if not is_dynamic:
-            if len(self.ndarray_list_) == 1:
-                self.ndarray_ = self.ndarray_list_[0]
-            elif concat_axis is not None:
-                self.ndarray_ = np.concatenate(self.ndarray_list_, axis=concat_axis)
-            else:
-                # do nothing
-                pass
+        # ndarray_list may be views of a preallocated concatenated ndarray
+        self.ndarray_ = concatenated
+        if not is_dynamic and len(self.ndarray_list_) == 1:
+            self.ndarray_ = self.ndarray_list_[0]
 
     def ndarray_list(self):
         print(
@@ -56,6 +52,11 @@ class LocalMirroredTensor(object):
 
     def numpy(self, parallel_id=None):
         if parallel_id is None:
+            if self.ndarray_ is None and not self.is_dynamic_:
+                if self.concat_axis_ is not None:
+                    self.ndarray_ = np.concatenate(
+                        self.ndarray_list_, axis=self.concat_axis_
+                    )
             assert self.ndarray_ is not None
             return self.ndarray_
         else:
@@ -63,6 +64,10 @@ class LocalMirroredTensor(object):
             assert len(self.ndarray_list_) > parallel_id
             return self.ndarray_list_[parallel_id]
 
+    def numpy_shards(self):
+        for ndarray in self.ndarray_list_:
+            yield ndarray
+
     def parallel_num(self):
         return len(self.ndarray_list_)
 
@@ -115,7 +120,7 @@ def MakeLocalBlob(ndarray_lists, consistent_blob):
     )
 
 
-def MergeLocalBlobs(local_blob_list, mirrored_blob):
+def MergeLocalBlobs(local_blob_list, mirrored_blob, concatenated=None):
     assert isinstance(mirrored_blob, remote_blob_util.MirroredBlob)
     if mirrored_blob.is_tensor_list:
         for local_blob in local_blob_list:
@@ -125,6 +130,7 @@ def MergeLocalBlobs(local_blob_list, mirrored_blob):
         [x.numpy_list()[0] for x in local_blob_list],
         is_dynamic=mirrored_blob.is_dynamic,
         concat_axis=mirrored_blob.batch_axis,
+        concatenated=concatenated,
     )
 
 
@@ -146,6 +152,31 @@ def MakeLocalBlob4EagerBlob(eager_blob):
         raise NotImplementedError
 
 
+def AsyncMakeLocalBlob4EagerBlob(eager_blob):
+    assert isinstance(eager_blob, remote_blob_util.EagerBlobTrait)
+    if eager_blob.is_tensor_list:
+        return async_util.Then(eager_blob.async_numpy_list(), LocalMirroredTensorList)
+    elif isinstance(eager_blob, remote_blob_util.EagerMirroredBlob):
+        futures = [eager_blob.async_numpy(i) for i in range(eager_blob.numpy_size())]
+        is_dynamic = eager_blob.is_dynamic
+        concat_axis = eager_blob.batch_axis
+        return async_util.Then(
+            async_util.Gather(futures),
+            lambda ndarray_list: LocalMirroredTensor(
+                ndarray_list, is_dynamic=is_dynamic, concat_axis=concat_axis
+            ),
+        )
+    elif isinstance(eager_blob, remote_blob_util.EagerConsistentBlob):
+        return async_util.Then(
+            eager_blob.async_numpy(),
+            lambda ndarray: LocalMirroredTensor(
+                [ndarray], is_dynamic=False, concat_axis=0
+            ),
+        )
+    else:
+        raise NotImplementedError
+
+
 non_override_field = set(
     [
         "__class__",
@@ -91,8 +91,8 @@ class OfBlob(object):
         assert len(ndarray_lists[0]) == 1
         return ndarray_lists[0][0]
 
-    def CopyToNdarrayLists(self):
-        return self._CopyToNdarrayLists()
+    def CopyToNdarrayLists(self, get_ndarray=None):
+        return self._CopyToNdarrayLists(get_ndarray)
 
     def CopyToFlatNdarrayList(self):
         ndarray_lists = self._CopyToNdarrayLists()
@@ -123,11 +123,11 @@ class OfBlob(object):
         assert self.is_dynamic
         return self._CopyFromNdarrayLists(ndarray_lists)
 
-    def _CopyToNdarrayLists(self):
+    def _CopyToNdarrayLists(self, get_ndarray=None):
         (
             tensor_list,
             is_new_slice_start_mask,
-        ) = self._CopyToNdarrayListAndIsNewSliceStartMask()
+        ) = self._CopyToNdarrayListAndIsNewSliceStartMask(get_ndarray)
         tensor_lists = []
         for tensor, is_new_slice_start in zip(tensor_list, is_new_slice_start_mask):
             if is_new_slice_start:
@@ -135,21 +135,23 @@ class OfBlob(object):
             tensor_lists[-1].append(tensor)
         return tensor_lists
 
-    def _CopyToNdarrayListAndIsNewSliceStartMask(self):
+    def _CopyToNdarrayListAndIsNewSliceStartMask(self, get_ndarray=None):
+        # get_ndarray(shape, dtype) returns a C-contiguous ndarray to copy into
+        if get_ndarray is None:
+            get_ndarray = lambda shape, dtype: np.zeros(shape, dtype=dtype)
         # get tensor list
         method_name = oneflow_api.Dtype_GetOfBlobCurTensorCopyToBufferFuncName(
             self.dtype.oneflow_proto_dtype
         )
         copy_method = getattr(oneflow_api, method_name)
+        dtype = flow.convert_oneflow_dtype_to_numpy_dtype(self.dtype)
         tensor_list = []
         oneflow_api.OfBlob_ResetTensorIterator(self.of_blob_ptr_)
         while oneflow_api.OfBlob_CurTensorIteratorEqEnd(self.of_blob_ptr_) == False:
             shape_tensor = np.zeros(self.num_axes, dtype=np.int64)
             oneflow_api.OfBlob_CurTensorCopyShapeTo(self.of_blob_ptr_, shape_tensor)
             shape = tuple(shape_tensor.tolist())
-            tensor = np.zeros(
-                shape, dtype=flow.convert_oneflow_dtype_to_numpy_dtype(self.dtype)
-            )
+            tensor = get_ndarray(shape, dtype)
             copy_method(self.of_blob_ptr_, tensor)
             tensor_list.append(tensor)
             oneflow_api.OfBlob_IncTensorIterator(self.of_blob_ptr_)
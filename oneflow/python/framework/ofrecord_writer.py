@@ -0,0 +1,239 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+import oneflow.python.framework.balanced_splitter as balanced_splitter
+from oneflow.python.oneflow_export import oneflow_export
+
+# A part file is a sequence of records, each framed as
+#
+#   int64 little-endian byte size | serialized oneflow.OFRecord
+#
+# which is what ofrecord readers read. Records are encoded column by column
+# straight into the protobuf wire format, so a numeric column costs one header
+# and one tobytes per record. An index file holds the int64 offsets of the
+# records of its part.
+
+INDEX_FILE_SUFFIX = ".index"
+_MAX_RECORD_SIZE = 64 * 1024 * 1024
+
+
+@oneflow_export("data.OFRecordWriter")
+class OFRecordWriter(object):
+    r"""Write feature columns as OFRecord part files.
+
+    Every `write` call distributes its records evenly over the part files
+    `part_name_prefix` + part id padded to `part_name_suffix_length` digits, and
+    appends them in parallel processes. The files can be read by
+    `oneflow.data.ofrecord_reader` with the same `part_name_suffix_length`.
+
+    A column is a numpy.ndarray whose first axis indexes records, or a sequence
+    of bytes, str or lists of them. float32, float64, int64 and other integer
+    ndarrays become float_list, double_list, int64_list and int32_list features.
+
+    For instance::
+
+        writer = flow.data.OFRecordWriter("train", num_parts=8)
+        writer.write({"images": images, "labels": labels.astype(np.int32)})
+
+    Args:
+        path (str): directory of the part files
+        num_parts (int, optional): number of part files. Defaults to 1.
+        part_name_prefix (str, optional): Defaults to "part-".
+        part_name_suffix_length (int, optional): Defaults to 5.
+        num_processes (Optional[int], optional): number of writing processes. Defaults to num_parts.
+        write_index (bool, optional): write an offset index file beside every part file. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        num_parts: int = 1,
+        part_name_prefix: str = "part-",
+        part_name_suffix_length: int = 5,
+        num_processes: Optional[int] = None,
+        write_index: bool = False,
+    ) -> None:
+        assert num_parts > 0
+        if not os.path.exists(path):
+            os.makedirs(path)
+        assert os.path.isdir(path)
+        self.part_paths_ = [
+            os.path.join(
+                path, part_name_prefix + str(i).zfill(max(part_name_suffix_length, 0)),
+            )
+            for i in range(num_parts)
+        ]
+        for part_path in self.part_paths_:
+            open(part_path, "wb").close()
+            if write_index:
+                open(part_path + INDEX_FILE_SUFFIX, "wb").close()
+        self.num_processes_ = num_processes or num_parts
+        self.write_index_ = write_index
+
+    @property
+    def part_paths(self):
+        return self.part_paths_
+
+    def write(
+        self, columns: Dict[str, Union[np.ndarray, Sequence[bytes], Sequence[str]]]
+    ) -> int:
+        r"""Append records made of `columns` and return the number of them.
+        """
+        assert len(columns) > 0
+        record_nums = set(len(column) for column in columns.values())
+        assert len(record_nums) == 1, "record numbers of columns: %s" % record_nums
+        record_num = record_nums.pop()
+        part_nums = balanced_splitter.BalancedPartNums(
+            record_num, len(self.part_paths_)
+        )
+        tasks = []
+        start = 0
+        for part_path, part_num in zip(self.part_paths_, part_nums):
+            end = start + part_num
+            if end > start:
+                part_columns = {k: v[start:end] for k, v in columns.items()}
+                tasks.append((part_path, part_columns, self.write_index_))
+            start = end
+        if len(tasks) == 1 or self.num_processes_ == 1:
+            for task in tasks:
+                _WritePart(*task)
+        else:
+            max_workers = min(self.num_processes_, len(tasks))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_WritePart, *zip(*tasks)))
+        return record_num
+
+
+def ReadOFRecordOffsets(part_path):
+    r"""Returns the record offsets in an index file written by OFRecordWriter."""
+    return np.fromfile(part_path + INDEX_FILE_SUFFIX, dtype="<i8")
+
+
+def _WritePart(part_path, columns, write_index):
+    encoded_columns = [_EncodeColumn(k, v) for k, v in sorted(columns.items())]
+    record_num = len(encoded_columns[0])
+    with open(part_path, "ab") as f:
+        offset = f.tell()
+        offsets = np.empty((record_num,), dtype="<i8")
+        for i in range(record_num):
+            record = b"".join(encoded[i] for encoded in encoded_columns)
+            assert len(record) <= _MAX_RECORD_SIZE, len(record)
+            offsets[i] = offset
+            f.write(struct.pack("<q", len(record)))
+            f.write(record)
+            offset += 8 + len(record)
+    if write_index:
+        with open(part_path + INDEX_FILE_SUFFIX, "ab") as f:
+            f.write(offsets.tobytes())
+
+
+def _EncodeColumn(key, column):
+    # returns the serialized `feature` map entries of the column, one per record
+    if isinstance(column, np.ndarray) and column.dtype.kind in "biuf":
+        return _EncodeNdarrayColumn(key, column)
+    encoded = []
+    for value in column:
+        value = _EncodeBytesList(value)
+        encoded.append(_FeaturePrefix(key, _BYTES_LIST, len(value), False) + value)
+    return encoded
+
+
+def _EncodeNdarrayColumn(key, column):
+    record_num = len(column)
+    rows = column.reshape(record_num, -1)
+    if column.dtype in _FIXED_WIDTH_DTYPE2FIELD:
+        field, dtype = _FIXED_WIDTH_DTYPE2FIELD[column.dtype]
+        rows = np.ascontiguousarray(rows, dtype=dtype)
+        prefix = _FeaturePrefix(key, field, rows.shape[1] * rows.itemsize)
+        return [prefix + row.tobytes() for row in rows]
+    if column.dtype in (np.int64, np.uint32, np.uint64):
+        field = _INT64_LIST
+    else:
+        field = _INT32_LIST
+    varints, row_sizes = _EncodeVarints(rows)
+    ends = np.cumsum(row_sizes)
+    starts = ends - row_sizes
+    return [
+        _FeaturePrefix(key, field, end - start) + varints[start:end]
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def _EncodeVarints(rows):
+    # packed varints of all values and the byte size of every row
+    values = rows.astype(np.int64).view(np.uint64)
+    shifts = np.arange(0, 64, 7, dtype=np.uint64)
+    groups = (values[..., None] >> shifts) & np.uint64(0x7F)
+    nbytes = np.maximum(np.count_nonzero(values[..., None] >> shifts, axis=-1), 1)
+    byte_ids = np.arange(len(shifts))
+    groups |= np.where(byte_ids < nbytes[..., None] - 1, 0x80, 0).astype(np.uint64)
+    mask = byte_ids < nbytes[..., None]
+    return groups.astype(np.uint8)[mask].tobytes(), nbytes.sum(axis=-1)
+
+
+def _EncodeBytesList(value):
+    if isinstance(value, (bytes, str, np.bytes_, np.str_)):
+        value = [value]
+    encoded = []
+    for x in value:
+        if isinstance(x, str):
+            x = x.encode("utf-8")
+        x = bytes(x)
+        encoded.append(b"\x0a" + _Varint(len(x)) + x)
+    return b"".join(encoded)
+
+
+def _FeaturePrefix(key, field, payload_size, packed=True):
+    # everything of a map entry before the payload of its list
+    list_header = b""
+    if packed:
+        list_header = b"\x0a" + _Varint(payload_size)
+    list_size = len(list_header) + payload_size
+    feature_header = bytes([field << 3 | 2]) + _Varint(list_size)
+    feature_size = len(feature_header) + list_size
+    key = key.encode("utf-8")
+    entry_header = b"\x0a" + _Varint(len(key)) + key + b"\x12" + _Varint(feature_size)
+    entry_size = len(entry_header) + feature_size
+    return b"\x0a" + _Varint(entry_size) + entry_header + feature_header + list_header
+
+
+def _Varint(value):
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+_BYTES_LIST = 1
+_FLOAT_LIST = 2
+_DOUBLE_LIST = 3
+_INT32_LIST = 4
+_INT64_LIST = 5
+_FIXED_WIDTH_DTYPE2FIELD = {
+    np.dtype(np.float16): (_FLOAT_LIST, "<f4"),
+    np.dtype(np.float32): (_FLOAT_LIST, "<f4"),
+    np.dtype(np.float64): (_DOUBLE_LIST, "<f8"),
+}
@@ -16,8 +16,12 @@ limitations under the License.
 from __future__ import absolute_import
 
 import threading
+import numpy as np
+import oneflow.python.framework.dtype as dtype_util
+import oneflow.python.framework.host_buffer_pool as host_buffer_pool
 import oneflow.python.framework.local_blob as local_blob_util
 import oneflow.python.framework.remote_blob as remote_blob_util
+import oneflow.python.lib.core.async_util as async_util
 
 
 class FutureRemoteBlobs(object):
@@ -40,21 +44,32 @@ class FutureRemoteBlobs(object):
 
 
 class LazyFutureRemoteBlobs(FutureRemoteBlobs):
-    def __init__(self, session):
+    def __init__(self, session, out=None, fetch=True, push_lease=None):
         super().__init__()
         self.session_ = session
+        self.out_ = out
+        self.fetch_ = fetch
+        self.push_lease_ = push_lease
         self.cond_var_ = threading.Condition()
         self.out_remote_blob_pullers_ = []
         self.finished_cnt_ = 0
         self.data_delivered_ = False
         self.async_get_callback_ = lambda: None
 
+    # user api
+    @property
+    def push_lease(self):
+        return self.push_lease_
+
     # user api
     def get(self):
         assert self.inited_
         assert self.data_delivered_ == False
         self._Wait()
         self.data_delivered_ = True
+        if self.push_lease_ is not None:
+            # the job ran on inputs which failed to be produced
+            self.push_lease_.wait()
         return self._TrySyncAndGetResultNdarray(self.out_remote_blob_pullers_)
 
     # user api
@@ -84,7 +99,7 @@ class LazyFutureRemoteBlobs(FutureRemoteBlobs):
         assert self.inited_ == False
         assert isinstance(self.out_remote_blob_pullers_, list)
         assert len(self.out_remote_blob_pullers_) == 0
-        pullers = self._MakeRemoteBlobPullers(out_remote_blobs)
+        pullers = self._MakeRemoteBlobPullers(out_remote_blobs, self.out_, self.fetch_)
         self.out_remote_blob_pullers_ = pullers
         for puller in self._FlatConsistentBlobPullers(pullers):
             puller.AsyncPull(self._FinishCallback)
@@ -140,18 +155,46 @@ class LazyFutureRemoteBlobs(FutureRemoteBlobs):
         else:
             raise NotImplementedError
 
-    def _MakeRemoteBlobPullers(self, out_remote_blobs):
+    def _MakeRemoteBlobPullers(self, out_remote_blobs, out=None, fetch=True):
+        # fetch is a bool, or the fetched index or key, or indices or keys, of a
+        # list, tuple or dict
+        if isinstance(fetch, (str, int)) and not isinstance(fetch, bool):
+            fetch = (fetch,)
+        if fetch is False:
+            return _UnfetchedBlobPuller(self.session_)
         if isinstance(out_remote_blobs, remote_blob_util.ConsistentBlob):
-            return _ConsistentBlobPuller(out_remote_blobs, self.session_)
+            assert fetch is True, fetch
+            return _ConsistentBlobPuller(out_remote_blobs, self.session_, out=out)
         if isinstance(out_remote_blobs, remote_blob_util.MirroredBlob):
-            return _MirroredBlobPuller(out_remote_blobs, self.session_)
+            assert fetch is True, fetch
+            return _MirroredBlobPuller(out_remote_blobs, self.session_, out=out)
         if isinstance(out_remote_blobs, list) or isinstance(out_remote_blobs, tuple):
+            if out is None:
+                out = [None] * len(out_remote_blobs)
+            assert isinstance(out, (list, tuple))
+            assert len(out) == len(out_remote_blobs)
+            indices = range(len(out_remote_blobs))
+            if fetch is True:
+                fetch = indices
+            assert set(fetch) <= set(indices), "%s v.s. %s" % (fetch, indices)
             return type(out_remote_blobs)(
-                self._MakeRemoteBlobPullers(x) for x in out_remote_blobs
+                self._MakeRemoteBlobPullers(x, o, i in fetch)
+                for i, (x, o) in enumerate(zip(out_remote_blobs, out))
             )
         if isinstance(out_remote_blobs, dict):
+            if out is None:
+                out = {}
+            assert isinstance(out, dict)
+            assert set(out.keys()) <= set(out_remote_blobs.keys())
+            if fetch is True:
+                fetch = out_remote_blobs.keys()
+            assert set(fetch) <= set(out_remote_blobs.keys()), "%s v.s. %s" % (
+                fetch,
+                out_remote_blobs.keys(),
+            )
             return {
-                k: self._MakeRemoteBlobPullers(v) for k, v in out_remote_blobs.items()
+                k: self._MakeRemoteBlobPullers(v, out.get(k, None), k in fetch)
+                for k, v in out_remote_blobs.items()
             }
         raise NotImplementedError
 
@@ -169,10 +212,22 @@ class _BlobPuller(object):
 
 
 class _ConsistentBlobPuller(_BlobPuller):
-    def __init__(self, consistent_blob, session):
+    def __init__(self, consistent_blob, session, out=None):
         _BlobPuller.__init__(self, session)
         self.result_ = None
         self.consistent_blob_ = consistent_blob
+        if out is not None:
+            # checked here, the pull callback runs on a runtime thread
+            assert isinstance(out, np.ndarray), type(out)
+            assert out.flags.c_contiguous
+            assert not consistent_blob.is_tensor_list
+            shape = tuple(consistent_blob.shape)
+            assert out.shape == shape, "%s v.s. %s" % (out.shape, shape)
+            dtype = dtype_util.convert_oneflow_dtype_to_numpy_dtype(
+                consistent_blob.dtype
+            )
+            assert out.dtype == dtype, "%s v.s. %s" % (out.dtype, dtype)
+        self.out_ = out
 
     @property
     def result(self):
@@ -185,20 +240,47 @@ class _ConsistentBlobPuller(_BlobPuller):
     def AsyncPull(self, pull_cb):
         def PullCallback(of_blob):
             self.result_ = local_blob_util.MakeLocalBlob(
-                of_blob.CopyToNdarrayLists(), self.consistent_blob_
+                of_blob.CopyToNdarrayLists(self._GetNdarray), self.consistent_blob_
             )
             pull_cb()
 
         self.session_.AsyncPull(self.consistent_blob_.op_name, PullCallback)
 
+    def _GetNdarray(self, shape, dtype):
+        if self.out_ is None:
+            pool = host_buffer_pool.GetDefaultHostBufferPool()
+            return pool.Get(shape, dtype)
+        if self.out_.shape == shape:
+            return self.out_
+        # a dynamic blob is pulled into the leading elements of out
+        return self.out_.reshape(-1)[: int(np.prod(shape))].reshape(shape)
+
 
 class _MirroredBlobPuller(_BlobPuller):
-    def __init__(self, mirrored_blob, session):
+    def __init__(self, mirrored_blob, session, out=None):
         _BlobPuller.__init__(self, session)
         self.mirrored_blob_ = mirrored_blob
+        sub_blobs = mirrored_blob.sub_consistent_blob_list
+        self.concatenated_ = None
+        if out is None and _CanPullIntoConcatenated(mirrored_blob):
+            pool = host_buffer_pool.GetDefaultHostBufferPool()
+            out = pool.Get(
+                _ConcatenatedShape(sub_blobs),
+                dtype_util.convert_oneflow_dtype_to_numpy_dtype(mirrored_blob.dtype),
+            )
+        if isinstance(out, np.ndarray):
+            # pull each device into its rows of the concatenated ndarray
+            assert _CanPullIntoConcatenated(mirrored_blob)
+            self.concatenated_ = out
+            out = _SplitConcatenated(out, sub_blobs)
+        if out is None:
+            out = [None] * len(sub_blobs)
+        # one ndarray per device
+        assert isinstance(out, (list, tuple)), type(out)
+        assert len(out) == len(sub_blobs), "%s v.s. %s" % (len(out), len(sub_blobs))
         self.sub_pullers_ = tuple(
-            _ConsistentBlobPuller(x, self.session_)
-            for x in mirrored_blob.sub_consistent_blob_list
+            _ConsistentBlobPuller(x, self.session_, out=o)
+            for x, o in zip(sub_blobs, out)
         )
         self.local_mirrored_blob_ = None
 
@@ -208,7 +290,7 @@ class _MirroredBlobPuller(_BlobPuller):
             return self.local_mirrored_blob_
         local_blob_list = [x.result for x in self.sub_pullers_]
         self.local_mirrored_blob_ = local_blob_util.MergeLocalBlobs(
-            local_blob_list, self.mirrored_blob_
+            local_blob_list, self.mirrored_blob_, concatenated=self.concatenated_
         )
         return self.local_mirrored_blob_
 
@@ -217,6 +299,48 @@ class _MirroredBlobPuller(_BlobPuller):
             yield x
 
 
+class _UnfetchedBlobPuller(_BlobPuller):
+    def __init__(self, session):
+        _BlobPuller.__init__(self, session)
+
+    @property
+    def result(self):
+        return None
+
+    def FlatConsistentBlobPullers(self):
+        return iter(())
+
+
+def _CanPullIntoConcatenated(mirrored_blob):
+    return (
+        len(mirrored_blob.sub_consistent_blob_list) > 1
+        and mirrored_blob.batch_axis == 0
+        and not mirrored_blob.is_dynamic
+        and not mirrored_blob.is_tensor_list
+    )
+
+
+def _ConcatenatedShape(sub_blobs):
+    shapes = [sub_blob.shape for sub_blob in sub_blobs]
+    assert all(shape[1:] == shapes[0][1:] for shape in shapes), shapes
+    return (sum(shape[0] for shape in shapes),) + tuple(shapes[0][1:])
+
+
+def _SplitConcatenated(concatenated, sub_blobs):
+    assert concatenated.flags.c_contiguous
+    assert concatenated.shape == _ConcatenatedShape(sub_blobs), "%s v.s. %s" % (
+        concatenated.shape,
+        _ConcatenatedShape(sub_blobs),
+    )
+    shards = []
+    start = 0
+    for sub_blob in sub_blobs:
+        end = start + sub_blob.shape[0]
+        shards.append(concatenated[start:end])
+        start = end
+    return shards
+
+
 class EagerFutureRemoteBlobs(FutureRemoteBlobs):
     def __init__(self):
         super().__init__()
@@ -226,9 +350,18 @@ class EagerFutureRemoteBlobs(FutureRemoteBlobs):
         return self._GetResultLocalBlob(self.blob_getters_)
 
     def async_get(self, callback):
+        # callbacks run in the caller, they may fetch or run eager ops
         assert callable(callback)
         callback(self._GetResultLocalBlob(self.blob_getters_))
 
+    # user api
+    def __await__(self):
+        return self._AsyncResult().__await__()
+
+    def _AsyncResult(self):
+        assert self.inited_
+        return self._AsyncGetResultLocalBlob(self.blob_getters_)
+
     def SetResult(self, remote_blobs):
         assert self.inited_ is False
         assert self.blob_getters_ is None
@@ -259,6 +392,22 @@ class EagerFutureRemoteBlobs(FutureRemoteBlobs):
         else:
             raise NotImplementedError(type(getter))
 
+    def _AsyncGetResultLocalBlob(self, getter):
+        if isinstance(getter, _EagerBlobGetter):
+            return getter.AsyncResult()
+        elif isinstance(getter, (list, tuple)):
+            blob_type = type(getter)
+            futures = [self._AsyncGetResultLocalBlob(g) for g in getter]
+            return async_util.Then(async_util.Gather(futures), blob_type)
+        elif isinstance(getter, dict):
+            keys = list(getter.keys())
+            futures = [self._AsyncGetResultLocalBlob(getter[k]) for k in keys]
+            return async_util.Then(
+                async_util.Gather(futures), lambda blobs: dict(zip(keys, blobs))
+            )
+        else:
+            raise NotImplementedError(type(getter))
+
 
 class _EagerBlobGetter(object):
     def __init__(self, eager_blob):
@@ -273,3 +422,14 @@ class _EagerBlobGetter(object):
 
         self.local_tensor_ = local_blob_util.MakeLocalBlob4EagerBlob(self.eager_blob_)
         return self.local_tensor_
+
+    def AsyncResult(self):
+        if self.local_tensor_ is not None:
+            return async_util.DoneFuture(self.local_tensor_)
+
+        def SetLocalTensor(local_tensor):
+            self.local_tensor_ = local_tensor
+            return local_tensor
+
+        future = local_blob_util.AsyncMakeLocalBlob4EagerBlob(self.eager_blob_)
+        return async_util.Then(future, SetLocalTensor)
@@ -20,6 +20,7 @@ import oneflow.python.framework.input_blob_def as input_blob_def
 import oneflow.python.framework.dtype as dtype_util
 import oneflow.python.framework.python_callback as python_callback
 import oneflow.python.framework.balanced_splitter as balanced_splitter
+import oneflow.python.framework.host_buffer_pool as host_buffer_pool
 import oneflow.python.framework.remote_blob as remote_blob_util
 import oneflow.python.framework.id_util as id_util
 import oneflow.python.eager.vm_util as vm_util
@@ -28,16 +29,98 @@ import oneflow.python.eager.object as object_util
 import oneflow.core.operator.op_conf_pb2 as op_conf_util
 import oneflow.core.register.logical_blob_id_pb2 as logical_blob_id_util
 import numpy
+import threading
 from functools import reduce
 
 
-def AsyncPush(session, job_func, *arg):
+def AsyncPush(session, job_func, *arg, borrowed=False):
     assert len(arg) == len(job_func.__oneflow_input_blob_defs__)
+    push_lease = PushLease(borrowed, on_exception=session.AddFailedPushLease)
     for i in range(len(arg)):
-        _AsyncPushArg(session, job_func.__oneflow_input_blob_defs__[i], arg[i])
+        _AsyncPushArg(
+            session, job_func.__oneflow_input_blob_defs__[i], arg[i], push_lease
+        )
+    return push_lease
+
+
+class PushLease(object):
+    r"""Tracks the push jobs launched for one call of a lazy global function.
+
+    When `borrowed` is True, the ndarrays passed to the global function are not
+    copied on the python side and must not be mutated before `done()` is True.
+    `exception` is the first error raised while producing an input in a push job,
+    e.g. by the producer of `oneflow.data.Shards`. The input is left unfed, so
+    the job still runs, on whatever its input register held before. The error is
+    raised by `wait()`, by `get()` of the future of the call and, if neither has
+    raised it yet, by the next call of a lazy global function or by
+    `oneflow.sync_default_session()`.
+    """
+
+    def __init__(self, borrowed=False, on_exception=None):
+        self.borrowed_ = borrowed
+        self.on_exception_ = on_exception
+        self.cond_var_ = threading.Condition()
+        self.pending_push_cnt_ = 0
+        self.exception_ = None
+        self.exception_raised_ = False
+
+    @property
+    def borrowed(self):
+        return self.borrowed_
+
+    @property
+    def exception(self):
+        with self.cond_var_:
+            return self.exception_
+
+    def SetException(self, exception):
+        with self.cond_var_:
+            if self.exception_ is not None:
+                return
+            self.exception_ = exception
+        if self.on_exception_ is not None:
+            self.on_exception_(self)
+
+    def CheckException(self):
+        with self.cond_var_:
+            exception = self.exception_
+            self.exception_raised_ = exception is not None
+        if exception is not None:
+            raise exception
+
+    def CheckUnraisedException(self):
+        with self.cond_var_:
+            if self.exception_raised_:
+                return
+        self.CheckException()
+
+    def Acquire(self):
+        with self.cond_var_:
+            self.pending_push_cnt_ += 1
+        return self._Release
+
+    def done(self):
+        with self.cond_var_:
+            return self.pending_push_cnt_ == 0
+
+    def wait(self, timeout=None):
+        with self.cond_var_:
+            done = self.cond_var_.wait_for(
+                lambda: self.pending_push_cnt_ == 0, timeout=timeout
+            )
+        if done:
+            self.CheckException()
+        return done
+
+    def _Release(self):
+        with self.cond_var_:
+            assert self.pending_push_cnt_ > 0
+            self.pending_push_cnt_ -= 1
+            if self.pending_push_cnt_ == 0:
+                self.cond_var_.notify_all()
 
 
-def _AsyncPushArg(session, arg_blob_def, arg_ndarray):
+def _AsyncPushArg(session, arg_blob_def, arg_ndarray, push_lease):
     if isinstance(arg_blob_def, (list, tuple)):
         assert isinstance(arg_ndarray, (list, tuple)), "type(arg_ndarray): %s" % (
             type(arg_ndarray)
@@ -47,15 +130,15 @@ def _AsyncPushArg(session, arg_blob_def, arg_ndarray):
             len(arg_ndarray),
         )
         for blob_def, ndarray in zip(arg_blob_def, arg_ndarray):
-            _AsyncPushArg(session, blob_def, ndarray)
+            _AsyncPushArg(session, blob_def, ndarray, push_lease)
     elif isinstance(arg_blob_def, dict):
         assert type(arg_blob_def) is type(arg_ndarray)
         assert set(arg_blob_def.keys()) == set(arg_ndarray.keys())
         for k, blob_def in arg_blob_def.items():
-            _AsyncPushArg(session, blob_def, arg_ndarray[k])
+            _AsyncPushArg(session, blob_def, arg_ndarray[k], push_lease)
     else:
         assert isinstance(arg_blob_def, input_blob_def.ArgBlobDef)
-        arg_blob_def.CheckAndAsyncPush(session, arg_ndarray)
+        arg_blob_def.CheckAndAsyncPush(session, arg_ndarray, push_lease)
 
 
 def MakeEagerInputBlobs(arg_blob_def, arg_ndarray):
@@ -80,6 +163,9 @@ def MakeEagerInputBlobs(arg_blob_def, arg_ndarray):
 
 
 def _CheckInputArgBlobDefValueMatch(arg_blob_def, arg_value):
+    if isinstance(arg_value, input_blob_def.Shards):
+        # shards are checked when fed
+        return
     if isinstance(arg_blob_def, input_blob_def.FixedTensorDef):
         assert isinstance(arg_value, numpy.ndarray)
         assert arg_blob_def.shape == arg_value.shape
@@ -185,6 +271,8 @@ class FeedContext(object):
         self.rank_ = rank
 
     def GetFixedTensor(self, logical_shape):
+        if isinstance(self.arg_ndarray_, input_blob_def.Shards):
+            return self._GetFixedTensorShard(logical_shape)
         assert isinstance(self.arg_ndarray_, numpy.ndarray)
         assert self.arg_ndarray_.shape == logical_shape, "%s v.s. %s" % (
             self.arg_ndarray_.shape,
@@ -204,6 +292,28 @@ class FeedContext(object):
         else:
             raise NotImplementedError
 
+    def _GetFixedTensorShard(self, logical_shape):
+        sbp_parallel = self.op_arg_parallel_attr_.sbp_parallel
+        parallel_num = self.op_arg_parallel_attr_.parallel_desc_symbol.parallel_num
+        shard_shape = logical_shape
+        if sbp_parallel.HasField("broadcast_parallel") or parallel_num == 1:
+            pass
+        elif sbp_parallel.HasField("split_parallel"):
+            axis = sbp_parallel.split_parallel.axis
+            start, end = self._GetBalancedRanges(logical_shape[axis])[self.rank_]
+            shard_shape = list(logical_shape)
+            shard_shape[axis] = end - start
+            shard_shape = tuple(shard_shape)
+        else:
+            raise NotImplementedError
+        ndarray = self.arg_ndarray_.Get(self.rank_)
+        assert isinstance(ndarray, numpy.ndarray)
+        assert ndarray.shape == shard_shape, "%s v.s. %s" % (
+            ndarray.shape,
+            shard_shape,
+        )
+        return self._AsContiguousNdArray(ndarray)
+
     def _GetBalancedRanges(self, dim):
         parallel_num = self.op_arg_parallel_attr_.parallel_desc_symbol.parallel_num
         if self.balanced_range_ is None:
@@ -212,25 +322,37 @@ class FeedContext(object):
 
     def GetMirroredTensor(self, static_shape):
         capacity = reduce(lambda x, y: x * y, static_shape, 1)
-        assert isinstance(self.arg_ndarray_, (list, tuple))
         parallel_num = self.op_arg_parallel_attr_.parallel_desc_symbol.parallel_num
-        assert len(self.arg_ndarray_) == parallel_num
-        assert all(isinstance(a, numpy.ndarray) for a in self.arg_ndarray_)
         assert self.rank_ >= 0
         assert self.rank_ < parallel_num
-        ndarray = self.arg_ndarray_[self.rank_]
+        if isinstance(self.arg_ndarray_, input_blob_def.Shards):
+            ndarray = self.arg_ndarray_.Get(self.rank_)
+            assert isinstance(ndarray, numpy.ndarray)
+            assert len(ndarray.shape) == len(static_shape), "%s v.s. %s" % (
+                ndarray.shape,
+                static_shape,
+            )
+        else:
+            assert isinstance(self.arg_ndarray_, (list, tuple))
+            assert len(self.arg_ndarray_) == parallel_num
+            assert all(isinstance(a, numpy.ndarray) for a in self.arg_ndarray_)
+            ndarray = self.arg_ndarray_[self.rank_]
         elem_cnt = reduce(lambda x, y: x * y, ndarray.shape, 1)
         assert elem_cnt <= capacity, "%s v.s. %s" % (ndarray.shape, static_shape)
         return self._AsContiguousNdArray(ndarray)
 
     def GetMirroredTensorList(self, static_shape):
-        assert isinstance(self.arg_ndarray_, (list, tuple))
         parallel_num = self.op_arg_parallel_attr_.parallel_desc_symbol.parallel_num
         assert self.rank_ >= 0
         assert self.rank_ < parallel_num
-        assert len(self.arg_ndarray_) == parallel_num
-        assert all(isinstance(a, (list, tuple)) for a in self.arg_ndarray_)
-        ndarray_list = self.arg_ndarray_[self.rank_]
+        if isinstance(self.arg_ndarray_, input_blob_def.Shards):
+            ndarray_list = self.arg_ndarray_.Get(self.rank_)
+            assert isinstance(ndarray_list, (list, tuple))
+        else:
+            assert isinstance(self.arg_ndarray_, (list, tuple))
+            assert len(self.arg_ndarray_) == parallel_num
+            assert all(isinstance(a, (list, tuple)) for a in self.arg_ndarray_)
+            ndarray_list = self.arg_ndarray_[self.rank_]
         assert all(isinstance(arr, numpy.ndarray) for arr in ndarray_list)
         capacity = numpy.prod(static_shape)
         assert all(numpy.prod(arr.shape) <= capacity for arr in ndarray_list)
@@ -238,9 +360,12 @@ class FeedContext(object):
 
     def _AsContiguousNdArray(self, ndarray):
         if isinstance(ndarray, numpy.ndarray):
-            return (
-                ndarray if ndarray.data.contiguous else numpy.ascontiguousarray(ndarray)
-            )
+            if ndarray.data.contiguous:
+                return ndarray
+            pool = host_buffer_pool.GetDefaultHostBufferPool()
+            contiguous = pool.Get(ndarray.shape, ndarray.dtype)
+            numpy.copyto(contiguous, ndarray)
+            return contiguous
         elif isinstance(ndarray, (tuple, list)):
             return type(ndarray)(self._AsContiguousNdArray(a) for a in ndarray)
         else:
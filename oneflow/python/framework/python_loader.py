@@ -0,0 +1,365 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import functools
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+import oneflow.python.framework.dtype as dtype_util
+import oneflow.python.framework.session_context as session_ctx
+import oneflow.python.framework.typing as oft
+from oneflow.python.oneflow_export import oneflow_export
+
+
+@oneflow_export("data.PythonLoader")
+class PythonLoader(object):
+    r"""Feed a global function with batches loaded by python workers ahead of time.
+
+    Samples are loaded by `dataset[index]` and `transform` in a thread pool, or
+    in a process pool if `use_processes` is True, and collated into preallocated
+    contiguous batches. At most `prefetch` batches are loaded ahead of the one
+    being fed.
+
+    A sample is a numpy.ndarray, or a tuple of them with one ndarray per
+    parameter of `job_func`. Parameters must be annotated with
+    `oneflow.typing.Numpy.Placeholder` or `oneflow.typing.ListNumpy.Placeholder`
+    sharing the batch size on axis 0, and the last incomplete batch is dropped.
+    A `ListNumpy` parameter is fed the whole batch, so it must be placed on one
+    device.
+
+    For instance::
+
+        @flow.global_function()
+        def train(
+            images: tp.Numpy.Placeholder((32, 1, 28, 28)),
+            labels: tp.Numpy.Placeholder((32,), dtype=flow.int32),
+        ):
+            # your network
+
+        loader = flow.data.PythonLoader(train, dataset, transform=augment)
+        for epoch in range(10):
+            loader.run()
+        print(loader.stats())
+
+    Args:
+        job_func (Callable): a global function
+        dataset (Any): an object supporting `len(dataset)` and `dataset[index]`
+        sampler (Optional[Iterable[int]], optional): indices of samples of an epoch. Defaults to range(len(dataset)).
+        transform (Optional[Callable], optional): applied to every sample. Defaults to None.
+        num_workers (int, optional): number of loading workers. Defaults to 4.
+        use_processes (bool, optional): load samples in processes. Defaults to False.
+        prefetch (int, optional): number of batches loaded ahead. Defaults to 2.
+    """
+
+    def __init__(
+        self,
+        job_func: Callable,
+        dataset: Any,
+        sampler: Optional[Iterable[int]] = None,
+        transform: Optional[Callable] = None,
+        num_workers: int = 4,
+        use_processes: bool = False,
+        prefetch: int = 2,
+    ) -> None:
+        assert num_workers > 0
+        assert prefetch > 0
+        self.job_func_ = job_func
+        self.dataset_ = dataset
+        self.sampler_ = sampler
+        self.transform_ = transform
+        self.num_workers_ = num_workers
+        self.use_processes_ = use_processes
+        self.arg_specs_ = _GetArgSpecs(job_func)
+        self.batch_size_ = self.arg_specs_[0].shape[0]
+        # one slot is being consumed and another may still be fed from
+        self.slots_ = [_BatchSlot(self.arg_specs_) for _ in range(prefetch + 2)]
+        self.executor_ = None
+        self.stats_ = _LoaderStats()
+
+    @property
+    def batch_size(self) -> int:
+        return self.batch_size_
+
+    def __iter__(self):
+        self._CheckMirroredArgs()
+        self._TryInitExecutor()
+        ready_slots = queue.Queue()
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._Produce, args=(ready_slots, stop), daemon=True
+        )
+        producer.start()
+        self.stats_.StartEpoch()
+        try:
+            while True:
+                start = time.perf_counter()
+                slot = ready_slots.get()
+                self.stats_.AddWaitTime(time.perf_counter() - start)
+                if slot is None:
+                    return
+                if isinstance(slot, BaseException):
+                    raise slot
+                slot.queued = False
+                self.stats_.AddBatch(self.batch_size_)
+                yield slot.MakeArgs()
+        finally:
+            stop.set()
+            producer.join()
+            self.stats_.StopEpoch()
+            for slot in self.slots_:
+                slot.queued = False
+
+    def run(
+        self, max_steps: Optional[int] = None, callback: Optional[Callable] = None
+    ) -> int:
+        r"""Call `job_func` with every batch of an epoch.
+
+        Args:
+            max_steps (Optional[int], optional): stop after `max_steps` calls. Defaults to None.
+            callback (Optional[Callable], optional): called with the result of every call. Defaults to None.
+
+        Returns:
+            int: the number of calls
+        """
+        if max_steps is not None and max_steps <= 0:
+            return 0
+        step = 0
+        for args in self:
+            ret = self.job_func_(*args)
+            if callback is not None:
+                callback(ret)
+            step += 1
+            # stop before the next batch is taken and counted
+            if max_steps is not None and step >= max_steps:
+                break
+        return step
+
+    def stats(self) -> Dict[str, float]:
+        r"""Returns throughput statistics of all epochs.
+
+        `wait_seconds` is the time spent waiting for batches, and `load_seconds`
+        the time spent loading and collating them.
+        """
+        return self.stats_.ToDict()
+
+    def close(self) -> None:
+        if self.executor_ is not None:
+            self.executor_.shutdown()
+            self.executor_ = None
+
+    def _CheckMirroredArgs(self):
+        if not any(spec.is_mirrored for spec in self.arg_specs_):
+            return
+        session_ctx.GetDefaultSession().TryInit()
+        # lazy global functions know their devices once the session is inited
+        blob_defs = getattr(self.job_func_, "__oneflow_input_blob_defs__", ())
+        for spec, blob_def in zip(self.arg_specs_, blob_defs):
+            if not spec.is_mirrored:
+                continue
+            parallel_num = len(getattr(blob_def, "sub_consistent_blob_list_", ()))
+            assert parallel_num <= 1, (
+                "a ListNumpy parameter of PythonLoader must be placed on one device, "
+                "got %s" % parallel_num
+            )
+
+    def _TryInitExecutor(self):
+        if self.executor_ is not None:
+            return
+        if self.use_processes_:
+            self.executor_ = ProcessPoolExecutor(
+                max_workers=self.num_workers_,
+                initializer=_InitWorkerProcess,
+                initargs=(self.dataset_, self.transform_),
+            )
+            self.load_sample_ = _LoadSampleInWorkerProcess
+        else:
+            self.executor_ = ThreadPoolExecutor(max_workers=self.num_workers_)
+            self.load_sample_ = functools.partial(
+                _LoadSample, self.dataset_, self.transform_
+            )
+
+    def _Produce(self, ready_slots, stop):
+        try:
+            for indices in self._BatchIndices():
+                slot = self._AcquireIdleSlot(stop)
+                if slot is None:
+                    return
+                start = time.perf_counter()
+                chunksize = max(len(indices) // (self.num_workers_ * 4), 1)
+                samples = self.executor_.map(
+                    self.load_sample_, indices, chunksize=chunksize
+                )
+                for i, sample in enumerate(samples):
+                    slot.Collate(i, sample)
+                self.stats_.AddLoadTime(time.perf_counter() - start)
+                slot.queued = True
+                ready_slots.put(slot)
+            ready_slots.put(None)
+        except BaseException as e:
+            ready_slots.put(e)
+
+    def _BatchIndices(self):
+        sampler = self.sampler_
+        if sampler is None:
+            sampler = range(len(self.dataset_))
+        indices = []
+        for index in sampler:
+            indices.append(index)
+            if len(indices) == self.batch_size_:
+                yield indices
+                indices = []
+
+    def _AcquireIdleSlot(self, stop):
+        # a slot is reused once nobody, e.g. a pending push, refers to its ndarrays
+        while not stop.is_set():
+            for slot in self.slots_:
+                if not slot.queued and slot.IsIdle():
+                    return slot
+            stop.wait(0.001)
+        return None
+
+
+class _ArgSpec(object):
+    def __init__(self, shape, dtype, is_mirrored):
+        self.shape = shape
+        self.dtype = dtype
+        self.is_mirrored = is_mirrored
+
+
+class _BatchSlot(object):
+    def __init__(self, arg_specs):
+        self.arg_specs_ = arg_specs
+        self.ndarrays_ = [np.empty(spec.shape, dtype=spec.dtype) for spec in arg_specs]
+        self.queued = False
+
+    def Collate(self, i, sample):
+        if not isinstance(sample, tuple):
+            sample = (sample,)
+        assert len(sample) == len(self.ndarrays_), "%s v.s. %s" % (
+            len(sample),
+            len(self.ndarrays_),
+        )
+        for ndarray, value in zip(self.ndarrays_, sample):
+            ndarray[i] = value
+
+    def MakeArgs(self):
+        return tuple(
+            [ndarray] if spec.is_mirrored else ndarray
+            for spec, ndarray in zip(self.arg_specs_, self.ndarrays_)
+        )
+
+    def IsIdle(self):
+        # referred only by `ndarrays_` and the argument of sys.getrefcount
+        ndarrays = self.ndarrays_
+        return all(sys.getrefcount(ndarrays[i]) == 2 for i in range(len(ndarrays)))
+
+
+class _LoaderStats(object):
+    def __init__(self):
+        self.lock_ = threading.Lock()
+        self.batch_cnt_ = 0
+        self.sample_cnt_ = 0
+        self.wait_seconds_ = 0.0
+        self.load_seconds_ = 0.0
+        self.elapsed_seconds_ = 0.0
+        self.epoch_start_ = None
+
+    def StartEpoch(self):
+        self.epoch_start_ = time.perf_counter()
+
+    def StopEpoch(self):
+        self.elapsed_seconds_ += time.perf_counter() - self.epoch_start_
+        self.epoch_start_ = None
+
+    def AddBatch(self, batch_size):
+        self.batch_cnt_ += 1
+        self.sample_cnt_ += batch_size
+
+    def AddWaitTime(self, seconds):
+        self.wait_seconds_ += seconds
+
+    def AddLoadTime(self, seconds):
+        with self.lock_:
+            self.load_seconds_ += seconds
+
+    def ToDict(self):
+        elapsed_seconds = self.elapsed_seconds_
+        if self.epoch_start_ is not None:
+            elapsed_seconds += time.perf_counter() - self.epoch_start_
+        samples_per_second = 0.0
+        if elapsed_seconds > 0:
+            samples_per_second = self.sample_cnt_ / elapsed_seconds
+        return dict(
+            batch_cnt=self.batch_cnt_,
+            sample_cnt=self.sample_cnt_,
+            samples_per_second=samples_per_second,
+            wait_seconds=self.wait_seconds_,
+            load_seconds=self.load_seconds_,
+        )
+
+
+def _GetArgSpecs(job_func):
+    parameters = job_func.__oneflow_function_signature__.parameters
+    assert len(parameters) > 0, "%s has no parameter to feed" % job_func.__name__
+    arg_specs = []
+    for name, parameter in parameters.items():
+        annotation = parameter.annotation
+        if oft.OriginFrom(annotation, oft.NumpyDef):
+            is_mirrored = False
+        elif oft.OriginFrom(annotation, oft.ListOfNumpyDef):
+            is_mirrored = True
+        else:
+            raise NotImplementedError(
+                "parameter %s: only oneflow.typing.Numpy.Placeholder and "
+                "oneflow.typing.ListNumpy.Placeholder are supported" % name
+            )
+        assert annotation.batch_axis == 0, "parameter %s: batch_axis %s" % (
+            name,
+            annotation.batch_axis,
+        )
+        dtype = dtype_util.convert_oneflow_dtype_to_numpy_dtype(annotation.dtype)
+        arg_specs.append(_ArgSpec(annotation.shape, dtype, is_mirrored))
+    batch_sizes = set(spec.shape[0] for spec in arg_specs)
+    assert len(batch_sizes) == 1, "batch sizes of parameters: %s" % batch_sizes
+    return arg_specs
+
+
+def _LoadSample(dataset, transform, index):
+    sample = dataset[index]
+    if transform is not None:
+        sample = transform(sample)
+    return sample
+
+
+def _InitWorkerProcess(dataset, transform):
+    global _worker_dataset, _worker_transform
+    _worker_dataset = dataset
+    _worker_transform = transform
+
+
+def _LoadSampleInWorkerProcess(index):
+    return _LoadSample(_worker_dataset, _worker_transform, index)
+
+
+_worker_dataset = None
+_worker_transform = None
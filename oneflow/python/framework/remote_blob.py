@@ -18,6 +18,7 @@ from __future__ import absolute_import
 import oneflow
 import oneflow.python.framework.blob_desc as blob_desc
 import oneflow.python.framework.c_api_util as c_api_util
+import oneflow.python.framework.lazy_blob_desc_cache as lazy_blob_desc_cache
 import oneflow.python.framework.placement_context as placement_ctx
 import oneflow.python.framework.blob_trait as blob_trait
 from oneflow.python.framework.dtype import convert_proto_dtype_to_oneflow_dtype
@@ -31,6 +32,7 @@ import oneflow.python.eager.vm_util as vm_util
 import oneflow.python.eager.gradient_util as gradient_util
 import oneflow.python.eager.boxing_util as boxing_util
 import oneflow.python.framework.op_arg_util as op_arg_util
+import oneflow.python.lib.core.async_util as async_util
 import oneflow.core.job.placement_pb2 as placement_pb
 import traceback
 import sys
@@ -115,7 +117,7 @@ class ConsistentBlob(BlobDef):
 class LazyConsistentBlob(ConsistentBlob):
     def __init__(self, lbi, **kw):
         ConsistentBlob.__init__(self, lbi, **kw)
-        self.job_name_ = c_api_util.JobBuildAndInferCtx_GetCurrentJobName()
+        self.blob_desc_ = lazy_blob_desc_cache.GetBlobDesc(self.job_name_, self.lbn_)
 
     @property
     def shape(self):
@@ -127,27 +129,35 @@ class LazyConsistentBlob(ConsistentBlob):
                 file=sys.stderr,
             )
             print(traceback.format_stack()[-2])
-        return c_api_util.JobBuildAndInferCtx_GetStaticShape(self.job_name_, self.lbn_)
+        return _GetBlobDescAttr(
+            self, "shape", c_api_util.JobBuildAndInferCtx_GetStaticShape
+        )
 
     @property
     def dtype(self):
         return convert_proto_dtype_to_oneflow_dtype(
-            c_api_util.JobBuildAndInferCtx_GetDataType(self.job_name_, self.lbn_)
+            _GetBlobDescAttr(self, "dtype", c_api_util.JobBuildAndInferCtx_GetDataType)
         )
 
     @property
     def batch_axis(self):
-        return c_api_util.JobBuildAndInferCtx_GetBatchAxis(self.job_name_, self.lbn_)
+        return _GetBlobDescAttr(
+            self, "batch_axis", c_api_util.JobBuildAndInferCtx_GetBatchAxis
+        )
 
     @property
     def split_axis(self):
-        return c_api_util.JobBuildAndInferCtx_GetSplitAxisFromProducerView(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self,
+            "split_axis",
+            c_api_util.JobBuildAndInferCtx_GetSplitAxisFromProducerView,
         )
 
     @property
     def is_dynamic(self):
-        return c_api_util.JobBuildAndInferCtx_IsDynamic(self.job_name_, self.lbn_)
+        return _GetBlobDescAttr(
+            self, "is_dynamic", c_api_util.JobBuildAndInferCtx_IsDynamic
+        )
 
     @property
     def disable_boxing(self):
@@ -155,7 +165,9 @@ class LazyConsistentBlob(ConsistentBlob):
 
     @property
     def is_tensor_list(self):
-        return c_api_util.JobBuildAndInferCtx_IsTensorList(self.job_name_, self.lbn_)
+        return _GetBlobDescAttr(
+            self, "is_tensor_list", c_api_util.JobBuildAndInferCtx_IsTensorList
+        )
 
     @property
     def parallel_conf(self):
@@ -184,7 +196,9 @@ class MirroredBlob(BlobDef):
 class LazyMirroredBlob(MirroredBlob):
     def __init__(self, lbi, **kw):
         MirroredBlob.__init__(self, lbi, **kw)
-        self.job_name_ = c_api_util.JobBuildAndInferCtx_GetCurrentJobName()
+        self.blob_desc_ = lazy_blob_desc_cache.GetBlobDesc(
+            self.job_name_, self.lbn_, is_mirrored=True
+        )
         self.sub_consistent_blob_list_ = []
         lbn = self.logical_blob_name
         num_sub_lbi = c_api_util.JobBuildAndInferCtx_MirroredBlobGetNumSubLbi(
@@ -211,34 +225,36 @@ class LazyMirroredBlob(MirroredBlob):
                 file=sys.stderr,
             )
             print(traceback.format_stack()[-2])
-        return c_api_util.JobBuildAndInferCtx_MirroredBlobGetStaticShape(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self, "shape", c_api_util.JobBuildAndInferCtx_MirroredBlobGetStaticShape
         )
 
     @property
     def dtype(self):
         return convert_proto_dtype_to_oneflow_dtype(
-            c_api_util.JobBuildAndInferCtx_MirroredBlobGetDataType(
-                self.job_name_, self.lbn_
+            _GetBlobDescAttr(
+                self, "dtype", c_api_util.JobBuildAndInferCtx_MirroredBlobGetDataType
             )
         )
 
     @property
     def batch_axis(self):
-        return c_api_util.JobBuildAndInferCtx_MirroredBlobGetBatchAxis(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self, "batch_axis", c_api_util.JobBuildAndInferCtx_MirroredBlobGetBatchAxis
         )
 
     @property
     def split_axis(self):
-        return c_api_util.JobBuildAndInferCtx_MirroredBlobGetSplitAxisFromProducerView(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self,
+            "split_axis",
+            c_api_util.JobBuildAndInferCtx_MirroredBlobGetSplitAxisFromProducerView,
         )
 
     @property
     def is_dynamic(self):
-        return c_api_util.JobBuildAndInferCtx_MirroredBlobIsDynamic(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self, "is_dynamic", c_api_util.JobBuildAndInferCtx_MirroredBlobIsDynamic
         )
 
     @property
@@ -247,8 +263,10 @@ class LazyMirroredBlob(MirroredBlob):
 
     @property
     def is_tensor_list(self):
-        return c_api_util.JobBuildAndInferCtx_MirroredBlobIsTensorList(
-            self.job_name_, self.lbn_
+        return _GetBlobDescAttr(
+            self,
+            "is_tensor_list",
+            c_api_util.JobBuildAndInferCtx_MirroredBlobIsTensorList,
         )
 
     @property
@@ -258,6 +276,13 @@ class LazyMirroredBlob(MirroredBlob):
         )
 
 
+def _GetBlobDescAttr(blob, key, GetAttr):
+    blob_desc = blob.blob_desc_
+    if key not in blob_desc:
+        blob_desc[key] = GetAttr(blob.job_name_, blob.lbn_)
+    return blob_desc[key]
+
+
 class EagerBlobTrait(object):
     def numpy_size(self):
         return self.blob_object.parallel_desc_symbol.parallel_num
@@ -289,6 +314,35 @@ class EagerBlobTrait(object):
             assert len(mirrored_list) == parallel_num
             return mirrored_list[rank]
 
+    def async_numpy(self, rank=None):
+        r"""Returns an awaitable future of `numpy(rank)`.
+
+        The fetch is only enqueued, so the caller may go on dispatching ops. The
+        future is resolved on the vm callback thread and can be waited by
+        `result()` or awaited in asyncio.
+        """
+        if rank is None:
+            if self.numpy_size() == 1:
+                return self._AsyncNumpyAt(0)
+            else:
+                assert not self.is_dynamic
+                assert not self.is_tensor_list
+                return self._AsyncNumpy()
+        else:
+            return self._AsyncNumpyAt(rank)
+
+    def async_numpy_list(self, rank=None):
+        r"""Returns an awaitable future of `numpy_list(rank)`."""
+        assert self.is_tensor_list
+        assert self.is_dynamic
+        future = self._AsyncNumpyMirroredList()
+        if rank is None:
+            return future
+        parallel_num = self.blob_object.parallel_desc_symbol.parallel_num
+        assert rank >= 0
+        assert rank < parallel_num
+        return async_util.Then(future, lambda mirrored_list: mirrored_list[rank])
+
     @property
     def sub_consistent_blob_list(self):
         raise NotImplementedError
@@ -360,53 +414,62 @@ class EagerBlobTrait(object):
         ndarray_list = self._NumpyMirroredList()
         return ndarray_list[rank]
 
+    def _AsyncNumpyAt(self, rank):
+        assert self.is_tensor_list is not True
+        assert rank >= 0
+        assert rank < self.blob_object.parallel_desc_symbol.parallel_num
+        future = self._AsyncNumpyMirroredList()
+        return async_util.Then(future, lambda ndarray_list: ndarray_list[rank])
+
     def _Numpy(self):
         assert self.is_tensor_list is not True
 
         def FetchBlobNumpy(blob_object):
-            consistent_blob_name = None
-
-            def BoxingToSingleDevice(builder):
-                parallel_conf = placement_pb.ParallelConf()
-                parallel_conf.device_tag = blob_object.parallel_desc_symbol.device_tag
-                parallel_conf.device_name.append("{}:{}".format(0, 0))
-                tmp_parallel_desc_symbol = builder.GetParallelDescSymbol(parallel_conf)
-                tmp_op_arg_parallel_attr = op_arg_util.OpArgParallelAttribute(
-                    tmp_parallel_desc_symbol,
-                    blob_object.op_arg_parallel_attr.sbp_parallel,
-                    blob_object.op_arg_parallel_attr.opt_mirrored_parallel,
-                )
-                with oneflow.scope.placement(
-                    self.parallel_conf.device_tag, list(self.parallel_conf.device_name)
-                ):
-                    tmp_blob_object = boxing_util.BoxingTo(
-                        builder, blob_object, tmp_op_arg_parallel_attr
-                    )
-                nonlocal consistent_blob_name
-                consistent_blob_name = "{}-consistent".format(self.logical_blob_name)
-                if not blob_register.HasObject4BlobName(consistent_blob_name):
-                    blob_register.SetObject4BlobName(
-                        consistent_blob_name, tmp_blob_object
-                    )
-
-            vm_util.LogicalRun(BoxingToSingleDevice)
+            consistent_blob_name = self._BoxingToSingleDevice(blob_object)
             return eager_blob_util.EagerPhysicalBlob(consistent_blob_name).numpy()
 
         blob_cache = blob_cache_util.FindOrCreateBlobCache(self.blob_object)
         return blob_cache.GetCachedNumpy(FetchBlobNumpy)
 
-    def _NumpyMirroredList(self):
-        physical_blob_objects = []
+    def _AsyncNumpy(self):
+        assert self.is_tensor_list is not True
 
-        def UnpackLogicalBlobToPhysicalBlobs(builder):
-            nonlocal physical_blob_objects
-            physical_blob_objects = builder.UnpackLogicalBlobToPhysicalBlobs(
-                self.blob_object
+        def AsyncFetchBlobNumpy(blob_object):
+            consistent_blob_name = self._BoxingToSingleDevice(blob_object)
+            return eager_blob_util.EagerPhysicalBlob(consistent_blob_name).async_body()
+
+        blob_cache = blob_cache_util.FindOrCreateBlobCache(self.blob_object)
+        return blob_cache.GetCachedNumpyFuture(AsyncFetchBlobNumpy)
+
+    def _BoxingToSingleDevice(self, blob_object):
+        consistent_blob_name = None
+
+        def BoxingToSingleDevice(builder):
+            parallel_conf = placement_pb.ParallelConf()
+            parallel_conf.device_tag = blob_object.parallel_desc_symbol.device_tag
+            parallel_conf.device_name.append("{}:{}".format(0, 0))
+            tmp_parallel_desc_symbol = builder.GetParallelDescSymbol(parallel_conf)
+            tmp_op_arg_parallel_attr = op_arg_util.OpArgParallelAttribute(
+                tmp_parallel_desc_symbol,
+                blob_object.op_arg_parallel_attr.sbp_parallel,
+                blob_object.op_arg_parallel_attr.opt_mirrored_parallel,
             )
+            with oneflow.scope.placement(
+                self.parallel_conf.device_tag, list(self.parallel_conf.device_name)
+            ):
+                tmp_blob_object = boxing_util.BoxingTo(
+                    builder, blob_object, tmp_op_arg_parallel_attr
+                )
+            nonlocal consistent_blob_name
+            consistent_blob_name = "{}-consistent".format(self.logical_blob_name)
+            if not blob_register.HasObject4BlobName(consistent_blob_name):
+                blob_register.SetObject4BlobName(consistent_blob_name, tmp_blob_object)
 
-        def GetPhyBlobNumpy(i, phy_blob_object):
-            name = "{}/{}".format(self.logical_blob_name, i)
-            blob_register.SetObject4BlobName(name, phy_blob_object)
+        vm_util.LogicalRun(BoxingToSingleDevice)
+        return consistent_blob_name
+
+    def _NumpyMirroredList(self):
+        def GetPhyBlobNumpy(name):
             return (
                 eager_blob_util.EagerPhysicalBlob(name).numpy_list()
                 if self.is_tensor_list
@@ -414,15 +477,41 @@ class EagerBlobTrait(object):
             )
 
         def FetchBlobNumpyMirroredList(blob_object):
-            vm_util.LogicalRun(UnpackLogicalBlobToPhysicalBlobs)
-            return [
-                GetPhyBlobNumpy(i, phy_blob_object)
-                for i, phy_blob_object in enumerate(physical_blob_objects)
-            ]
+            return [GetPhyBlobNumpy(name) for name in self._UnpackToPhysicalBlobs()]
 
         blob_cache = blob_cache_util.FindOrCreateBlobCache(self.blob_object)
         return blob_cache.GetCachedNumpyMirroredList(FetchBlobNumpyMirroredList)
 
+    def _AsyncNumpyMirroredList(self):
+        def AsyncFetchBlobNumpyMirroredList(blob_object):
+            return async_util.Gather(
+                eager_blob_util.EagerPhysicalBlob(name).async_body()
+                for name in self._UnpackToPhysicalBlobs()
+            )
+
+        blob_cache = blob_cache_util.FindOrCreateBlobCache(self.blob_object)
+        return blob_cache.GetCachedNumpyMirroredListFuture(
+            AsyncFetchBlobNumpyMirroredList
+        )
+
+    def _UnpackToPhysicalBlobs(self):
+        # returns the names physical blob objects are registered with
+        physical_blob_objects = []
+
+        def UnpackLogicalBlobToPhysicalBlobs(builder):
+            nonlocal physical_blob_objects
+            physical_blob_objects = builder.UnpackLogicalBlobToPhysicalBlobs(
+                self.blob_object
+            )
+
+        vm_util.LogicalRun(UnpackLogicalBlobToPhysicalBlobs)
+        names = []
+        for i, phy_blob_object in enumerate(physical_blob_objects):
+            name = "{}/{}".format(self.logical_blob_name, i)
+            blob_register.SetObject4BlobName(name, phy_blob_object)
+            names.append(name)
+        return names
+
     def IdenticalTo(self, rhs):
         return (
             self.blob_object.op_arg_blob_attr == rhs.blob_object.op_arg_blob_attr
@@ -29,6 +29,12 @@ def GetDefaultSession():
     return _default_session
 
 
+def DefaultSessionStatus():
+    if _default_session is None:
+        return None
+    return _default_session.status
+
+
 def OpenDefaultSession(sess):
     global _default_session
     assert _default_session is None
@@ -16,22 +16,28 @@ limitations under the License.
 from __future__ import absolute_import
 
 import threading
+import numpy as np
 from oneflow.core.job.job_set_pb2 import ConfigProto
 import oneflow.core.vm.instruction_pb2 as instr_util
 import oneflow.core.eager.eager_symbol_pb2 as eager_symbol_util
 import oneflow.core.job.job_set_pb2 as job_set_util
 import oneflow.core.job.job_conf_pb2 as job_conf_pb
 import oneflow.python.framework.c_api_util as c_api_util
+import oneflow.python.framework.compile_cache as compile_cache_util
 import oneflow.python.framework.compiler as compiler
 import oneflow.python.framework.config_util as config_util
 import oneflow.python.framework.env_util as env_util
+import oneflow.python.framework.typing as oft
 import oneflow.python.framework.typing_util as oft_util
 import oneflow.python.framework.hob as hob
+import oneflow.python.framework.inflight_window as inflight_window_util
 import oneflow.python.framework.job_instance as job_instance_util
+import oneflow.python.framework.local_blob as local_blob_util
 import oneflow.python.framework.push_util as push_util
 import oneflow.python.framework.session_context as session_ctx
 import oneflow.python.lib.core.enable_if as enable_if
 import oneflow.python.eager.vm_util as vm_util
+import oneflow.python.eager.trace_util as trace_util
 from oneflow.core.job.job_set_pb2 import ConfigProto
 from oneflow.python.framework.function_desc import FunctionDesc
 import oneflow.python.framework.module as module_util
@@ -54,12 +60,19 @@ import traceback
 class Session(object):
     def __init__(self):
         self.job_name2function_desc_ = {}
+        self.job_name2inflight_window_ = {}
+        self.job_name2lazy_call_cnt_ = {}
+        self.job_name2eager_trace_cache_ = {}
         self.status_ = SessionStatus.OPEN
         self.cond_var_ = threading.Condition()
         self.running_job_cnt_ = 0
+        self.failed_push_lease_lock_ = threading.Lock()
+        self.failed_push_leases_ = []
         self.inter_user_job_info_ = None
         self.uuid2watch_handler_ = {}
         self.config_proto_ = None
+        self.compile_cache_dir_ = None
+        self.compile_cache_ = None
         self.placement_scope_stack_ = []
         self.is_mirrored_strategy_enabled_stack_ = []
         self.function_flag_name2default_val_ = {}
@@ -93,6 +106,18 @@ class Session(object):
             self.config_proto_ = _GetDefaultConfigProto()
         return self.config_proto_
 
+    @property
+    def compile_cache_dir(self):
+        return self.compile_cache_dir_
+
+    @compile_cache_dir.setter
+    def compile_cache_dir(self, val):
+        self.compile_cache_dir_ = val
+
+    @property
+    def compile_cache(self):
+        return self.compile_cache_
+
     @property
     def uuid2watch_handler(self):
         return self.uuid2watch_handler_
@@ -212,6 +237,10 @@ class Session(object):
         _TryCompleteConfigProto(self.config_proto)
         c_api_util.InitGlobalSession(self.config_proto)
         if not c_api_util.EagerExecutionEnabled():
+            if self.compile_cache_dir_ is not None:
+                self.compile_cache_ = compile_cache_util.CompileCache(
+                    self.compile_cache_dir_, self.config_proto
+                )
             for job_name, func_desc in self.job_name2function_desc_.items():
                 compiler.Compile(self, func_desc, self.config_proto)
                 self.existed_module_names_ = set()
@@ -227,14 +256,18 @@ class Session(object):
 
     def Close(self):
         assert self.status_ is SessionStatus.RUNNING
-        self.Sync()
-        assert len(self.job_name2var_name2var_blob_) == 0
-        del self.var_name2var_blob_
-        del self.job_name2module_name2module_
-        self.ForceReleaseEagerBlobs()
-        c_api_util.StopGlobalSession()
-        c_api_util.DestroyGlobalSession()
-        self.status_ = SessionStatus.CLOSED
+        try:
+            # closed even if a failed push is raised
+            self.Sync()
+        finally:
+            assert len(self.job_name2var_name2var_blob_) == 0
+            del self.var_name2var_blob_
+            del self.job_name2module_name2module_
+            self.ForceReleaseEagerBlobs()
+            vm_util.FlushPendingObjectReleases()
+            c_api_util.StopGlobalSession()
+            c_api_util.DestroyGlobalSession()
+            self.status_ = SessionStatus.CLOSED
 
     def AddJob(self, function_desc):
         assert self.status_ is SessionStatus.OPEN
@@ -248,20 +281,92 @@ class Session(object):
             self.cond_var_.wait()
         assert self.running_job_cnt_ == 0
         self.cond_var_.release()
+        vm_util.FlushPendingObjectReleases()
+        self.CheckFailedPushLeases()
+
+    def AddFailedPushLease(self, push_lease):
+        # called on runtime threads
+        with self.failed_push_lease_lock_:
+            self.failed_push_leases_.append(push_lease)
+
+    def CheckFailedPushLeases(self):
+        # raises the first push error not raised by its call yet
+        while True:
+            with self.failed_push_lease_lock_:
+                if len(self.failed_push_leases_) == 0:
+                    return
+                push_lease = self.failed_push_leases_.pop(0)
+            push_lease.CheckUnraisedException()
 
     def ForceReleaseEagerBlobs(self):
         blob_register_util.GetDefaultBlobRegister().ForceReleaseAll()
         self.backward_blob_register_.ForceReleaseAll()
 
-    def LazyRun(self, job_func, *arg):
+    def LazyRun(self, job_func, *arg, out=None, fetch=None):
         assert self.status_ is SessionStatus.RUNNING
-        remote_blobs = self.LaunchUserJob(job_func, *arg)
+        self.CheckFailedPushLeases()
+        call_idx = self._IncLazyCallCnt(job_func.__name__)
+        remote_blobs, push_lease = self.LaunchUserJob(job_func, *arg)
         if remote_blobs is None:
-            return
-        future_blob = LazyFutureRemoteBlobs(self).SetResult(remote_blobs).Inited()
+            assert out is None
+            assert fetch is None
+            function_desc = self.GetFunctionDesc(job_func.__name__)
+            if function_desc.function_attribute.borrow_input_buffers:
+                return push_lease
+            return None
+        if fetch is None:
+            function_desc = self.GetFunctionDesc(job_func.__name__)
+            fetch_every_n = function_desc.function_attribute.fetch_every_n
+            fetch = fetch_every_n is None or call_idx % fetch_every_n == 0
+        future_blob = LazyFutureRemoteBlobs(
+            self, out=out, fetch=fetch, push_lease=push_lease
+        )
+        future_blob = future_blob.SetResult(remote_blobs).Inited()
         annotation = inspect.signature(job_func).return_annotation
         return oft_util.TransformGlobalFunctionResult(future_blob, annotation)
 
+    def LazyRunN(self, job_func, n, inputs, reduce="last"):
+        assert self.status_ is SessionStatus.RUNNING
+        assert n > 0
+        assert reduce == "last" or reduce in _LAZY_RUN_N_REDUCERS, reduce
+        annotation = inspect.signature(job_func).return_annotation
+        assert reduce == "last" or not oft.OriginFrom(annotation, oft.Callback)
+        self.CheckFailedPushLeases()
+        input_iter = iter(inputs)
+        push_leases = []
+        futures = []
+        for i in range(n):
+            # taken right before its launch, so inputs are produced no faster
+            # than max_inflight lets the calls run
+            arg = next(input_iter, None)
+            assert arg is not None, "%s v.s. %s" % (i, n)
+            if not isinstance(arg, tuple):
+                arg = (arg,)
+            self._IncLazyCallCnt(job_func.__name__)
+            remote_blobs, push_lease = self.LaunchUserJob(job_func, *arg)
+            push_leases.append(push_lease)
+            if remote_blobs is None:
+                continue
+            fetch = reduce != "last" or i == n - 1
+            future_blob = LazyFutureRemoteBlobs(
+                self, fetch=fetch, push_lease=push_lease
+            )
+            futures.append(future_blob.SetResult(remote_blobs).Inited())
+        # futures of calls not fetched are never waited for
+        for push_lease in push_leases:
+            push_lease.wait()
+        if len(futures) == 0:
+            return None
+        if reduce == "last":
+            return oft_util.TransformGlobalFunctionResult(futures[-1], annotation)
+        results = [
+            _LocalBlobsToNdarrays(
+                oft_util.TransformGlobalFunctionResult(future_blob, annotation)
+            )
+            for future_blob in futures
+        ]
+        return _ReduceResults(results, _LAZY_RUN_N_REDUCERS[reduce])
+
     def EagerRun(self, function_desc, *arg):
         with self._EagerGlobalFunctionDescScope(function_desc):
             remote_blobs = compiler.EagerRun(
@@ -277,9 +382,24 @@ class Session(object):
     def LaunchUserJob(self, job_func, *arg):
         assert self.status_ is SessionStatus.RUNNING
         job_name = job_func.__name__
-        push_util.AsyncPush(self, job_func, *arg)
-        self.LaunchJob(job_instance_util.MakeUserJobInstance(job_name))
-        return job_func.__oneflow_output_remote_blobs__
+        function_attribute = self.GetFunctionDesc(job_name).function_attribute
+        inflight_window = self.InflightWindow4JobName(job_name)
+        if inflight_window is not None:
+            inflight_window.Acquire()
+        try:
+            push_lease = push_util.AsyncPush(
+                self, job_func, *arg, borrowed=function_attribute.borrow_input_buffers
+            )
+            job_instance = job_instance_util.MakeUserJobInstance(job_name)
+            if inflight_window is not None:
+                job_instance.AddPostFinishCallback(lambda _: inflight_window.Release())
+            self.LaunchJob(job_instance)
+        except BaseException:
+            # the job is not launched, so its post finish callbacks never run
+            if inflight_window is not None:
+                inflight_window.Release()
+            raise
+        return job_func.__oneflow_output_remote_blobs__, push_lease
 
     def LaunchJob(self, job_instance):
         assert self.status_ is SessionStatus.RUNNING
@@ -287,15 +407,37 @@ class Session(object):
         job_instance.AddPostFinishCallback(lambda _: self._DecRunningJobCnt())
         c_api_util.LaunchJob(job_instance)
 
-    def AsyncPush(self, op_name, push_data_cb):
+    def AsyncPush(self, op_name, push_data_cb, push_finish_cb=None):
         assert self.status_ is SessionStatus.RUNNING
         push_job_name = self.inter_user_job_info.input_or_var_op_name2push_job_name[
             op_name
         ]
         self.LaunchJob(
-            job_instance_util.MakePushJobInstance(push_job_name, op_name, push_data_cb)
+            job_instance_util.MakePushJobInstance(
+                push_job_name, op_name, push_data_cb, finish_cb=push_finish_cb
+            )
         )
 
+    def _IncLazyCallCnt(self, job_name):
+        call_cnt = self.job_name2lazy_call_cnt_.get(job_name, 0)
+        self.job_name2lazy_call_cnt_[job_name] = call_cnt + 1
+        return call_cnt
+
+    def InflightWindow4JobName(self, job_name):
+        if job_name not in self.job_name2inflight_window_:
+            function_attribute = self.GetFunctionDesc(job_name).function_attribute
+            max_inflight = function_attribute.max_inflight
+            inflight_window = None
+            if max_inflight is not None:
+                inflight_window = inflight_window_util.InflightWindow(max_inflight)
+            self.job_name2inflight_window_[job_name] = inflight_window
+        return self.job_name2inflight_window_[job_name]
+
+    def EagerTraceCache4JobName(self, job_name):
+        if job_name not in self.job_name2eager_trace_cache_:
+            self.job_name2eager_trace_cache_[job_name] = trace_util.EagerTraceCache()
+        return self.job_name2eager_trace_cache_[job_name]
+
     def AsyncPull(self, op_name, pull_data_cb):
         assert self.status_ is SessionStatus.RUNNING
         pull_job_name = self.inter_user_job_info.output_or_var_op_name2pull_job_name[
@@ -322,6 +464,13 @@ class Session(object):
             interface_op_name
         ] = c_api_util.JobBuildAndInferCtx_GetCurrentJobName()
 
+    def VariableOpNames4Interface(self):
+        return [
+            op_name
+            for op_name, op_attr in self.interface_op_name2op_attr_.items()
+            if op_attr.op_conf.HasField("variable_conf")
+        ]
+
     def OpAttribute4InterfaceOpName(self, interface_op_name):
         return self.interface_op_name2op_attr_[interface_op_name]
 
@@ -455,6 +604,62 @@ def sync_default_session() -> None:
     session_ctx.GetDefaultSession().Sync()
 
 
+@oneflow_export("eager_bulk")
+@contextmanager
+def eager_bulk(flush_threshold: int = 1024) -> None:
+    r"""Send the instructions of eager ops within the scope to the vm in bulk.
+
+    Instructions are buffered and sent together when a blob is fetched, more than
+    `flush_threshold` instructions are buffered or the outermost scope exits. Nested
+    scopes, including the one of `FunctionConfig.eager_bulk`, share the buffer and
+    the innermost `flush_threshold` applies.
+
+    For instance::
+
+        with flow.eager_bulk():
+            for _ in range(50):
+                x = flow.math.relu(x)
+        print(x.numpy())
+
+    """
+    assert flush_threshold > 0
+    with vm_util.BulkScope(flush_threshold):
+        yield
+
+
+def _LocalBlobsToNdarrays(result):
+    if isinstance(result, (list, tuple)):
+        return type(result)(_LocalBlobsToNdarrays(x) for x in result)
+    if type(result) is dict:
+        return {k: _LocalBlobsToNdarrays(v) for k, v in result.items()}
+    if isinstance(result, LazyFutureRemoteBlobs):
+        return _LocalBlobsToNdarrays(result.get())
+    if isinstance(result, local_blob_util.LocalMirroredTensor):
+        return result.numpy()
+    if isinstance(result, local_blob_util.LocalMirroredTensorList):
+        return result.numpy_list()
+    assert isinstance(result, np.ndarray), type(result)
+    return result
+
+
+def _ReduceResults(results, reducer):
+    # results are structures of ndarrays, one per call
+    first = results[0]
+    if isinstance(first, (list, tuple)):
+        assert all(len(x) == len(first) for x in results)
+        reduced = (_ReduceResults(list(xs), reducer) for xs in zip(*results))
+        return type(first)(reduced)
+    if type(first) is dict:
+        return {k: _ReduceResults([x[k] for x in results], reducer) for k in first}
+    return reducer(results)
+
+
+_LAZY_RUN_N_REDUCERS = dict(
+    stack=lambda ndarrays: np.stack(ndarrays),
+    mean=lambda ndarrays: np.mean(np.stack(ndarrays), axis=0),
+)
+
+
 def _TryCompleteConfigProto(config_proto):
     if config_proto.resource.machine_num == 0:
         config_proto.resource.machine_num = len(env_util.default_env_proto.machine)
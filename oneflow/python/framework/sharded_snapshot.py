@@ -0,0 +1,151 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import json
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# A sharded snapshot is a directory holding a few shard files and an index:
+#
+#   index.json          {"version": 1, "shards": [...], "variables": {name: entry}}
+#   shard-00000-of-0000N
+#   snapshot_done
+#
+# where entry is {"shard", "offset", "dtype", "shape", "crc32"}. Variables are
+# stored raw and C-contiguous at 64-byte aligned offsets, so a reader maps each
+# shard once and pages variables in on demand.
+
+INDEX_FILE_NAME = "index.json"
+SNAPSHOT_DONE_FILE_NAME = "snapshot_done"
+_VERSION = 1
+_ALIGNMENT = 64
+
+
+def IsShardedSnapshot(path):
+    return os.path.isfile(os.path.join(path, INDEX_FILE_NAME))
+
+
+def SaveShardedSnapshot(path, name2ndarray, num_shards=8):
+    assert num_shards > 0
+    if not os.path.exists(path):
+        os.makedirs(path)
+    assert os.path.isdir(path)
+    num_shards = max(min(num_shards, len(name2ndarray)), 1)
+    shard_names = ["shard-%05d-of-%05d" % (i, num_shards) for i in range(num_shards)]
+    shard2names = _BalanceShards(name2ndarray, num_shards)
+
+    def WriteShard(shard_id):
+        name2entry = {}
+        offset = 0
+        with open(os.path.join(path, shard_names[shard_id]), "wb") as f:
+            for name in shard2names[shard_id]:
+                ndarray = np.asarray(name2ndarray[name], order="C")
+                padding = -offset % _ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+                buf = ndarray.reshape(-1).view(np.uint8)
+                f.write(buf)
+                name2entry[name] = dict(
+                    shard=shard_id,
+                    offset=offset,
+                    dtype=ndarray.dtype.str,
+                    shape=list(ndarray.shape),
+                    crc32=zlib.crc32(buf),
+                )
+                offset += ndarray.nbytes
+        return name2entry
+
+    variables = {}
+    with ThreadPoolExecutor(max_workers=num_shards) as executor:
+        for name2entry in executor.map(WriteShard, range(num_shards)):
+            variables.update(name2entry)
+    index = dict(version=_VERSION, shards=shard_names, variables=variables)
+    with open(os.path.join(path, INDEX_FILE_NAME), "w") as f:
+        json.dump(index, f)
+    with open(os.path.join(path, SNAPSHOT_DONE_FILE_NAME), "w"):
+        pass
+
+
+class ShardedSnapshotReader(object):
+    r"""Reads variables of a sharded snapshot.
+
+    Every shard file is mapped once, when a variable in it is first read, and
+    variables are returned as read-only views into the mapping. Checksums of
+    variables are verified on read unless `verify` is False.
+    """
+
+    def __init__(self, path, verify=True):
+        with open(os.path.join(path, INDEX_FILE_NAME)) as f:
+            index = json.load(f)
+        assert index["version"] == _VERSION, index["version"]
+        self.path_ = path
+        self.verify_ = verify
+        self.shards_ = index["shards"]
+        self.name2entry_ = index["variables"]
+        self.shard_id2map_ = {}
+        self.lock_ = threading.Lock()
+
+    def names(self):
+        return self.name2entry_.keys()
+
+    def __contains__(self, name):
+        return name in self.name2entry_
+
+    def get(self, name):
+        entry = self.name2entry_[name]
+        shape = tuple(entry["shape"])
+        dtype = np.dtype(entry["dtype"])
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=dtype)
+        ndarray = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=self._ShardMap(entry["shard"]),
+            offset=entry["offset"],
+        )
+        if self.verify_:
+            crc32 = zlib.crc32(ndarray.reshape(-1).view(np.uint8))
+            if crc32 != entry["crc32"]:
+                raise ValueError("checksum mismatch of variable %s" % name)
+        return ndarray
+
+    def _ShardMap(self, shard_id):
+        with self.lock_:
+            if shard_id not in self.shard_id2map_:
+                shard_path = os.path.join(self.path_, self.shards_[shard_id])
+                self.shard_id2map_[shard_id] = np.memmap(
+                    shard_path, dtype=np.uint8, mode="r"
+                )
+            return self.shard_id2map_[shard_id]
+
+
+def _BalanceShards(name2ndarray, num_shards):
+    # greedily put the largest remaining variable into the smallest shard
+    shard2names = [[] for _ in range(num_shards)]
+    shard2nbytes = [0] * num_shards
+    names = sorted(name2ndarray.keys(), key=lambda x: -name2ndarray[x].nbytes)
+    for name in names:
+        shard_id = shard2nbytes.index(min(shard2nbytes))
+        shard2names[shard_id].append(name)
+        shard2nbytes[shard_id] += name2ndarray[name].nbytes
+    for names in shard2names:
+        names.sort()
+    return shard2names
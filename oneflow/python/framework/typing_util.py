@@ -207,6 +207,9 @@ def TransformReturnedBundle(bundle_blob, annotation):
     the returned bundle blob could be the form like x, [x], (x, ),
     {"key": x} or the mixed form of them.
     """
+    if bundle_blob is None:
+        # not fetched
+        return None
     if isinstance(
         bundle_blob,
         (local_blob_util.LocalMirroredTensor, local_blob_util.LocalMirroredTensorList),
@@ -228,6 +231,9 @@ def TransformReturnedBundle(bundle_blob, annotation):
 
 
 def TransformReturnedLocalBlob(local_blob, annotation):
+    if local_blob is None:
+        # not fetched
+        return None
     if oft.OriginFrom(annotation, typing.Tuple):
         assert type(local_blob) is tuple
         assert len(local_blob) == len(annotation.__args__)
@@ -0,0 +1,104 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from __future__ import absolute_import
+
+import collections
+
+import oneflow.python.framework.c_api_util as c_api_util
+
+
+def GetUserOpDef(op_type_name):
+    if op_type_name not in _op_type_name2op_def:
+        _op_type_name2op_def[op_type_name] = _UserOpDef(
+            c_api_util.GetUserOpDef(op_type_name)
+        )
+    return _op_type_name2op_def[op_type_name]
+
+
+def GetUserOpAttrType(op_type_name, attr_name):
+    attr_name2attr_def = GetUserOpDef(op_type_name).attr_name2attr_def
+    if attr_name not in attr_name2attr_def:
+        # let the C++ side report the unknown attr
+        return c_api_util.GetUserOpAttrType(op_type_name, attr_name)
+    return attr_name2attr_def[attr_name].type
+
+
+def CheckAndCompleteUserOpConf(op_conf):
+    op_def = GetUserOpDef(op_conf.user_conf.op_type_name)
+    signature = _UserOpConfSignature(op_conf)
+    if op_def.HasCheckedSignature(signature):
+        # an op conf with the same attrs and args has passed the C++ check before,
+        # only defaults are left to fill in
+        _AddAttrDefaultValue(op_def, op_conf)
+        _AddOutputDefaultArg(op_def, op_conf)
+        return op_conf
+    op_conf = c_api_util.CheckAndCompleteUserOpConf(op_conf)
+    op_def.AddCheckedSignature(signature)
+    return op_conf
+
+
+class _UserOpDef(object):
+    def __init__(self, op_def):
+        self.op_def = op_def
+        self.attr_name2attr_def = {attr.name: attr for attr in op_def.attr}
+        # least recently checked first, bounded since every distinct attr value,
+        # e.g. of a constant or a seed, makes a new signature
+        self.checked_signatures = collections.OrderedDict()
+
+    def HasCheckedSignature(self, signature):
+        if signature not in self.checked_signatures:
+            return False
+        self.checked_signatures.move_to_end(signature)
+        return True
+
+    def AddCheckedSignature(self, signature):
+        self.checked_signatures[signature] = None
+        while len(self.checked_signatures) > _checked_signature_capacity:
+            self.checked_signatures.popitem(last=False)
+
+
+def _UserOpConfSignature(op_conf):
+    user_conf = op_conf.user_conf
+    attrs = tuple(
+        (k, user_conf.attr[k].SerializeToString()) for k in sorted(user_conf.attr)
+    )
+    inputs = tuple((k, len(user_conf.input[k].s)) for k in sorted(user_conf.input))
+    outputs = tuple((k, len(user_conf.output[k].s)) for k in sorted(user_conf.output))
+    return (attrs, inputs, outputs)
+
+
+def _AddAttrDefaultValue(op_def, op_conf):
+    attr = op_conf.user_conf.attr
+    for attr_def in op_def.op_def.attr:
+        if attr_def.name not in attr:
+            attr[attr_def.name].CopyFrom(attr_def.default_val)
+
+
+def _AddOutputDefaultArg(op_def, op_conf):
+    output = op_conf.user_conf.output
+    for output_arg in op_def.op_def.output:
+        if output_arg.name in output:
+            continue
+        if output_arg.is_optional or output_arg.num_as_min:
+            continue
+        output[output_arg.name].s[:] = [
+            "%s/%s_%s" % (op_conf.name, output_arg.name, i)
+            for i in range(output_arg.num)
+        ]
+
+
+_op_type_name2op_def = {}
+_checked_signature_capacity = 256
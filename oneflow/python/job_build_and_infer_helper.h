@@ -81,6 +81,17 @@ Maybe<void> CurJobBuildAndInferCtx_SetTrainConf(const std::string& train_conf_st
 
 Maybe<void> CurJobBuildAndInferCtx_Complete() { return JUST(GetCurInferCtx())->Complete(); }
 
+Maybe<void> CurJobBuildAndInferCtx_CompleteFromCache(const std::string& serialized_job) {
+  CHECK_OR_RETURN(!EagerExecutionEnabled()) << "only lazy jobs are cached";
+  Job job;
+  CHECK_OR_RETURN(TxtString2PbMessage(serialized_job, &job)) << "job parse failed";
+  return JUST(GetCurInferCtx())->CompleteFromCache(job);
+}
+
+Maybe<std::string> CurJobBuildAndInferCtx_GetSerializedJob() {
+  return PbMessage2TxtString(JUST(GetCurInferCtx())->job());
+}
+
 Maybe<bool> CurJobBuildAndInferCtx_HasJobConf() { return JUST(GetCurInferCtx())->HasJobConf(); }
 
 Maybe<std::string> CurJobBuildAndInferCtx_AddAndInferMirroredOp(const std::string& op_conf_str) {
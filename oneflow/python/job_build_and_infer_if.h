@@ -55,6 +55,17 @@ void CurJobBuildAndInferCtx_Complete(std::string* error_str) {
   return oneflow::CurJobBuildAndInferCtx_Complete().GetDataAndSerializedErrorProto(error_str);
 }
 
+void CurJobBuildAndInferCtx_CompleteFromCache(const std::string& serialized_job,
+                                              std::string* error_str) {
+  return oneflow::CurJobBuildAndInferCtx_CompleteFromCache(serialized_job)
+      .GetDataAndSerializedErrorProto(error_str);
+}
+
+std::string CurJobBuildAndInferCtx_GetSerializedJob(std::string* error_str) {
+  return oneflow::CurJobBuildAndInferCtx_GetSerializedJob().GetDataAndSerializedErrorProto(
+      error_str, std::string(""));
+}
+
 bool CurJobBuildAndInferCtx_HasJobConf(std::string* error_str) {
   return oneflow::CurJobBuildAndInferCtx_HasJobConf().GetDataAndSerializedErrorProto(error_str,
                                                                                      false);
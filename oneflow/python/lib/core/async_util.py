@@ -13,6 +13,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import asyncio
+import concurrent.futures
 import threading
 
 
@@ -21,10 +23,14 @@ def Await(counter, func):
     cond_var = threading.Condition()
     counter_box = [counter]
     result_list = []
+    exception_list = []
 
-    def Yield(result=None):
+    def Yield(result=None, exception=None):
+        # exception is raised in the awaiting thread
         result_list.append(result)
         cond_var.acquire()
+        if exception is not None:
+            exception_list.append(exception)
         assert counter_box[0] > 0
         counter_box[0] -= 1
         cond_var.notify()
@@ -35,4 +41,87 @@ def Await(counter, func):
     while counter_box[0] > 0:
         cond_var.wait()
     cond_var.release()
+    if len(exception_list) > 0:
+        raise exception_list[0]
     return result_list
+
+
+class Future(concurrent.futures.Future):
+    r"""A concurrent.futures.Future which can also be awaited in asyncio.
+
+    Results are set from the thread yielding them, usually the vm callback
+    thread, and awaiting coroutines are resumed in their own event loop.
+    """
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
+
+def AsyncAwait(counter, func):
+    # the non-blocking version of Await
+    assert counter > 0
+    future = Future()
+    lock = threading.Lock()
+    counter_box = [counter]
+    result_list = []
+    exception_list = []
+
+    def Yield(result=None, exception=None):
+        with lock:
+            result_list.append(result)
+            if exception is not None:
+                exception_list.append(exception)
+            assert counter_box[0] > 0
+            counter_box[0] -= 1
+            done = counter_box[0] == 0
+        if not done:
+            return
+        if len(exception_list) > 0:
+            future.set_exception(exception_list[0])
+        else:
+            future.set_result(result_list)
+
+    try:
+        func(Yield)
+    except BaseException as e:
+        if not future.done():
+            future.set_exception(e)
+    return future
+
+
+def DoneFuture(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def Gather(futures):
+    futures = list(futures)
+    if len(futures) == 0:
+        return DoneFuture([])
+
+    def Gathered(Yield):
+        for future in futures:
+            future.add_done_callback(lambda _: Yield())
+
+    return Then(
+        AsyncAwait(len(futures), Gathered),
+        lambda _: [future.result() for future in futures],
+    )
+
+
+def Then(future, func):
+    r"""Returns a future of func(future.result()).
+
+    func runs in the thread resolving `future`, so it must not block.
+    """
+    ret = Future()
+
+    def Callback(future):
+        try:
+            ret.set_result(func(future.result()))
+        except BaseException as e:
+            ret.set_exception(e)
+
+    future.add_done_callback(Callback)
+    return ret
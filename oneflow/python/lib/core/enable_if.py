@@ -37,33 +37,60 @@ def set_condition_hob(func, hob):
 
 def unique(arg_funcs, context=None, default=None):
     assert isinstance(arg_funcs, (list, tuple))
-    conditional_functions = []
-    for arg_func in arg_funcs:
-        if isinstance(arg_func, tuple):
-            func, hob_expr = arg_func
-        elif inspect.isfunction(arg_func):
-            func = arg_func
-            assert hasattr(func, "__oneflow_condition_hob__")
-            hob_expr = func.__oneflow_condition_hob__
-        else:
-            raise NotImplementedError
-        debug_str = func.__name__
-        if hasattr(func, "__debug_str__"):
-            debug_str = func.__debug_str__
-        conditional_functions.append((hob_expr, func, debug_str))
+    table = _GetConditionalFunctionTable(arg_funcs)
+    conditional_functions = table.conditional_functions
 
     if default is None:
 
         def default(get_failed_info, *args, **kwargs):
             raise NotImplementedError(get_failed_info())
 
-    matched_func = GetMatchedFunction(default, conditional_functions, context=context)
+    if _debug_mode:
+        matched_func = GetMatchedFunction(
+            default, conditional_functions, context=context
+        )
+    else:
+        matched_func = _GetFirstMatchedFunctionWithCache(table, context=context)
     if matched_func is not None:
         return matched_func
 
     return MakeDefaultFunction(default, conditional_functions, context=context)
 
 
+def set_debug_mode(val):
+    global _debug_mode
+    assert type(val) is bool
+    _debug_mode = val
+
+
+def set_dispatch_context_key_getter(key_getter):
+    global _dispatch_context_key_getter
+    _dispatch_context_key_getter = key_getter
+    for table in _arg_funcs2conditional_function_table.values():
+        table.context_key2matched_func.clear()
+
+
+def _GetFirstMatchedFunctionWithCache(table, context=None):
+    # hob results are only reusable when every condition is a pure function of the
+    # dispatch context key, and only ambiguity checking needs to evaluate them all
+    key = None
+    if context is None and table.cacheable and _dispatch_context_key_getter is not None:
+        key = _dispatch_context_key_getter()
+    if key is None:
+        return GetFirstMatchedFunction(table.conditional_functions, context=context)
+    if key not in table.context_key2matched_func:
+        matched_func = GetFirstMatchedFunction(table.conditional_functions)
+        table.context_key2matched_func[key] = matched_func
+    return table.context_key2matched_func[key]
+
+
+def GetFirstMatchedFunction(conditional_functions, context=None):
+    for hob_expr, func, _ in conditional_functions:
+        if hob_expr(context):
+            return func
+    return None
+
+
 def GetMatchedFunction(default, conditional_functions, context=None):
     select_triple = (None, None, None)
     for triple in conditional_functions:
@@ -103,3 +130,48 @@ def _MultiMatchedErrorFunction(default, matched_functions, context=None):
         return failed_info
 
     return lambda *args, **kwargs: default(get_failed_info, *args, **kwargs)
+
+
+class _ConditionalFunctionTable(object):
+    def __init__(self, conditional_functions):
+        self.conditional_functions = conditional_functions
+        self.cacheable = all(
+            getattr(hob_expr, "cacheable", False)
+            for hob_expr, _, _ in conditional_functions
+        )
+        self.context_key2matched_func = {}
+
+
+def _GetConditionalFunctionTable(arg_funcs):
+    try:
+        key = tuple(arg_funcs)
+        table = _arg_funcs2conditional_function_table.get(key)
+    except TypeError:
+        return _ConditionalFunctionTable(_MakeConditionalFunctions(arg_funcs))
+    if table is None:
+        table = _ConditionalFunctionTable(_MakeConditionalFunctions(arg_funcs))
+        _arg_funcs2conditional_function_table[key] = table
+    return table
+
+
+def _MakeConditionalFunctions(arg_funcs):
+    conditional_functions = []
+    for arg_func in arg_funcs:
+        if isinstance(arg_func, tuple):
+            func, hob_expr = arg_func
+        elif inspect.isfunction(arg_func):
+            func = arg_func
+            assert hasattr(func, "__oneflow_condition_hob__")
+            hob_expr = func.__oneflow_condition_hob__
+        else:
+            raise NotImplementedError
+        debug_str = func.__name__
+        if hasattr(func, "__debug_str__"):
+            debug_str = func.__debug_str__
+        conditional_functions.append((hob_expr, func, debug_str))
+    return conditional_functions
+
+
+_debug_mode = False
+_dispatch_context_key_getter = None
+_arg_funcs2conditional_function_table = {}
@@ -15,9 +15,9 @@ limitations under the License.
 """
 
 
-def bool_functor(verbose_debug_str):
+def bool_functor(verbose_debug_str, cacheable=False):
     def Decorator(match_function):
-        return HighOrderBool(verbose_debug_str, match_function)
+        return HighOrderBool(verbose_debug_str, match_function, cacheable=cacheable)
 
     return Decorator
 
@@ -30,6 +30,9 @@ def hob_context_attr(attr_name):
 
 
 class BoolFunctor(object):
+    # a cacheable functor only depends on enable_if's dispatch context key
+    cacheable = False
+
     def debug_str(self, ctx, display_result=True):
         if hasattr(self, "__debug_str__"):
             if display_result:
@@ -55,9 +58,10 @@ class BoolFunctor(object):
 
 
 class HighOrderBool(BoolFunctor):
-    def __init__(self, verbose_debug_str, function):
+    def __init__(self, verbose_debug_str, function, cacheable=False):
         self.verbose_debug_str_ = verbose_debug_str
         self.function_ = function
+        self.cacheable = cacheable
 
     def verbose_debug_str(self, ctx, display_result=True):
         if display_result:
@@ -79,6 +83,7 @@ class _AndBoolFunctor(BoolFunctor):
         assert isinstance(rhs, BoolFunctor)
         self.lhs_ = lhs
         self.rhs_ = rhs
+        self.cacheable = lhs.cacheable and rhs.cacheable
 
     def verbose_debug_str(self, ctx, display_result=True):
         left_display = self.lhs_.debug_str(ctx, display_result)
@@ -96,6 +101,7 @@ class _OrBoolFunctor(BoolFunctor):
         assert isinstance(rhs, BoolFunctor)
         self.lhs_ = lhs
         self.rhs_ = rhs
+        self.cacheable = lhs.cacheable and rhs.cacheable
 
     def verbose_debug_str(self, ctx, display_result=True):
         left_display = self.lhs_.debug_str(ctx, display_result)
@@ -111,6 +117,7 @@ class _NotBoolFunctor(BoolFunctor):
     def __init__(self, x):
         assert isinstance(x, BoolFunctor)
         self.x_ = x
+        self.cacheable = x.cacheable
 
     def verbose_debug_str(self, ctx, display_result=True):
         return "(not %s)" % self.x_.debug_str(ctx, display_result)
@@ -135,6 +135,11 @@ long GetOpParallelSymbolId(const std::string& serialized_op_conf, std::string* e
       .GetDataAndSerializedErrorProto(error_str, 0LL);
 }
 
+std::string GetSerializedUserOpDef(const std::string& op_type_name, std::string* error_str) {
+  return oneflow::GetSerializedUserOpDef(op_type_name)
+      .GetDataAndSerializedErrorProto(error_str, std::string(""));
+}
+
 std::string CheckAndCompleteUserOpConf(const std::string& serialized_op_conf,
                                        std::string* error_str) {
   return oneflow::CheckAndCompleteUserOpConf(serialized_op_conf)
@@ -153,6 +158,18 @@ void RunPhysicalInstruction(const std::string& vm_instruction_list,
       .GetDataAndSerializedErrorProto(error_str);
 }
 
+void RunLogicalInstructionFromBuffer(uint8_t* array1, int size1, uint8_t* array2, int size2,
+                                     std::string* error_str) {
+  return oneflow::RunLogicalInstructionFromBuffer(array1, size1, array2, size2)
+      .GetDataAndSerializedErrorProto(error_str);
+}
+
+void RunPhysicalInstructionFromBuffer(uint8_t* array1, int size1, uint8_t* array2, int size2,
+                                      std::string* error_str) {
+  return oneflow::RunPhysicalInstructionFromBuffer(array1, size1, array2, size2)
+      .GetDataAndSerializedErrorProto(error_str);
+}
+
 long CurrentMachineId(std::string* error_str) {
   return oneflow::CurrentMachineId().GetDataAndSerializedErrorProto(error_str, 0LL);
 }
@@ -173,6 +190,24 @@ long NewPhysicalSymbolId(std::string* error_str) {
   return oneflow::NewPhysicalSymbolId().GetDataAndSerializedErrorProto(error_str, 0LL);
 }
 
+long NewLogicalObjectIdRange(long size, std::string* error_str) {
+  return oneflow::NewLogicalObjectIdRange(size).GetDataAndSerializedErrorProto(error_str, 0LL);
+}
+
+long NewLogicalSymbolIdRange(long size, std::string* error_str) {
+  return oneflow::NewLogicalSymbolIdRange(size).GetDataAndSerializedErrorProto(error_str, 0LL);
+}
+
+long NewPhysicalObjectIdRange(long size, std::string* error_str) {
+  return oneflow::NewPhysicalObjectIdRange(size).GetDataAndSerializedErrorProto(error_str, 0LL);
+}
+
+long NewPhysicalSymbolIdRange(long size, std::string* error_str) {
+  return oneflow::NewPhysicalSymbolIdRange(size).GetDataAndSerializedErrorProto(error_str, 0LL);
+}
+
+long IdRangeStride() { return oneflow::vm::IdUtil::IdRangeStride(); }
+
 int Ofblob_GetDataType(uint64_t of_blob_ptr) {
   using namespace oneflow;
   auto* of_blob = reinterpret_cast<OfBlob*>(of_blob_ptr);
@@ -240,6 +240,13 @@ Maybe<long long> GetUserOpAttrType(const std::string& op_type_name, const std::s
   return JUST(GetUserOpAttrTypeImpl(op_type_name, attr_name));
 }
 
+Maybe<std::string> GetSerializedUserOpDef(const std::string& op_type_name) {
+  const user_op::OpRegistryResult* val =
+      user_op::UserOpRegistryMgr::Get().GetOpRegistryResult(op_type_name);
+  CHECK_OR_RETURN(val) << " Cannot find op " << op_type_name;
+  return PbMessage2TxtString(val->op_def);
+}
+
 Maybe<std::string> CheckAndCompleteUserOpConf(const std::string& op_conf_str) {
   OperatorConf op_conf;
   CHECK_OR_RETURN(TxtString2PbMessage(op_conf_str, &op_conf)) << "operator conf parse failed";
@@ -279,6 +286,34 @@ Maybe<void> RunPhysicalInstruction(const std::string& instruction_list_str,
   return eager::RunPhysicalInstruction(instruction_list_str, eager_symbol_list_str);
 }
 
+Maybe<void> RunLogicalInstructionFromBuffer(const uint8_t* instruction_list_buf,
+                                            int instruction_list_size,
+                                            const uint8_t* eager_symbol_list_buf,
+                                            int eager_symbol_list_size) {
+  vm::InstructionListProto instruction_list_proto;
+  CHECK_OR_RETURN(instruction_list_proto.ParseFromArray(instruction_list_buf,
+                                                        instruction_list_size))
+      << "InstructionListProto parse failed";
+  EagerSymbolList eager_symbol_list;
+  CHECK_OR_RETURN(eager_symbol_list.ParseFromArray(eager_symbol_list_buf, eager_symbol_list_size))
+      << "EagerSymbolList parse failed";
+  return eager::RunLogicalInstruction(instruction_list_proto, eager_symbol_list);
+}
+
+Maybe<void> RunPhysicalInstructionFromBuffer(const uint8_t* instruction_list_buf,
+                                             int instruction_list_size,
+                                             const uint8_t* eager_symbol_list_buf,
+                                             int eager_symbol_list_size) {
+  vm::InstructionListProto instruction_list_proto;
+  CHECK_OR_RETURN(instruction_list_proto.ParseFromArray(instruction_list_buf,
+                                                        instruction_list_size))
+      << "InstructionListProto parse failed";
+  EagerSymbolList eager_symbol_list;
+  CHECK_OR_RETURN(eager_symbol_list.ParseFromArray(eager_symbol_list_buf, eager_symbol_list_size))
+      << "EagerSymbolList parse failed";
+  return eager::RunPhysicalInstruction(instruction_list_proto, eager_symbol_list);
+}
+
 Maybe<long long> CurrentMachineId() {
   CHECK_NOTNULL_OR_RETURN(Global<MachineCtx>::Get());
   return Global<MachineCtx>::Get()->this_machine_id();
@@ -304,4 +339,28 @@ Maybe<long long> NewPhysicalSymbolId() {
   return vm::IdUtil::NewPhysicalSymbolId(Global<MachineCtx>::Get()->this_machine_id());
 }
 
+Maybe<long long> NewLogicalObjectIdRange(long long size) {
+  CHECK_OR_RETURN(JUST(GlobalMaybe<MachineCtx>())->IsThisMachineMaster());
+  CHECK_GT_OR_RETURN(size, 0);
+  return vm::IdUtil::NewLogicalObjectIdRange(size);
+}
+
+Maybe<long long> NewLogicalSymbolIdRange(long long size) {
+  CHECK_OR_RETURN(JUST(GlobalMaybe<MachineCtx>())->IsThisMachineMaster());
+  CHECK_GT_OR_RETURN(size, 0);
+  return vm::IdUtil::NewLogicalSymbolIdRange(size);
+}
+
+Maybe<long long> NewPhysicalObjectIdRange(long long size) {
+  CHECK_NOTNULL_OR_RETURN(Global<MachineCtx>::Get());
+  CHECK_GT_OR_RETURN(size, 0);
+  return vm::IdUtil::NewPhysicalObjectIdRange(Global<MachineCtx>::Get()->this_machine_id(), size);
+}
+
+Maybe<long long> NewPhysicalSymbolIdRange(long long size) {
+  CHECK_NOTNULL_OR_RETURN(Global<MachineCtx>::Get());
+  CHECK_GT_OR_RETURN(size, 0);
+  return vm::IdUtil::NewPhysicalSymbolIdRange(Global<MachineCtx>::Get()->this_machine_id(), size);
+}
+
 }  // namespace oneflow
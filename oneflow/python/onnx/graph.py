@@ -41,6 +41,7 @@ from onnx import (
 )
 
 from oneflow.python.framework import id_util
+from oneflow.python.framework import sharded_snapshot
 from oneflow.python.onnx import util
 from oneflow.python.onnx.util import FindOpset
 from oneflow.python.onnx import optimizer
@@ -442,6 +443,7 @@ class Graph(object):
         self._dtypes = dtypes
 
         self._model_save_dir = model_save_dir
+        self._sharded_snapshot_reader = None
         self._output_shapes = output_shapes
         self._opset = FindOpset(opset)
 
@@ -898,6 +900,13 @@ class Graph(object):
 
     def get_saved_tensor(self, node):
         tensor_name = node.output[0]
+        if sharded_snapshot.IsShardedSnapshot(self._model_save_dir):
+            if self._sharded_snapshot_reader is None:
+                self._sharded_snapshot_reader = sharded_snapshot.ShardedSnapshotReader(
+                    self._model_save_dir
+                )
+            var_name = tensor_name.split("/", 1)[0]
+            return np.asarray(self._sharded_snapshot_reader.get(var_name))
         # TODO(daquexian): node.output[0] is "node_name/output_name", so this pathjoin doesn't work
         # on windows (where path separator is "\")
         path = pathjoin(self._model_save_dir, node.output[0])
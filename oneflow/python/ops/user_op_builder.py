@@ -20,6 +20,7 @@ import oneflow.python.framework.compile_context as compile_context
 import oneflow.python.framework.distribute as distribute
 import oneflow.python.framework.hob as hob
 import oneflow.python.framework.remote_blob as remote_blob_util
+import oneflow.python.framework.user_op_def_util as user_op_def_util
 import oneflow.python.lib.core.enable_if as enable_if
 import oneflow.core.operator.op_conf_pb2 as op_conf_util
 import oneflow.core.framework.user_op_attr_pb2 as user_op_attr_util
@@ -194,7 +195,7 @@ class UserOpConfBuilder(object):
 
     def CheckAndComplete(self):
         assert self.user_op_.op_conf_.user_conf.op_type_name != ""
-        self.user_op_.op_conf_ = c_api_util.CheckAndCompleteUserOpConf(
+        self.user_op_.op_conf_ = user_op_def_util.CheckAndCompleteUserOpConf(
             self.user_op_.op_conf_
         )
         return self
@@ -303,7 +304,7 @@ class UserOpConfBuilder(object):
 
         attribute = user_op_attr_util.UserOpAttrVal()
         assert isinstance(attr_name, str)
-        attr_type = c_api_util.GetUserOpAttrType(
+        attr_type = user_op_def_util.GetUserOpAttrType(
             self.user_op_.op_conf_.user_conf.op_type_name, attr_name
         )
         if attr_type == user_op_attr_util.kAtInt32:
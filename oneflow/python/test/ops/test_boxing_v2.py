@@ -19,6 +19,7 @@ import numpy as np
 import oneflow as flow
 from test_util import GenArgList
 import oneflow.typing as oft
+import oneflow.python.eager.boxing_util as boxing_util
 
 
 def _test_split_to_split(
@@ -282,3 +283,46 @@ def test_multi_lbi(test_case):
     arg_dict["dst_device_num"] = [1, 2, 3]
     for arg in GenArgList(arg_dict):
         _test_multi_lbi(test_case, *arg)
+
+
+def test_eager_boxing_plan_cache(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+    flow.config.gpu_device_num(4)
+    func_config = flow.FunctionConfig()
+    func_config.default_data_type(flow.float)
+    func_config.default_logical_view(flow.scope.consistent_view())
+
+    def MakeSplitToSplitJob(dst_axis):
+        def split_to_split_job(x: oft.Numpy.Placeholder((96, 96))):
+            with flow.scope.placement("cpu", "0:0-1"):
+                src = flow.identity(x.with_distribute(flow.distribute.split(0)))
+            with flow.scope.placement("cpu", "0:0-2"):
+                dst = flow.identity(
+                    src.with_distribute(flow.distribute.split(dst_axis))
+                )
+            return dst
+
+        split_to_split_job.__name__ = "split_to_split_job_%s" % dst_axis
+        return flow.global_function(function_config=func_config)(split_to_split_job)
+
+    split0_job = MakeSplitToSplitJob(0)
+    split1_job = MakeSplitToSplitJob(1)
+    x = np.random.rand(96, 96).astype(np.float32)
+    y = split0_job(x).get().numpy()
+    test_case.assertTrue(np.array_equal(x, y))
+    stats = boxing_util.BoxingPlanCacheStats()
+    test_case.assertGreater(stats["size"], 0)
+    # the same boxings again, all planned before
+    y = split0_job(x).get().numpy()
+    test_case.assertTrue(np.array_equal(x, y))
+    hit_stats = boxing_util.BoxingPlanCacheStats()
+    test_case.assertGreater(hit_stats["hit"], stats["hit"])
+    test_case.assertEqual(hit_stats["miss"], stats["miss"])
+    test_case.assertEqual(hit_stats["size"], stats["size"])
+    # the consumer sbp differs
+    y = split1_job(x).get().numpy()
+    test_case.assertTrue(np.array_equal(x, y))
+    miss_stats = boxing_util.BoxingPlanCacheStats()
+    test_case.assertGreater(miss_stats["miss"], hit_stats["miss"])
+    test_case.assertGreater(miss_stats["size"], hit_stats["size"])
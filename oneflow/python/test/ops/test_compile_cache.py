@@ -0,0 +1,75 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+# op names and scope symbol ids are only reproduced by a new process, so every
+# run compiles in one
+_SCRIPT = """
+import json
+import sys
+import numpy as np
+import oneflow as flow
+import oneflow.typing as oft
+import oneflow.python.framework.session_context as session_ctx
+
+cache_dir, x_path = sys.argv[1:]
+flow.config.compile_cache_dir(cache_dir)
+func_config = flow.FunctionConfig()
+func_config.default_data_type(flow.float)
+
+
+@flow.global_function(function_config=func_config)
+def foo_job(x_def: oft.Numpy.Placeholder(shape=(2, 5))):
+    return flow.math.relu(x_def)
+
+
+y = foo_job(np.load(x_path)).get().numpy()
+compile_cache = session_ctx.GetDefaultSession().compile_cache
+print(
+    json.dumps(
+        dict(y=y.tolist(), hit_cnt=compile_cache.hit_cnt, miss_cnt=compile_cache.miss_cnt)
+    )
+)
+"""
+
+
+def _RunWithCompileCache(cache_dir, x_path):
+    out = subprocess.check_output(
+        [sys.executable, "-c", _SCRIPT, cache_dir, x_path], cwd=os.path.dirname(x_path),
+    )
+    ret = json.loads(out.decode().strip().splitlines()[-1])
+    return np.array(ret["y"], dtype=np.float32), ret["hit_cnt"], ret["miss_cnt"]
+
+
+def test_compile_cache(test_case):
+    cache_dir = tempfile.mkdtemp()
+    x = np.random.uniform(-1, 1, size=(2, 5)).astype(np.float32)
+    x_path = os.path.join(tempfile.mkdtemp(), "x.npy")
+    np.save(x_path, x)
+    y, hit_cnt, miss_cnt = _RunWithCompileCache(cache_dir, x_path)
+    test_case.assertTrue(np.allclose(y, np.maximum(x, 0)))
+    test_case.assertEqual((hit_cnt, miss_cnt), (0, 1))
+    entries = [f for f in os.listdir(cache_dir) if f.endswith(".json")]
+    test_case.assertEqual(len(entries), 1)
+    y, hit_cnt, miss_cnt = _RunWithCompileCache(cache_dir, x_path)
+    test_case.assertTrue(np.allclose(y, np.maximum(x, 0)))
+    test_case.assertEqual((hit_cnt, miss_cnt), (1, 0))
@@ -0,0 +1,54 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import oneflow as flow
+import oneflow.python.framework.c_api_util as c_api_util
+import oneflow.python.vm.id_util as vm_id_util
+
+
+def test_eager_id_range(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    logical_id_generator = vm_id_util.LogicalIdGenerator()
+    physical_id_generator = vm_id_util.PhysicalIdGenerator()
+    new_id_funcs = [
+        logical_id_generator.NewObjectId,
+        logical_id_generator.NewSymbolId,
+        physical_id_generator.NewObjectId,
+        physical_id_generator.NewSymbolId,
+        # ids not taken from ranges come from the same counter
+        c_api_util.NewLogicalObjectId,
+        c_api_util.NewLogicalSymbolId,
+        c_api_util.NewPhysicalObjectId,
+        c_api_util.NewPhysicalSymbolId,
+    ]
+    new_ids = []
+
+    @flow.global_function()
+    def new_id_job():
+        # across more than two ranges of every kind
+        for _ in range(2 * vm_id_util._id_range_size + 1):
+            for new_id in new_id_funcs:
+                new_ids.append(new_id())
+
+    new_id_job()
+    test_case.assertEqual(len(set(new_ids)), len(new_ids))
+    stride = c_api_util.IdRangeStride()
+    logical_object_ids = new_ids[:: len(new_id_funcs)]
+    diffs = [y - x for x, y in zip(logical_object_ids, logical_object_ids[1:])]
+    test_case.assertTrue(all(diff > 0 for diff in diffs))
+    # only the first ids of the at most 3 newly reserved ranges are off stride
+    test_case.assertLessEqual(len([d for d in diffs if d != stride]), 3)
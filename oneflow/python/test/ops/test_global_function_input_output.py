@@ -14,11 +14,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import oneflow as flow
+import asyncio
 import numpy as np
 import os
 import random
 
 import oneflow.typing as oft
+import oneflow.python.eager.symbol_storage as symbol_storage
+import oneflow.python.eager.vm_util as vm_util
+import oneflow.python.framework.session_context as session_ctx
+import oneflow.python.lib.core.async_util as async_util
 
 
 def test_lazy_input_output(test_case):
@@ -49,6 +54,97 @@ def test_lazy_input_output(test_case):
     test_case.assertTrue(np.array_equal(output, ret.numpy()))
 
 
+def test_lazy_borrowed_input(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+    func_config.borrow_input_buffers(True)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))):
+        return flow.identity(input_def)
+
+    @flow.global_function(function_config=func_config)
+    def bar_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))):
+        flow.identity(input_def)
+
+    input = np.arange(10).reshape(2, 5).astype(np.single)
+    test_case.assertTrue(bar_job(input).wait(timeout=60))
+    other_input = np.ones((2, 5), dtype=np.single)
+    future = foo_job(input)
+    other_future = foo_job(other_input)
+    push_lease = future.push_lease
+    test_case.assertIsNot(push_lease, other_future.push_lease)
+    test_case.assertTrue(push_lease.borrowed)
+    test_case.assertTrue(push_lease.wait(timeout=60))
+    test_case.assertTrue(push_lease.done())
+    test_case.assertTrue(np.array_equal(input, future.get().numpy()))
+    test_case.assertTrue(np.array_equal(other_input, other_future.get().numpy()))
+
+
+def test_lazy_output_to_out(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))) -> oft.Numpy:
+        return flow.identity(input_def)
+
+    out = np.zeros((2, 5), dtype=np.single)
+    for i in range(3):
+        input = np.arange(10).reshape(2, 5).astype(np.single) + i
+        ret = foo_job(input, out=out)
+        test_case.assertTrue(ret is out)
+        test_case.assertTrue(np.array_equal(input, out))
+    with test_case.assertRaises(AssertionError):
+        foo_job(input, out=np.zeros((5, 2), dtype=np.single))
+    with test_case.assertRaises(AssertionError):
+        foo_job(input, out=np.zeros((2, 5), dtype=np.double))
+
+
+def test_lazy_mirrored_concatenated_output(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+    flow.config.cpu_device_num(2)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+    func_config.default_placement_scope(flow.scope.placement("cpu", "0:0-1"))
+
+    @flow.global_function(function_config=func_config)
+    def static_job(x_def: oft.Numpy.Placeholder(shape=(4, 5))):
+        y = flow.math.relu(flow.cast_to_current_logical_view(x_def))
+        test_case.assertFalse(y.is_dynamic)
+        test_case.assertEqual(y.batch_axis, 0)
+        return y
+
+    @flow.global_function(function_config=func_config)
+    def dynamic_job(x_def: oft.ListNumpy.Placeholder(shape=(2, 5))):
+        return flow.math.relu(x_def)
+
+    x = np.random.rand(4, 5).astype(np.single) - 0.5
+    ret = static_job(x).get()
+    test_case.assertEqual(len(ret.numpy_list()), 2)
+    test_case.assertTrue(np.array_equal(ret.numpy(), np.concatenate(ret.numpy_list())))
+    test_case.assertTrue(np.array_equal(ret.numpy(), np.maximum(x, 0)))
+    # pulled into one buffer, the devices' ndarrays are views of its rows
+    test_case.assertTrue(np.shares_memory(ret.numpy(), ret.numpy_list()[0]))
+    test_case.assertTrue(np.shares_memory(ret.numpy(), ret.numpy_list()[1]))
+
+    xs = [x[:1], x[1:3]]
+    ret = dynamic_job(xs).get()
+    ndarray_list = ret.numpy_list()
+    test_case.assertEqual(len(ndarray_list), 2)
+    for y, x in zip(ndarray_list, xs):
+        test_case.assertTrue(np.array_equal(y, np.maximum(x, 0)))
+    test_case.assertFalse(np.shares_memory(ndarray_list[0], ndarray_list[1]))
+
+
 def test_eager_output(test_case):
 
     flow.clear_default_session()
@@ -177,6 +273,361 @@ def test_eager_input_output(test_case):
     test_case.assertTrue(np.allclose(output, ret.numpy_list()[0]))
 
 
+def test_eager_trace(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+    func_config.eager_trace(True)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        y = flow.math.relu(x_def) + flow.math.square(x_def)
+        return flow.math.reduce_sum(y, axis=1)
+
+    def Expected(x):
+        return np.sum(np.maximum(x, 0) + np.square(x), axis=1)
+
+    trace_cache = session_ctx.GetDefaultSession().EagerTraceCache4JobName("foo_job")
+    for i in range(4):
+        input = np.random.rand(5, 4).astype(np.single) - 0.5
+        ret = foo_job([input]).get()
+        test_case.assertTrue(np.allclose(Expected(input), ret.numpy_list()[0]))
+        test_case.assertEqual(trace_cache.replay_cnt, i)
+    test_case.assertEqual(len(trace_cache.signature2trace_), 1)
+    input = np.random.rand(3, 4).astype(np.single) - 0.5
+    ret = foo_job([input]).get()
+    test_case.assertTrue(np.allclose(Expected(input), ret.numpy_list()[0]))
+    test_case.assertEqual(len(trace_cache.signature2trace_), 2)
+    test_case.assertEqual(trace_cache.replay_cnt, 3)
+
+
+def test_eager_trace_symbol_eviction(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+    flow.config.eager_symbol_capacity(2)
+    try:
+        func_config = flow.FunctionConfig()
+        func_config.default_logical_view(flow.scope.mirrored_view())
+        func_config.eager_trace(True)
+
+        @flow.global_function(function_config=func_config)
+        def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+            y = x_def
+            for _ in range(4):
+                y = flow.math.relu(y) + flow.math.square(y)
+            return y
+
+        def Expected(x):
+            for _ in range(4):
+                x = np.maximum(x, 0) + np.square(x)
+            return x
+
+        trace_cache = session_ctx.GetDefaultSession().EagerTraceCache4JobName("foo_job")
+        for _ in range(4):
+            input = np.random.rand(5, 4).astype(np.single) - 0.5
+            ret = foo_job([input]).get()
+            test_case.assertTrue(np.allclose(Expected(input), ret.numpy_list()[0]))
+        test_case.assertEqual(trace_cache.replay_cnt, 3)
+    finally:
+        flow.config.eager_symbol_capacity(8192)
+
+
+def test_eager_symbol_eviction(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+    flow.config.eager_symbol_capacity(16)
+    try:
+        func_config = flow.FunctionConfig()
+        func_config.default_logical_view(flow.scope.mirrored_view())
+
+        @flow.global_function(function_config=func_config)
+        def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+            # every call makes an op conf not made before, with a new attribute value
+            shift_blob = flow.constant(float(shift), shape=(1,), dtype=flow.float)
+            return flow.math.square(flow.math.relu(x_def + shift_blob))
+
+        evicted_cnts = []
+        for i in range(16):
+            shift = i
+            input = np.random.rand(5, 4).astype(np.single) - 0.5
+            ret = foo_job([input]).get()
+            expected = np.square(np.maximum(input + i, 0))
+            test_case.assertTrue(np.allclose(expected, ret.numpy_list()[0]))
+            stats = symbol_storage.GetSymbolStorageStats()
+            test_case.assertLessEqual(stats["op_conf"]["symbol_cnt"], 16)
+            evicted_cnts.append(stats["op_conf"]["evicted_cnt"])
+        # the capacity is reached in the first calls and symbols are evicted since
+        test_case.assertGreater(evicted_cnts[-1], evicted_cnts[len(evicted_cnts) // 2])
+    finally:
+        flow.config.eager_symbol_capacity(8192)
+
+
+def test_eager_op_conf_symbol_reuse(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        return flow.math.relu(x_def)
+
+    symbol_cnts = []
+    for _ in range(4):
+        input = np.random.rand(5, 4).astype(np.single) - 0.5
+        ret = foo_job([input]).get()
+        test_case.assertTrue(np.allclose(np.maximum(input, 0), ret.numpy_list()[0]))
+        stats = symbol_storage.GetSymbolStorageStats()
+        symbol_cnts.append(stats["op_conf"]["symbol_cnt"])
+    test_case.assertEqual(symbol_cnts[1], symbol_cnts[-1])
+
+
+def test_eager_async_output(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        relu = flow.math.relu(x_def)
+        future = relu.async_numpy(0)
+        test_case.assertTrue(np.allclose(future.result(), np.maximum(x_np, 0)))
+        return {"relu": relu, "square": flow.math.square(x_def)}
+
+    async def Main():
+        nonlocal x_np
+        for _ in range(3):
+            x_np = np.random.rand(5, 4).astype(np.single) - 0.5
+            ret = await foo_job([x_np])
+            relu = ret["relu"].numpy_list()[0]
+            test_case.assertTrue(np.allclose(np.maximum(x_np, 0), relu))
+            square = ret["square"].numpy_list()[0]
+            test_case.assertTrue(np.allclose(np.square(x_np), square))
+        with test_case.assertRaises(ValueError):
+            await async_util.AsyncAwait(1, lambda Yield: Yield(exception=ValueError()))
+
+    x_np = None
+    asyncio.get_event_loop().run_until_complete(Main())
+
+
+def test_eager_callback_output(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(
+        x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)
+    ) -> oft.Callback[oft.ListNumpy]:
+        return flow.math.relu(x_def)
+
+    x_np = np.random.rand(5, 4).astype(np.single) - 0.5
+    results = []
+    foo_job([x_np])(lambda x: results.append(x[0]))
+    # eager callbacks run in the caller before the call returns
+    test_case.assertEqual(len(results), 1)
+    test_case.assertTrue(np.allclose(np.maximum(x_np, 0), results[0]))
+
+    def FailingCallback(x):
+        raise ValueError()
+
+    with test_case.assertRaises(ValueError):
+        foo_job([x_np])(FailingCallback)
+
+
+def test_eager_object_release(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    flush_threshold = vm_util._logical_release_queue.flush_threshold
+    blob_cnt = flush_threshold + 8
+
+    def RunEmpty():
+        vm_util.LogicalRun(lambda builder: None)
+        vm_util.PhysicalRun(lambda builder: None)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        RunEmpty()
+        ys = [flow.math.relu(x_def) for _ in range(blob_cnt)]
+        del ys
+        # flushed by the release which fills the queue
+        pending_cnt = vm_util.PendingObjectReleaseCount()
+        test_case.assertGreater(pending_cnt, 0)
+        test_case.assertLess(pending_cnt, flush_threshold)
+        RunEmpty()
+        test_case.assertEqual(vm_util.PendingObjectReleaseCount(), 0)
+
+        ys = [flow.math.relu(x_def) for _ in range(blob_cnt)]
+
+        def Build(builder):
+            del ys[:]
+            # not flushed while the instructions of a run are built
+            pending_cnt = vm_util.PendingObjectReleaseCount()
+            test_case.assertGreaterEqual(pending_cnt, blob_cnt)
+
+        vm_util.LogicalRun(Build)
+        RunEmpty()
+        test_case.assertEqual(vm_util.PendingObjectReleaseCount(), 0)
+        ys = [flow.math.relu(x_def) for _ in range(8)]
+        del ys
+
+    foo_job([np.random.rand(5, 4).astype(np.single)])
+    flow.sync_default_session()
+    test_case.assertEqual(vm_util.PendingObjectReleaseCount(), 0)
+
+
+def test_eager_bulk(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+    func_config.eager_bulk(True)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        y = x_def
+        test_case.assertEqual(vm_util.BulkStats()["flush_threshold"], 1024)
+        for _ in range(8):
+            y = flow.math.negative(y)
+        test_case.assertTrue(np.allclose(y.numpy(0), x_np))
+        flush_cnt = vm_util.BulkStats()["flush_cnt"]
+        with flow.eager_bulk(flush_threshold=4):
+            test_case.assertEqual(vm_util.BulkStats()["flush_threshold"], 4)
+            for _ in range(8):
+                y = flow.math.relu(y)
+                stats = vm_util.BulkStats()
+                test_case.assertLess(stats["pending_instruction_cnt"], 4)
+            test_case.assertGreater(stats["flush_cnt"], flush_cnt)
+        test_case.assertEqual(vm_util.BulkStats()["flush_threshold"], 1024)
+        return y
+
+    x_np = np.random.rand(5, 4).astype(np.single) - 0.5
+    ret = foo_job([x_np]).get()
+    test_case.assertTrue(np.allclose(np.maximum(x_np, 0), ret.numpy_list()[0]))
+    test_case.assertIsNone(vm_util.BulkStats())
+
+
+def test_lazy_sharded_input(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(2, 5))):
+        return flow.identity(x_def)
+
+    input = np.arange(10).reshape(2, 5).astype(np.single)
+    ret = foo_job(flow.data.Shards(lambda rank: input + rank)).get()
+    test_case.assertTrue(np.array_equal(input, ret.numpy_list()[0]))
+    ret = foo_job(flow.data.Shards(iter([input]))).get()
+    test_case.assertTrue(np.array_equal(input, ret.numpy_list()[0]))
+
+    def FailingProducer(rank):
+        raise ValueError("rank %s" % rank)
+
+    with test_case.assertRaises(ValueError):
+        foo_job(flow.data.Shards(FailingProducer)).get()
+    with test_case.assertRaises(ValueError):
+        foo_job(flow.data.Shards(iter([]))).get()
+    with test_case.assertRaises(AssertionError):
+        foo_job(flow.data.Shards(lambda rank: input.reshape(10))).get()
+    with test_case.assertRaises(AssertionError):
+        foo_job(flow.data.Shards(lambda rank: input.astype(np.double))).get()
+    ret = foo_job(flow.data.Shards(lambda rank: input)).get()
+    test_case.assertTrue(np.array_equal(input, ret.numpy_list()[0]))
+
+
+def test_lazy_sharded_input_without_output(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(2, 5))):
+        flow.identity(x_def)
+
+    def FailingProducer(rank):
+        raise ValueError("rank %s" % rank)
+
+    input = np.ones((2, 5), dtype=np.single)
+    test_case.assertIsNone(foo_job(flow.data.Shards(FailingProducer)))
+    with test_case.assertRaises(ValueError):
+        flow.sync_default_session()
+    # raised once
+    flow.sync_default_session()
+    foo_job(flow.data.Shards(FailingProducer))
+    with test_case.assertRaises(ValueError):
+        # by a later call once the push job has run, or else by sync
+        for _ in range(8):
+            foo_job(flow.data.Shards(lambda rank: input))
+        flow.sync_default_session()
+    foo_job(flow.data.Shards(lambda rank: input))
+    flow.sync_default_session()
+
+
+def test_eager_sharded_input(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+
+    input = np.random.rand(5, 4).astype(np.single)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.Numpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        y = x_def * flow.constant(2.0, shape=(1,), dtype=flow.float)
+        test_case.assertTrue(np.allclose(y.numpy(0), input * 2.0))
+
+    foo_job(flow.data.Shards(lambda rank: input))
+
+
+def test_eager_trace_sharded_input(test_case):
+
+    flow.clear_default_session()
+    flow.enable_eager_execution()
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.mirrored_view())
+    func_config.eager_trace(True)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(x_def: oft.ListNumpy.Placeholder(shape=(5, 4), dtype=flow.float)):
+        return flow.math.relu(x_def)
+
+    for _ in range(2):
+        input = np.random.rand(5, 4).astype(np.single) - 0.5
+        ret = foo_job(flow.data.Shards(lambda rank: input)).get()
+        test_case.assertTrue(np.allclose(np.maximum(input, 0), ret.numpy_list()[0]))
+    trace_cache = session_ctx.GetDefaultSession().EagerTraceCache4JobName("foo_job")
+    test_case.assertEqual(len(trace_cache.signature2trace_), 0)
+
+
 def _test_input_ndarray_contiguous(test_case, shape):
     assert len(shape) > 1
     more_than_one_dim_list = []
@@ -249,3 +700,117 @@ def test_input_ndarray_contiguous(test_case):
 #     foo_job()
 #     # ret = foo_job(input).get()
 #     # test_case.assertTrue(np.allclose(input, ret.numpy()))
+
+
+def test_lazy_max_inflight(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+    func_config.max_inflight(2)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))):
+        return flow.identity(input_def)
+
+    inputs = [np.random.rand(2, 5).astype(np.single) for _ in range(8)]
+    futures = [foo_job(x) for x in inputs]
+    for x, future in zip(inputs, futures):
+        test_case.assertTrue(np.array_equal(x, future.get().numpy()))
+    flow.sync_default_session()
+    stats = flow.inflight_stats(foo_job)
+    test_case.assertEqual(stats["launched_cnt"], 8)
+    test_case.assertEqual(stats["finished_cnt"], 8)
+    test_case.assertEqual(stats["inflight_cnt"], 0)
+    test_case.assertLessEqual(stats["peak_inflight_cnt"], 2)
+
+
+def test_lazy_max_inflight_failed_call(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+    func_config.max_inflight(1)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))):
+        return flow.identity(input_def)
+
+    bad_input = np.random.rand(3, 5).astype(np.single)
+    for _ in range(2):
+        with test_case.assertRaises(Exception):
+            foo_job(bad_input)
+    test_case.assertEqual(flow.inflight_stats(foo_job)["inflight_cnt"], 0)
+    input = np.random.rand(2, 5).astype(np.single)
+    test_case.assertTrue(np.array_equal(input, foo_job(input).get().numpy()))
+
+
+def test_lazy_fetch(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+    func_config.fetch_every_n(2)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))):
+        return {"x": flow.identity(input_def), "y": flow.math.relu(input_def)}
+
+    input = np.random.rand(2, 5).astype(np.single)
+    for i in range(4):
+        ret = foo_job(input).get()
+        if i % 2 == 0:
+            test_case.assertTrue(np.array_equal(input, ret["x"].numpy()))
+            test_case.assertTrue(np.array_equal(input, ret["y"].numpy()))
+        else:
+            test_case.assertIsNone(ret["x"])
+            test_case.assertIsNone(ret["y"])
+    ret = foo_job(input, fetch=["y"]).get()
+    test_case.assertIsNone(ret["x"])
+    test_case.assertTrue(np.array_equal(input, ret["y"].numpy()))
+    ret = foo_job(input, fetch="x").get()
+    test_case.assertTrue(np.array_equal(input, ret["x"].numpy()))
+    test_case.assertIsNone(ret["y"])
+
+
+def test_lazy_run_n(test_case):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+    func_config.max_inflight(2)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(input_def: oft.Numpy.Placeholder(shape=(2, 5))) -> oft.Numpy:
+        return flow.math.relu(input_def)
+
+    inputs = [np.random.randn(2, 5).astype(np.single) for _ in range(4)]
+    expected = np.stack([np.maximum(x, 0) for x in inputs])
+    ret = foo_job.run_n(4, iter(inputs), reduce="stack")
+    test_case.assertTrue(np.allclose(ret, expected))
+    ret = foo_job.run_n(4, iter(inputs), reduce="mean")
+    test_case.assertTrue(np.allclose(ret, np.mean(expected, axis=0)))
+    ret = foo_job.run_n(4, iter(inputs))
+    test_case.assertTrue(np.allclose(ret, expected[-1]))
+    launched_cnt = flow.inflight_stats(foo_job)["launched_cnt"]
+    with test_case.assertRaises(AssertionError):
+        foo_job.run_n(4, iter(inputs[:2]))
+    test_case.assertEqual(
+        flow.inflight_stats(foo_job)["launched_cnt"], launched_cnt + 2
+    )
+
+    pulled_launched_cnts = []
+
+    def Inputs():
+        for x in inputs:
+            pulled_launched_cnts.append(flow.inflight_stats(foo_job)["launched_cnt"])
+            yield x
+
+    launched_cnt = flow.inflight_stats(foo_job)["launched_cnt"]
+    ret = foo_job.run_n(4, Inputs(), reduce="stack")
+    test_case.assertTrue(np.allclose(ret, expected))
+    test_case.assertEqual(pulled_launched_cnts, [launched_cnt + i for i in range(4)])
@@ -0,0 +1,47 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import subprocess
+import sys
+
+_SCRIPT = """
+import json
+import sys
+import oneflow
+loaded_after_import = sorted(sys.modules.keys())
+relu = oneflow.math.relu
+print(json.dumps(dict(
+    loaded_after_import=loaded_after_import,
+    loaded_after_access=sorted(sys.modules.keys()),
+    relu_module=relu.__module__,
+)))
+"""
+
+
+def test_lazy_api(test_case):
+    out = subprocess.check_output([sys.executable, "-c", _SCRIPT])
+    result = json.loads(out.decode().strip().splitlines()[-1])
+    loaded_after_import = set(result["loaded_after_import"])
+    for module in [
+        "onnx",
+        "requests",
+        "tqdm",
+        "oneflow.python.onnx",
+        "oneflow.python.experimental",
+        result["relu_module"],
+    ]:
+        test_case.assertNotIn(module, loaded_after_import)
+    test_case.assertIn(result["relu_module"], result["loaded_after_access"])
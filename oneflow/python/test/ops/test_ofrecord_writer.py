@@ -0,0 +1,68 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import struct
+import tempfile
+
+import numpy as np
+import oneflow as flow
+import oneflow.python.framework.ofrecord_writer as ofrecord_writer
+
+
+def test_ofrecord_writer(test_case):
+    flow.clear_default_session()
+    record_num = 8
+    num_parts = 2
+    images = np.random.uniform(size=(record_num, 2, 3)).astype(np.float32)
+    labels = np.arange(record_num, dtype=np.int32) * 1000 - 3000
+    data_dir = tempfile.mkdtemp()
+    writer = flow.data.OFRecordWriter(data_dir, num_parts=num_parts, write_index=True)
+    test_case.assertEqual(
+        writer.write({"images": images, "labels": labels, "names": ["x"] * 8}),
+        record_num,
+    )
+    for part_path in writer.part_paths:
+        offsets = ofrecord_writer.ReadOFRecordOffsets(part_path)
+        test_case.assertEqual(len(offsets), record_num // num_parts)
+        with open(part_path, "rb") as f:
+            data = f.read()
+        (size,) = struct.unpack("<q", data[offsets[-1] : offsets[-1] + 8])
+        test_case.assertEqual(offsets[-1] + 8 + size, len(data))
+
+    func_config = flow.FunctionConfig()
+    func_config.default_data_type(flow.float)
+
+    @flow.global_function(function_config=func_config)
+    def read_job():
+        with flow.scope.placement("cpu", "0:0"):
+            ofrecord = flow.data.ofrecord_reader(
+                data_dir,
+                batch_size=record_num,
+                data_part_num=num_parts,
+                part_name_suffix_length=5,
+            )
+            x = flow.data.ofrecord_raw_decoder(
+                ofrecord, "images", shape=(2, 3), dtype=flow.float
+            )
+            y = flow.data.ofrecord_raw_decoder(
+                ofrecord, "labels", shape=(), dtype=flow.int32
+            )
+        return x, y
+
+    x, y = read_job().get()
+    order = np.argsort(y.numpy())
+    test_case.assertTrue(np.array_equal(y.numpy()[order], labels))
+    test_case.assertTrue(np.allclose(x.numpy()[order], images))
@@ -0,0 +1,66 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import numpy as np
+import oneflow as flow
+import oneflow.typing as oft
+
+
+def _test_python_loader(test_case, use_processes):
+    flow.clear_default_session()
+    func_config = flow.FunctionConfig()
+    func_config.default_data_type(flow.float)
+
+    @flow.global_function(function_config=func_config)
+    def foo_job(
+        x_def: oft.Numpy.Placeholder(shape=(4, 3)),
+        y_def: oft.Numpy.Placeholder(shape=(4,), dtype=flow.int32),
+    ):
+        return flow.identity(x_def), flow.identity(y_def)
+
+    dataset = [(np.full((3,), i, np.single), np.int32(i)) for i in range(10)]
+    loader = flow.data.PythonLoader(
+        foo_job, dataset, transform=_Double, num_workers=2, use_processes=use_processes,
+    )
+    results = []
+    test_case.assertEqual(loader.run(callback=results.append), 2)
+    for i, ret in enumerate(results):
+        x, y = ret.get()
+        expected_y = np.arange(i * 4, i * 4 + 4, dtype=np.int32)
+        test_case.assertTrue(np.array_equal(y.numpy(), expected_y))
+        test_case.assertTrue(
+            np.allclose(x.numpy(), np.repeat(expected_y[:, None] * 2.0, 3, axis=1))
+        )
+    stats = loader.stats()
+    test_case.assertEqual(stats["batch_cnt"], 2)
+    test_case.assertEqual(stats["sample_cnt"], 8)
+    test_case.assertEqual(loader.run(max_steps=1), 1)
+    test_case.assertEqual(loader.stats()["batch_cnt"], 3)
+    test_case.assertEqual(loader.run(max_steps=0), 0)
+    test_case.assertEqual(loader.stats()["batch_cnt"], 3)
+    loader.close()
+
+
+def _Double(sample):
+    x, y = sample
+    return x * 2, y
+
+
+def test_python_loader(test_case):
+    _test_python_loader(test_case, use_processes=False)
+
+
+def test_python_loader_in_processes(test_case):
+    _test_python_loader(test_case, use_processes=True)
@@ -0,0 +1,69 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import os
+import tempfile
+
+import numpy as np
+import oneflow as flow
+import oneflow.typing as oft
+
+
+def _MakeVariableJob(initializer):
+    flow.clear_default_session()
+    flow.enable_eager_execution(False)
+
+    func_config = flow.FunctionConfig()
+    func_config.default_logical_view(flow.scope.consistent_view())
+
+    @flow.global_function(function_config=func_config)
+    def var_job() -> oft.Numpy:
+        return flow.get_variable(
+            name="var", shape=(4, 5), dtype=flow.float, initializer=initializer,
+        )
+
+    return var_job
+
+
+def test_sharded_checkpoint_save_and_load(test_case):
+    var_job = _MakeVariableJob(flow.random_uniform_initializer())
+    checkpoint = flow.train.CheckPoint()
+    checkpoint.init()
+    saved = var_job()
+    path = os.path.join(tempfile.mkdtemp(), "snapshot")
+    checkpoint.save(path, sharded=True, num_shards=2)
+    test_case.assertTrue(os.path.isfile(os.path.join(path, "index.json")))
+    test_case.assertTrue(os.path.isfile(os.path.join(path, "snapshot_done")))
+
+    var_job = _MakeVariableJob(flow.zeros_initializer())
+    checkpoint = flow.train.CheckPoint()
+    checkpoint.load(path)
+    test_case.assertTrue(np.array_equal(saved, var_job()))
+
+
+def test_sharded_checkpoint_checksum(test_case):
+    var_job = _MakeVariableJob(flow.random_uniform_initializer())
+    checkpoint = flow.train.CheckPoint()
+    checkpoint.init()
+    var_job()
+    path = os.path.join(tempfile.mkdtemp(), "snapshot")
+    checkpoint.save(path, sharded=True, num_shards=1)
+    with open(os.path.join(path, "shard-00000-of-00001"), "r+b") as f:
+        f.write(b"\xff\xff\xff\xff")
+
+    var_job = _MakeVariableJob(flow.zeros_initializer())
+    checkpoint = flow.train.CheckPoint()
+    with test_case.assertRaises(ValueError):
+        checkpoint.load(path)
@@ -0,0 +1,74 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import oneflow as flow
+import oneflow.core.operator.op_conf_pb2 as op_conf_util
+import oneflow.python.framework.c_api_util as c_api_util
+import oneflow.python.framework.user_op_def_util as user_op_def_util
+from oneflow.python.framework.job_build_and_infer_error import JobBuildAndInferError
+
+
+def _MakeBernoulliOpConf(name, seed=None):
+    op_conf = op_conf_util.OperatorConf()
+    op_conf.name = name
+    op_conf.user_conf.op_type_name = "bernoulli"
+    op_conf.user_conf.input["in"].s.append("x/out_0")
+    op_conf.user_conf.attr["dtype"].at_data_type = flow.float.oneflow_proto_dtype
+    if seed is not None:
+        op_conf.user_conf.attr["seed"].at_int64 = seed
+        op_conf.user_conf.attr["has_seed"].at_bool = True
+    return op_conf
+
+
+def test_checked_user_op_conf_completed(test_case):
+    op_def = user_op_def_util.GetUserOpDef("bernoulli")
+    op_conf = _MakeBernoulliOpConf("bernoulli_0")
+    expected = c_api_util.CheckAndCompleteUserOpConf(op_conf)
+    user_op_def_util.CheckAndCompleteUserOpConf(_MakeBernoulliOpConf("bernoulli_0"))
+    signature = user_op_def_util._UserOpConfSignature(op_conf)
+    test_case.assertIn(signature, op_def.checked_signatures)
+    # completed in python, with default attrs and default output lbns
+    completed = user_op_def_util.CheckAndCompleteUserOpConf(op_conf)
+    test_case.assertEqual(completed, expected)
+    test_case.assertEqual(completed.user_conf.attr["seed"].at_int64, -1)
+    test_case.assertEqual(
+        list(completed.user_conf.output["out"].s), ["bernoulli_0/out_0"]
+    )
+
+
+def test_checked_user_op_conf_unknown_attr(test_case):
+    user_op_def_util.CheckAndCompleteUserOpConf(_MakeBernoulliOpConf("bernoulli_1"))
+    op_conf = _MakeBernoulliOpConf("bernoulli_1")
+    op_conf.user_conf.attr["unknown"].at_int32 = 1
+    for _ in range(2):
+        with test_case.assertRaises(JobBuildAndInferError):
+            user_op_def_util.CheckAndCompleteUserOpConf(op_conf)
+
+
+def test_checked_user_op_conf_invalid_attr(test_case):
+    op_conf = _MakeBernoulliOpConf("bernoulli_2")
+    op_conf.user_conf.attr["seed"].at_string = "1"
+    for _ in range(2):
+        with test_case.assertRaises(JobBuildAndInferError):
+            user_op_def_util.CheckAndCompleteUserOpConf(op_conf)
+
+
+def test_checked_user_op_conf_capacity(test_case):
+    op_def = user_op_def_util.GetUserOpDef("bernoulli")
+    capacity = user_op_def_util._checked_signature_capacity
+    for seed in range(capacity + 8):
+        op_conf = _MakeBernoulliOpConf("bernoulli_3", seed=seed)
+        user_op_def_util.CheckAndCompleteUserOpConf(op_conf)
+    test_case.assertEqual(len(op_def.checked_signatures), capacity)
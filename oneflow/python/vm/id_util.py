@@ -15,6 +15,8 @@ limitations under the License.
 """
 from __future__ import absolute_import
 
+import threading
+
 import oneflow.python.framework.c_api_util as c_api_util
 
 
@@ -28,15 +30,50 @@ class IdGenerator(object):
 
 class PhysicalIdGenerator(IdGenerator):
     def NewSymbolId(self):
-        return c_api_util.NewPhysicalSymbolId()
+        return _physical_symbol_id_range.NewId()
 
     def NewObjectId(self):
-        return c_api_util.NewPhysicalObjectId()
+        return _physical_object_id_range.NewId()
 
 
 class LogicalIdGenerator(IdGenerator):
     def NewSymbolId(self):
-        return c_api_util.NewLogicalSymbolId()
+        return _logical_symbol_id_range.NewId()
 
     def NewObjectId(self):
-        return c_api_util.NewLogicalObjectId()
+        return _logical_object_id_range.NewId()
+
+
+class _IdRange(object):
+    # hands out ids of a range reserved from the C++ side, which keeps ranges
+    # disjoint, so that most ids cost a local increment rather than a C api call
+    def __init__(self, new_id_range):
+        self.new_id_range_ = new_id_range
+        self.lock_ = threading.Lock()
+        self.next_id_ = None
+        self.remainder_cnt_ = 0
+
+    def NewId(self):
+        with self.lock_:
+            if self.remainder_cnt_ == 0:
+                self.next_id_ = self.new_id_range_(_id_range_size)
+                self.remainder_cnt_ = _id_range_size
+            new_id = self.next_id_
+            self.next_id_ += _IdRangeStride()
+            self.remainder_cnt_ -= 1
+            return new_id
+
+
+def _IdRangeStride():
+    global _id_range_stride
+    if _id_range_stride is None:
+        _id_range_stride = c_api_util.IdRangeStride()
+    return _id_range_stride
+
+
+_id_range_size = 128
+_id_range_stride = None
+_logical_object_id_range = _IdRange(c_api_util.NewLogicalObjectIdRange)
+_logical_symbol_id_range = _IdRange(c_api_util.NewLogicalSymbolIdRange)
+_physical_object_id_range = _IdRange(c_api_util.NewPhysicalObjectIdRange)
+_physical_symbol_id_range = _IdRange(c_api_util.NewPhysicalSymbolIdRange)
@@ -0,0 +1,88 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+parser = argparse.ArgumentParser(
+    description="measure `import oneflow` in fresh interpreters"
+)
+parser.add_argument("-n", "--repeat", type=int, default=5, required=False)
+parser.add_argument(
+    "--max_seconds",
+    type=float,
+    default=None,
+    required=False,
+    help="fail if the median import time exceeds it",
+)
+parser.add_argument(
+    "--forbidden_modules",
+    type=str,
+    default="onnx,requests,tqdm,oneflow.python.onnx,oneflow.python.experimental",
+    required=False,
+    help="comma separated modules `import oneflow` must not import",
+)
+parser.add_argument(
+    "--access",
+    type=str,
+    default="",
+    required=False,
+    help="comma separated attributes of oneflow accessed after import, e.g. math.relu",
+)
+args = parser.parse_args()
+
+SCRIPT = """
+import json
+import sys
+import time
+start = time.perf_counter()
+import oneflow
+import_seconds = time.perf_counter() - start
+loaded_modules = sorted(sys.modules.keys())
+for attr_path in {access!r}:
+    obj = oneflow
+    for attr in attr_path.split("."):
+        obj = getattr(obj, attr)
+print(json.dumps(dict(import_seconds=import_seconds, modules=loaded_modules)))
+"""
+
+
+def measure_once(access):
+    script = SCRIPT.format(access=access)
+    out = subprocess.check_output([sys.executable, "-c", script])
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main():
+    access = [x for x in args.access.split(",") if x]
+    results = [measure_once(access) for _ in range(args.repeat)]
+    seconds = [r["import_seconds"] for r in results]
+    modules = results[-1]["modules"]
+    median_seconds = statistics.median(seconds)
+    print(
+        "import oneflow: median {:.3f}s, min {:.3f}s, max {:.3f}s over {} runs".format(
+            median_seconds, min(seconds), max(seconds), len(seconds)
+        )
+    )
+    print(
+        "modules loaded: {}, oneflow modules: {}".format(
+            len(modules), len([m for m in modules if m.startswith("oneflow.")])
+        )
+    )
+    failures = []
+    for forbidden in [x for x in args.forbidden_modules.split(",") if x]:
+        if forbidden in modules:
+            failures.append("{} is imported by `import oneflow`".format(forbidden))
+    if args.max_seconds is not None and median_seconds > args.max_seconds:
+        failures.append(
+            "median import time {:.3f}s exceeds {:.3f}s".format(
+                median_seconds, args.max_seconds
+            )
+        )
+    for failure in failures:
+        print("FAILED:", failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import argparse
 import inspect
 
 import oneflow
+import oneflow.python.__export_symbols__
 
 parser = argparse.ArgumentParser()
 parser.add_argument(
@@ -46,35 +47,62 @@ class VirtualModule(object):
         if is_root:
             filemode = 'a+'
         with open(init_file_path, filemode) as f:
-            mod_set = set()
             lines = []
             if is_root:
                 lines = [""]
-            for k in self._submodule_dict.keys():
-                mod_set.add(include_submodule(k))
-            for k, v in self._func_or_class_dict.items():
-                lines += include_export(k, v)
-            lines = list(mod_set) + lines
+            lines += make_lazy_module(self._submodule_dict.keys(), self._func_or_class_dict)
             f.write("\n".join(lines))
 
     def submodule_names(self):
         return self._submodule_dict.keys()
 
 
-def include_submodule(modname):
-    return "from . import {}".format(modname)
+# Exported symbols are resolved on first attribute access (PEP 562), so that
+# `import oneflow` imports only the modules it needs instead of all of
+# oneflow/python. Python 3.6 has no module __getattr__ and resolves them eagerly.
+LAZY_MODULE_TEMPLATE = """import importlib as _importlib
+import sys as _sys
 
-def include_export(api_name_base, symbol):
-    if symbol.__name__ == api_name_base:
-        return ["from {} import {}".format(symbol.__module__, api_name_base)]    
+_oneflow_api_submodules = {submodules}
+_oneflow_api_name2symbol = {{
+{name2symbol}}}
+
+
+def __getattr__(name):
+    if name in _oneflow_api_submodules:
+        value = _importlib.import_module("." + name, __name__)
+    elif name in _oneflow_api_name2symbol:
+        module_name, symbol_name = _oneflow_api_name2symbol[name]
+        value = getattr(_importlib.import_module(module_name), symbol_name)
     else:
-        if inspect.isclass(symbol):
-            return [
-                "from {} import {}".format(symbol.__module__, symbol.__name__),
-                "{} = {}".format(api_name_base, symbol.__name__)
-            ]
-        else:
-            return ["from {} import {} as {}".format(symbol.__module__, symbol.__name__, api_name_base)]    
+        raise AttributeError("module {{!r}} has no attribute {{!r}}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(globals()) | _oneflow_api_submodules | set(_oneflow_api_name2symbol)
+    return sorted(names)
+
+
+if _sys.version_info < (3, 7):
+    for _name in sorted(_oneflow_api_submodules) + sorted(_oneflow_api_name2symbol):
+        __getattr__(_name)
+"""
+
+
+def make_lazy_module(submodule_names, api_name2symbol):
+    submodules = "{{{}}}".format(", ".join(repr(k) for k in sorted(submodule_names)))
+    if len(submodule_names) == 0:
+        submodules = "set()"
+    name2symbol = "".join(
+        "    {!r}: ({!r}, {!r}),\n".format(k, v.__module__, v.__name__)
+        for k, v in sorted(api_name2symbol.items())
+    )
+    return LAZY_MODULE_TEMPLATE.format(
+        submodules=submodules, name2symbol=name2symbol
+    ).split("\n")
+
 
 def exported_symbols():
     for mod in sys.modules.values():